@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks balancing reactions, in reactions per second.
+
+Compares `chempy.balance_stoichiometry` (which solves the reaction with
+sympy, and was previously used by `Reaction`) against the integer
+nullspace balancer of `chemsolve.utils.balance`, both when only the
+coefficients are computed and when entire `Reaction` objects are created.
+
+Run it from the repository root with `python benchmarks/balance_benchmark.py`.
+"""
+import time
+
+from chemsolve import Compound, Reaction
+from chemsolve.utils.balance import balance_stoichiometry
+
+REACTIONS = [
+   (['CH4', 'O2'], ['CO2', 'H2O']),
+   (['C8H18', 'O2'], ['CO2', 'H2O']),
+   (['HSiCl3', 'H2O'], ['H10Si10O15', 'HCl']),
+   (['KOH', 'H3PO4'], ['K3PO4', 'H2O']),
+   (['CuSCN', 'KIO3', 'HCl'], ['CuSO4', 'KCl', 'HCN', 'ICl', 'H2O']),
+   (['K4Fe(CN)6', 'KMnO4', 'H2SO4'], ['KHSO4', 'Fe2(SO4)3', 'MnSO4', 'HNO3', 'CO2', 'H2O']),
+   (['Ca3(PO4)2', 'SiO2', 'C'], ['CaSiO3', 'P4', 'CO']),
+   (['FeS2', 'O2'], ['Fe2O3', 'SO2']),
+]
+
+def throughput(function, repeats):
+   """Returns the number of reactions per second balanced by a function."""
+   start = time.perf_counter()
+   for _ in range(repeats):
+      for reactants, products in REACTIONS:
+         function(reactants, products)
+   return repeats * len(REACTIONS) / (time.perf_counter() - start)
+
+def create_reaction(reactants, products):
+   """Creates a `Reaction` from the formulas of its reactants and products."""
+   return Reaction(reactants = [Compound(formula) for formula in reactants],
+                   products = [Compound(formula) for formula in products])
+
+if __name__ == '__main__':
+   from chempy import balance_stoichiometry as chempy_balance_stoichiometry
+   # Import sympy and fill the formula caches before timing.
+   chempy_balance_stoichiometry({'H2', 'O2'}, {'H2O'})
+   throughput(balance_stoichiometry, 1)
+
+   for name, function, repeats in [
+      ('chempy.balance_stoichiometry', lambda r, p: chempy_balance_stoichiometry(set(r), set(p)), 5),
+      ('balance_stoichiometry', balance_stoichiometry, 5000),
+      ('Reaction', create_reaction, 500)]:
+      print(f"{name:>28}: {throughput(function, repeats):10.1f} reactions per second")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks enumerating the candidate formulas of a molar mass.
+
+Compares an exhaustive search over every combination of element counts
+(as a single vectorized grid, which is only feasible for small masses)
+against the pruned search of `candidate_formulas`, and then times the
+pruned search with CHNOS formulas for increasingly large molar masses.
+
+Run it from the repository root with `python benchmarks/candidate_benchmark.py`.
+"""
+import time
+
+import numpy as np
+
+from chemsolve.utils.candidates import candidate_formulas
+from chemsolve.utils.composition import _mass_vector
+
+def exhaustive_candidates(mass, tolerance):
+   """Tries every combination of C, H, N, and O counts up to the mass."""
+   masses = _mass_vector()[[5, 0, 6, 7]]
+   limits = (mass + tolerance) // masses + 1
+   counts = np.stack(np.meshgrid(*[np.arange(limit) for limit in limits],
+                                 indexing = 'ij'), axis = -1).reshape(-1, 4)
+   return counts[counts.any(axis = 1) & (np.abs(counts @ masses - mass) <= tolerance)]
+
+if __name__ == '__main__':
+   start = time.perf_counter()
+   exhaustive = exhaustive_candidates(250.3, 0.05)
+   exhaustive_time = time.perf_counter() - start
+   start = time.perf_counter()
+   pruned = candidate_formulas(250.3, tolerance = 0.05, elements = 'CHNO')
+   pruned_time = time.perf_counter() - start
+   print(f"CHNO at 250.3 g/mol, exhaustive grid: {exhaustive_time:8.4f} s ({len(exhaustive)} formulas)")
+   print(f"CHNO at 250.3 g/mol, pruned search:   {pruned_time:8.4f} s ({len(pruned)} formulas)")
+
+   for mass in [300.3, 500.4, 800.7, 1200.3]:
+      start = time.perf_counter()
+      candidates = candidate_formulas(mass, tolerance = 0.005, elements = 'CHNOS',
+                                      rdbe_range = (0, 40))
+      elapsed = time.perf_counter() - start
+      print(f"CHNOS at {mass:6.1f} g/mol, pruned search with RDBE filter: "
+            f"{elapsed:8.4f} s ({len(candidates)} formulas)")
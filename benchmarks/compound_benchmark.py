@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks creating compounds and accessing their attributes.
+
+Compares `Compound` against a reproduction of its previous behaviour,
+which eagerly built the element dictionaries and a chempy `Substance`
+in the constructor and checked every attribute access in a Python-level
+`__getattribute__` hook for the deprecated `print_compound` attribute,
+and which created a new `Element` for every `percent_in_compound` call.
+
+Run it from the repository root with `python benchmarks/compound_benchmark.py`.
+"""
+import timeit
+
+from chempy import Substance
+
+from chemsolve import Element, Compound
+from chemsolve.utils.warnings import ChemsolveDeprecationWarning
+
+class PreviousCompound(Compound):
+   """A compound which behaves as `Compound` previously did."""
+   def __init__(self, compound, **kwargs):
+      super().__init__(compound, **kwargs)
+      self._elements = dict(self._species.elements)
+      self._elements_list = list(self._elements)
+      self._substance = Substance.from_formula(self._species.formula)
+
+   def percent_in_compound(self, element):
+      return round((Element(str(element).title()).mass *
+                    self.compound_elements[element]) / self.mass, 4)
+
+   def __getattribute__(self, item):
+      if item == 'print_compound':
+         ChemsolveDeprecationWarning('The attribute `Compound.print_compound` is deprecated and will '
+                                     'be removed in v2.0.0. Use repr(Compound) instead.',
+                                     future_version = 'bypass')
+      return object.__getattribute__(self, item)
+
+def time_per_call(func, number):
+   """Returns the best time of a single call to `func`, in microseconds."""
+   return min(timeit.repeat(func, number = number, repeat = 5)) / number * 1e6
+
+if __name__ == '__main__':
+   for name, cls in [('previous', PreviousCompound), ('lazy', Compound)]:
+      compound = cls('C6H12O6')
+      compound.compound_elements
+      number = 200 if cls is PreviousCompound else 20000
+      print(f"{name}:")
+      for label, func, count in [
+            ('Construction', lambda: cls('C6H12O6'), number),
+            ('Access `mass`', lambda: compound.mass, 1000000),
+            ('Access `compound_elements`', lambda: compound.compound_elements, 1000000),
+            ('percent_in_compound', lambda: compound.percent_in_compound('O'), 100000)]:
+         print(f"   {label:<28} {time_per_call(func, count):10.3f} us")
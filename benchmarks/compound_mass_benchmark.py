@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks computing the molar masses of a batch of formulas.
+
+Compares creating a `Compound` for each formula of a batch of distinct
+formulas, against computing every mass at once with `molar_masses`. The
+time of `molar_masses` is also split into parsing the formulas into the
+composition matrix and its product with the atomic masses: since every
+formula is distinct, almost all of the time is spent parsing, which both
+approaches share, so the difference between them is the per-formula
+overhead of creating (and caching) each `Compound`.
+
+Run it from the repository root with `python benchmarks/compound_mass_benchmark.py`.
+"""
+import time
+
+import numpy as np
+
+from chemsolve import Compound
+from chemsolve.utils.composition import molar_masses, composition_matrix, _mass_vector
+
+def random_formulas(number, seed = 0):
+   """Generates random organic formulas, e.g. `C12H20N2O3S`."""
+   rng = np.random.default_rng(seed)
+   counts = rng.integers(0, 30, size = (number, 5))
+   return [''.join(f"{symbol}{count}" for symbol, count in zip('CHNOS', row) if count)
+           or 'H2' for row in counts]
+
+if __name__ == '__main__':
+   formulas = random_formulas(100000)
+
+   start = time.perf_counter()
+   looped = np.array([Compound(formula).mass for formula in formulas])
+   loop_time = time.perf_counter() - start
+
+   start = time.perf_counter()
+   batched, _ = molar_masses(formulas)
+   batch_time = time.perf_counter() - start
+
+   start = time.perf_counter()
+   matrix, _ = composition_matrix(formulas)
+   parse_time = time.perf_counter() - start
+   start = time.perf_counter()
+   matrix.dot(_mass_vector())
+   product_time = time.perf_counter() - start
+
+   assert np.allclose(looped, batched)
+   print(f"{len(formulas)} formulas, Compound(f).mass loop: {loop_time:8.3f} s")
+   print(f"{len(formulas)} formulas, molar_masses:         {batch_time:8.3f} s")
+   print(f"{'':>18}parsing the formulas: {parse_time:8.3f} s")
+   print(f"{'':>18}mass vector product:  {product_time:8.3f} s")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks the memory used when holding many `chemsolve.Compound` objects.
+
+The original `Compound` layout, where every instance held a `periodictable`
+formula, a chempy `Substance`, a list of ion strings, and a dictionary of
+its elements in an instance dictionary, is reproduced by `LegacyCompound`
+below and compared against the current layout, where instances only hold
+their formula and quantities in slots and share a single `Species` record.
+
+Two catalogs are measured: one which cycles through 50 formulas (so the
+species are shared between compounds), and one where every formula is
+distinct (so each compound is also charged for the memory of its own
+species).
+
+Run it from the repository root with `python benchmarks/compound_memory_benchmark.py`,
+optionally passing the number of compounds to hold (default 2,000).
+"""
+import sys
+import tracemalloc
+
+from chemsolve import Compound
+from chemsolve.utils.formula import species_cache
+
+class LegacyCompound(object):
+   """The original `Compound` layout, with per-instance parsed objects."""
+   def __init__(self, formula, grams):
+      import periodictable
+      from chempy import Substance
+      self.compound = periodictable.formula(formula)
+      self.mass = self.compound.mass
+      self.compound_elements_list = [f"{element}{count}" for element, count
+                                     in self.compound.atoms.items()]
+      self.compound_elements = {str(element): count for element, count
+                                in self.compound.atoms.items()}
+      self.print_compound = Substance.from_formula(formula)
+      self.store_comp = formula
+      self.gram_amount = grams
+      self.mole_amount = round(grams / self.mass, 4)
+      self.molecules = round(self.mole_amount * 6.02214e23, 4)
+
+def measure(factory, formulas):
+   """Returns the memory held by objects created by `factory`, in bytes."""
+   species_cache.clear()
+   tracemalloc.start()
+   objects = [factory(formula, grams = 1.0 + indx) for indx, formula in enumerate(formulas)]
+   size, _ = tracemalloc.get_traced_memory()
+   tracemalloc.stop()
+   del objects
+   return size
+
+if __name__ == '__main__':
+   count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+   catalogs = {
+      'repeated formulas': [f"C{indx % 50 // 5 + 1}H{indx % 5 * 2 + 2}O"
+                            for indx in range(count)],
+      'distinct formulas': [f"C{indx // 4000 + 1}H{indx // 40 % 100 + 1}N{indx % 40 + 1}O"
+                            for indx in range(count)]}
+   # Parse the formulas once, so that one-time caches aren't measured.
+   LegacyCompound('H2O', grams = 1.0), Compound('H2O')
+   for catalog, formulas in catalogs.items():
+      for name, factory in [('Previous layout', LegacyCompound),
+                            ('Shared species', Compound)]:
+         size = measure(factory, formulas)
+         print(f"{catalog:>17}, {name:>15}: {size / 2 ** 20:8.1f} MiB for {count} "
+               f"compounds ({size / count:.0f} bytes each)")
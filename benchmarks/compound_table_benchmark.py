@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks computing the mass fractions of a library of compounds.
+
+Compares keeping a list of `Compound` objects and calling
+`percent_in_compound` for each of their elements, against building a
+`CompoundTable` which computes every mass fraction in bulk.
+
+Run it from the repository root with `python benchmarks/compound_table_benchmark.py`.
+"""
+import time
+
+import numpy as np
+
+from chemsolve import Compound, CompoundTable
+
+def random_formulas(number, seed = 0):
+   """Generates random organic formulas, e.g. `C12H20N2O3S`."""
+   rng = np.random.default_rng(seed)
+   counts = rng.integers(0, 30, size = (number, 5))
+   return [''.join(f"{symbol}{count}" for symbol, count in zip('CHNOS', row) if count)
+           or 'H2' for row in counts]
+
+if __name__ == '__main__':
+   formulas = random_formulas(10000)
+
+   start = time.perf_counter()
+   compounds = [Compound(formula) for formula in formulas]
+   fractions = [{element: compound.percent_in_compound(element)
+                 for element in compound.compound_elements} for compound in compounds]
+   list_time = time.perf_counter() - start
+
+   start = time.perf_counter()
+   table = CompoundTable(formulas)
+   table_time = time.perf_counter() - start
+
+   print(f"{len(formulas)} compounds, list and percent_in_compound: {list_time:8.3f} s")
+   print(f"{len(formulas)} compounds, CompoundTable:                {table_time:8.3f} s")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks deduplicating formulas which are written in different ways.
+
+Compares deduplicating formula strings by sorting the element counts of a
+`Compound` created for each formula (as was needed before compounds could
+be compared) against a set of the canonical keys from `canonical_keys`,
+and times a set of `Compound` objects, which are hashed by the same keys.
+
+Run it from the repository root with `python benchmarks/dedup_benchmark.py`.
+"""
+import time
+
+import numpy as np
+
+from chemsolve import Compound
+from chemsolve.utils.formula import canonical_keys
+
+if __name__ == '__main__':
+   rng = np.random.default_rng(0)
+   counts = rng.integers(1, 20, size = (5000, 3))
+   templates = ["C{0}H{1}O{2}", "H{1}C{0}O{2}", "O{2}C{0}H{1}"]
+   formulas = [templates[indx].format(*row) for indx, row
+               in zip(rng.integers(0, 3, size = 200000).tolist(),
+                      counts[rng.integers(0, len(counts), size = 200000)].tolist())]
+
+   start = time.perf_counter()
+   previous = {tuple(sorted(Compound(formula).compound_elements.items())) for formula in formulas}
+   previous_time = time.perf_counter() - start
+
+   start = time.perf_counter()
+   keys, errors = canonical_keys(formulas)
+   unique = set(keys)
+   keys_time = time.perf_counter() - start
+
+   compounds = [Compound(formula) for formula in formulas[:100000]]
+   start = time.perf_counter()
+   unique_compounds = set(compounds)
+   compounds_time = time.perf_counter() - start
+
+   print(f"{len(formulas)} formulas, sorted Compound elements: {previous_time:8.4f} s ({len(previous)} unique)")
+   print(f"{len(formulas)} formulas, set of canonical_keys:    {keys_time:8.4f} s ({len(unique)} unique)")
+   print(f"{len(compounds)} compounds, set of Compound objects: {compounds_time:8.4f} s "
+         f"({len(unique_compounds)} unique)")
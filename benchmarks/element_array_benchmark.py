@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks calculating quantities for a large batch of elements.
+
+Compares constructing one `Element` per measurement against a single
+`ElementArray` holding every measurement.
+
+Run it from the repository root with `python benchmarks/element_array_benchmark.py`.
+"""
+import timeit
+
+import numpy as np
+
+from chemsolve import Element, ElementArray
+
+COUNT = 200000
+
+if __name__ == '__main__':
+   rng = np.random.default_rng(0)
+   symbols = rng.choice(['H', 'C', 'N', 'O', 'Na', 'Cl', 'Ca', 'Fe'], COUNT).tolist()
+   grams = rng.uniform(0.1, 10.0, COUNT)
+
+   objects = min(timeit.repeat(
+      lambda: [Element(s, grams = g) for s, g in zip(symbols, grams.tolist())],
+      number = 1, repeat = 3))
+   array = min(timeit.repeat(
+      lambda: ElementArray(symbols, grams = grams), number = 1, repeat = 3))
+
+   print(f"{COUNT} Element objects: {objects * 1e3:10.1f} ms")
+   print(f"One ElementArray:       {array * 1e3:10.1f} ms")
+   print(f"Speedup: {objects / array:.1f}x")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks the cost of constructing `chemsolve.Element` objects.
+
+The previous implementation parsed the periodic table CSV file every time
+that an element was constructed, which is reproduced here by parsing the
+CSV file alongside each construction.
+
+Run it from the repository root with `python benchmarks/element_benchmark.py`.
+"""
+import timeit
+
+import pandas as pd
+
+from chemsolve import Element
+from chemsolve.utils.tabledata import pt_path
+
+SYMBOLS = ['H', 'C', 'N', 'O', 'Na', 'Cl', 'Ca', 'Fe', 'Ba', 'Pb']
+
+def construct_with_reload(symbol):
+   """Constructs an element along with a parse of the CSV file."""
+   pd.read_csv(pt_path)
+   return Element(symbol)
+
+def time_per_element(func, number):
+   """Returns the best time to construct a single element, in microseconds."""
+   timings = timeit.repeat(
+      lambda: [func(symbol) for symbol in SYMBOLS], number = number, repeat = 5)
+   return min(timings) / number / len(SYMBOLS) * 1e6
+
+if __name__ == '__main__':
+   # Load the shared table and issue any warnings before timing.
+   Element('H')
+
+   previous = time_per_element(construct_with_reload, 10)
+   current = time_per_element(Element, 10)
+
+   print(f"Element construction (CSV parse per element): {previous:10.1f} us")
+   print(f"Element construction (shared table):          {current:10.1f} us")
+   print(f"Speedup: {previous / current:.1f}x")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks the memory used when holding many `chemsolve.Element` objects.
+
+The previous `Element` layout, where every instance held its own copy
+of the element's properties in an instance dictionary, is reproduced by
+`LegacyElement` below and compared against the current layout, where
+instances only hold their quantities and share a single property record.
+
+Run it from the repository root with `python benchmarks/element_memory_benchmark.py`,
+optionally passing the number of elements to hold (default 1,000,000).
+"""
+import sys
+import tracemalloc
+
+from chemsolve import Element
+from chemsolve.utils.tabledata import lookup_element
+
+SYMBOLS = ['H', 'C', 'N', 'O', 'Na', 'Cl', 'Ca', 'Fe', 'Ba', 'Pb']
+
+class LegacyElement(object):
+   """The previous `Element` layout, with per-instance property copies."""
+   def __init__(self, symbol, moles):
+      data = lookup_element(symbol)
+      self._properties = dict(data.properties)
+      self.element_symbol = symbol
+      self.element_name = data.name
+      self.mass = data.mass
+      self.number = data.number
+      self.electron_configuration = data.electron_configuration
+      # The full configuration was a freshly concatenated string.
+      self.full_electron_configuration = "".join(data.full_electron_configuration)
+      self.radius = data.radius
+      self.electronegativity = data.electronegativity
+      self.ionization = data.ionization
+      self.electron_affinity = data.electron_affinity
+      self.mole_amount = moles
+      self.gram_amount = round(moles * data.mass, 4)
+      self.molecules = round(moles * 6.02214e23, 4)
+
+def measure(factory, count):
+   """Returns the memory held by `count` objects created by `factory`, in bytes."""
+   tracemalloc.start()
+   objects = [factory(SYMBOLS[indx % len(SYMBOLS)], moles = 1.0 + indx)
+              for indx in range(count)]
+   size, _ = tracemalloc.get_traced_memory()
+   tracemalloc.stop()
+   del objects
+   return size
+
+if __name__ == '__main__':
+   count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+   for name, factory in [('Previous layout', LegacyElement),
+                         ('Shared records', Element)]:
+      size = measure(factory, count)
+      print(f"{name:>16}: {size / 2 ** 20:10.1f} MiB for {count} "
+            f"elements ({size / count:.0f} bytes each)")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks solving empirical formulas from elemental compositions.
+
+Compares the previous multiplier search of `determine_empirical_coef`,
+run for one sample at a time, against solving every sample at once with
+`empirical_formulas`. The samples are the compositions of random formulas
+with a small amount of measurement noise.
+
+Run it from the repository root with `python benchmarks/empirical_benchmark.py`.
+"""
+import time
+import operator
+from math import isclose, floor, ceil
+
+import numpy as np
+
+from chemsolve import Element
+from chemsolve.utils.tabledata import get_column
+from chemsolve.utils.from_formula import empirical_formulas
+
+def previous_empirical_coef(compound_elements):
+   """The previous solver, which increments a multiplier one step at a time."""
+   coef_list = []
+   for element in compound_elements:
+      coef_list.append(operator.truediv(operator.mul(element.percent_of, 100), element.mass))
+   least = min(coef_list)
+   coef_list_2 = []
+   solved = True
+   for item in coef_list:
+      t = round(operator.truediv(item, least), 2)
+      if not isclose(t, floor(t), abs_tol = 10 ** -1) and not isclose(t, ceil(t), abs_tol = 10 ** -1):
+         solved = False
+         coef_list_2.append(t)
+      else:
+         coef_list_2.append(round(t, 1))
+   factor = 2
+   coef_list_3 = coef_list_2.copy()
+   overall_solved = True
+   while not solved:
+      overall_solved = False
+      for item in coef_list_3:
+         if not isclose(item, floor(item), abs_tol = 10 ** -1) and not isclose(item, ceil(item), abs_tol = 10 ** -1):
+            while not round(operator.mul(item, factor), 1).is_integer():
+               factor += 1
+      coef_list_3 = [round(operator.mul(item, factor), 1) for item in coef_list_3]
+      solved = all(isclose(t, floor(t), abs_tol = 10 ** -1) or isclose(t, ceil(t), abs_tol = 10 ** -1)
+                   for t in coef_list_3)
+   return coef_list_3 if not overall_solved else coef_list_2
+
+if __name__ == '__main__':
+   rng = np.random.default_rng(0)
+   symbols = ['C', 'H', 'N', 'O']
+   masses = get_column('AtomicMass')[[5, 0, 6, 7]]
+   subscripts = rng.integers(1, 6, size = (1000, 4)) * rng.integers(1, 3, size = (1000, 1))
+   percents = subscripts * masses / (subscripts * masses).sum(axis = 1, keepdims = True)
+   percents = np.round(percents * (1 + rng.normal(0, 0.001, percents.shape)), 4)
+
+   start = time.perf_counter()
+   for sample in percents:
+      previous_empirical_coef([Element(symbol, percent = percent)
+                               for symbol, percent in zip(symbols, sample)])
+   previous_time = time.perf_counter() - start
+
+   start = time.perf_counter()
+   formulas, errors = empirical_formulas(percents, symbols)
+   batch_time = time.perf_counter() - start
+
+   print(f"{len(percents)} samples, previous solver (per sample): {previous_time:8.4f} s")
+   print(f"{len(percents)} samples, empirical_formulas (batch):   {batch_time:8.4f} s "
+         f"({len(errors)} unsolved)")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks parsing chemical formulas.
+
+Compares the three parsers which were previously run on every compound
+(`periodictable.formula`, `chempy.Substance.from_formula`, and the regex
+splitting of `Compound._get_compound_ions`) against the single-pass
+parser in `chemsolve.utils.formula`, as well as a lookup in the species
+cache and full `Compound` creation.
+
+Run it from the repository root with `python benchmarks/formula_benchmark.py`.
+"""
+import re
+import timeit
+
+import periodictable as pt
+from chempy import Substance
+
+from chemsolve import Compound
+from chemsolve.utils.formula import parse_formula, get_species
+
+FORMULAS = ['H2O', 'CO2', 'C6H12O6', 'Pb(NO3)2', 'Ca3(PO4)2', 'K4[Fe(CN)6]']
+
+def regex_split(formula):
+   """The regex splitting previously used for the element dictionary."""
+   return re.findall('[A-Z][^A-Z]*', formula)
+
+def time_per_call(func, number):
+   """Returns the best time of a single call to `func`, in microseconds."""
+   return min(timeit.repeat(func, number = number, repeat = 5)) / number * 1e6
+
+if __name__ == '__main__':
+   parsers = [
+      ('periodictable.formula', pt.formula, 200),
+      ('chempy Substance.from_formula', Substance.from_formula, 200),
+      ('regex split (previous)', regex_split, 10000),
+      ('parse_formula', parse_formula, 10000),
+      ('get_species (cached)', get_species, 100000),
+      ('Compound', Compound, 200),
+   ]
+   for formula in FORMULAS:
+      print(f"{formula}:")
+      for name, parser, number in parsers:
+         print(f"   {name:<30} "
+               f"{time_per_call(lambda: parser(formula), number):10.2f} us")
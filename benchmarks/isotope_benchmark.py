@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks computing isotopic distributions.
+
+Compares convolving the isotopes of one atom at a time (merging peaks at
+the same resolution and cutoff) against `isotope_pattern`, which squares the
+distribution of each element and prunes improbable peaks, for a large
+formula. Then times `isotope_patterns` over a batch of random formulas.
+
+Run it from the repository root with `python benchmarks/isotope_benchmark.py`.
+"""
+import time
+
+import numpy as np
+
+from chemsolve.utils import isotopes
+from chemsolve.utils.formula import parse_formula
+from chemsolve.utils.isotopes import isotope_pattern, isotope_patterns
+
+def atom_by_atom_pattern(formula, resolution):
+   """Convolves the isotopes of each atom of the formula one at a time."""
+   pattern = isotopes.IsotopePattern(np.zeros(1), np.ones(1))
+   for symbol, count in parse_formula(formula).elements.items():
+      for _ in range(count):
+         pattern = isotopes._convolve(pattern, isotopes._isotopes()[symbol], resolution, 1e-6)
+   return pattern
+
+if __name__ == '__main__':
+   formula = 'C200H300N50O60S2'
+   start = time.perf_counter()
+   previous = atom_by_atom_pattern(formula, 0.5)
+   previous_time = time.perf_counter() - start
+   start = time.perf_counter()
+   pattern = isotope_pattern(formula, resolution = 0.5)
+   pattern_time = time.perf_counter() - start
+   print(f"{formula}, atom by atom:     {previous_time * 1000:8.2f} ms ({len(previous.masses)} peaks)")
+   print(f"{formula}, isotope_pattern:  {pattern_time * 1000:8.2f} ms ({len(pattern.masses)} peaks)")
+
+   rng = np.random.default_rng(0)
+   counts = rng.integers(1, 60, size = (10000, 4))
+   formulas = [f"C{c}H{h}N{n}O{o}" for c, h, n, o in counts.tolist()]
+   isotopes._element_pattern.cache_clear()
+   start = time.perf_counter()
+   patterns, errors = isotope_patterns(formulas, resolution = 0.01)
+   print(f"{len(formulas)} formulas, isotope_patterns: {time.perf_counter() - start:8.4f} s")
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks looking up an element's properties in the periodic table.
+
+Compares the indexed lookups by symbol, name, and atomic number against
+the previous boolean mask search over the periodic table DataFrame.
+
+Run it from the repository root with `python benchmarks/lookup_benchmark.py`.
+"""
+import timeit
+
+import numpy as np
+
+from chemsolve.utils.periodictable import PeriodicTable
+from chemsolve.utils.tabledata import lookup_element
+
+def mask_lookup(table, symbol):
+   """The previous lookup, using a boolean mask over the symbol column."""
+   properties = np.array(
+      table.iloc[[table.index[table['Symbol'] == symbol].tolist()[0]]]).ravel()
+   return dict(zip(list(table), properties))
+
+def time_per_call(func, number = 10000):
+   """Returns the best time of a single call to `func`, in microseconds."""
+   return min(timeit.repeat(func, number = number, repeat = 5)) / number * 1e6
+
+if __name__ == '__main__':
+   table = PeriodicTable()
+   print(f"Mask search (previous): {time_per_call(lambda: mask_lookup(table, 'Pb'), 100):10.2f} us")
+   print(f"Index by symbol:        {time_per_call(lambda: lookup_element('Pb')):10.2f} us")
+   print(f"Index by name:          {time_per_call(lambda: lookup_element('lead')):10.2f} us")
+   print(f"Index by number:        {time_per_call(lambda: lookup_element(82)):10.2f} us")
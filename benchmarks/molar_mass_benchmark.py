@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks identifying elements from measured molar masses.
+
+Compares the previous linear scan of the periodic table against the
+sorted molar mass index, both for single lookups and for a batch of
+masses resolved at once with `Element.from_molar_masses`.
+
+Run it from the repository root with `python benchmarks/molar_mass_benchmark.py`.
+"""
+import timeit
+
+import numpy as np
+
+from chemsolve import Element
+from chemsolve.utils.periodictable import get_periodic_table
+from chemsolve.utils.tabledata import find_molar_mass, match_molar_masses
+
+def linear_scan(table, mass):
+   """The previous lookup, scanning every row of the periodic table."""
+   for indx, molar_mass in enumerate(table['AtomicMass']):
+      if abs(mass - molar_mass) <= 0.05:
+         return table['Symbol'][indx]
+
+def time_per_call(func, number):
+   """Returns the best time of a single call to `func`, in microseconds."""
+   return min(timeit.repeat(func, number = number, repeat = 5)) / number * 1e6
+
+if __name__ == '__main__':
+   table = get_periodic_table()
+   rng = np.random.default_rng(0)
+   masses = rng.choice(table['AtomicMass'].to_numpy(), 10000) \
+            + rng.uniform(-0.04, 0.04, 10000)
+
+   print(f"Single mass, linear scan (previous): "
+         f"{time_per_call(lambda: linear_scan(table, 207.2), 100):10.2f} us")
+   print(f"Single mass, sorted index:           "
+         f"{time_per_call(lambda: find_molar_mass(207.2), 10000):10.2f} us")
+   print(f"10000 masses, sorted index (array):  "
+         f"{time_per_call(lambda: match_molar_masses(masses), 100):10.2f} us")
+   print(f"10000 masses, from_molar_masses:     "
+         f"{time_per_call(lambda: Element.from_molar_masses(masses), 10):10.2f} us")
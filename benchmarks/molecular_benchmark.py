@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks determining molecular formulas from elemental analyses.
+
+Compares calling `Compound.from_formula` for each sample, which requires
+creating an `Element` for each measured element and several compounds
+for each sample, against solving every sample at once with
+`Compound.from_formulas`. The samples are the compositions and molar
+masses of random formulas with a small amount of measurement noise.
+
+Run it from the repository root with `python benchmarks/molecular_benchmark.py`.
+"""
+import time
+
+import numpy as np
+
+from chemsolve import Element, Compound
+from chemsolve.utils.tabledata import get_column
+
+if __name__ == '__main__':
+   rng = np.random.default_rng(0)
+   symbols = ['C', 'H', 'N', 'O']
+   masses = get_column('AtomicMass')[[5, 0, 6, 7]]
+   subscripts = rng.integers(1, 6, size = (1000, 4))
+   molar_masses = (subscripts * masses).sum(axis = 1) * rng.integers(1, 4, size = 1000)
+   percents = subscripts * masses / (subscripts * masses).sum(axis = 1, keepdims = True)
+   percents = np.round(percents * (1 + rng.normal(0, 0.001, percents.shape)), 4)
+
+   start = time.perf_counter()
+   previous_errors = 0
+   for sample, molar_mass in zip(percents, molar_masses):
+      try:
+         Compound.from_formula(*[Element(symbol, percent = percent)
+                                 for symbol, percent in zip(symbols, sample)],
+                               mass = molar_mass, molecular = True)
+      except ValueError:
+         previous_errors += 1
+   previous_time = time.perf_counter() - start
+
+   start = time.perf_counter()
+   empirical, molecular, errors = Compound.from_formulas(percents, symbols, molar_masses)
+   batch_time = time.perf_counter() - start
+
+   print(f"{len(percents)} samples, Compound.from_formula (per sample): {previous_time:8.4f} s "
+         f"({previous_errors} unsolved)")
+   print(f"{len(percents)} samples, Compound.from_formulas (batch):     {batch_time:8.4f} s "
+         f"({len(errors)} unsolved)")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks the pickle size and round-trip time of compounds and reactions.
+
+Compounds are compared against `LegacyCompound`, a reproduction of the
+original `Compound` layout, which pickled its `periodictable` formula and
+chempy `Substance` along with it. Current compounds pickle only as their
+formula and quantities. Reactions pickle their compounds in the same way,
+along with their balanced coefficients as plain integers.
+
+Run it from the repository root with `python benchmarks/pickle_benchmark.py`,
+optionally passing the number of objects to pickle (default 100,000).
+"""
+import sys
+import time
+import pickle
+
+from chemsolve import Compound, Reaction
+
+class LegacyCompound(object):
+   """The original `Compound` layout, with per-instance parsed objects."""
+   def __init__(self, formula, grams):
+      import periodictable
+      from chempy import Substance
+      self.compound = periodictable.formula(formula)
+      self.mass = self.compound.mass
+      self.compound_elements = {str(element): count for element, count
+                                in self.compound.atoms.items()}
+      self.print_compound = Substance.from_formula(formula)
+      self.store_comp = formula
+      self.gram_amount = grams
+      self.mole_amount = round(grams / self.mass, 4)
+
+def roundtrip(objects):
+   """Returns the pickle size and round-trip time of a list of objects."""
+   start = time.perf_counter()
+   data = pickle.dumps(objects, protocol = pickle.HIGHEST_PROTOCOL)
+   pickle.loads(data)
+   return len(data), time.perf_counter() - start
+
+if __name__ == '__main__':
+   count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+   formulas = [f"C{indx % 20 + 1}H{indx % 41 + 1}O{indx % 3 + 1}" for indx in range(count)]
+
+   # The legacy compounds are slow to create, so only a sample is pickled.
+   legacy = [LegacyCompound(formula, grams = 1.0 + indx)
+             for indx, formula in enumerate(formulas[:count // 20])]
+   compounds = [Compound(formula, grams = 1.0 + indx) for indx, formula in enumerate(formulas)]
+   reaction = Reaction(reactants = [Compound('CH4', grams = 16.0), Compound('O2', grams = 10.0)],
+                       products = [Compound('CO2'), Compound('H2O')], lim_calc = True)
+   data = pickle.dumps(reaction)
+   reactions = [pickle.loads(data) for _ in range(count)]
+
+   for name, objects in [('Previous compounds', legacy), ('Compounds', compounds),
+                         ('Reactions', reactions)]:
+      size, elapsed = roundtrip(objects)
+      print(f"{name:>18}: {size / len(objects):8.1f} bytes and {elapsed / len(objects) * 1e6:7.2f} us "
+            f"per object ({len(objects)} objects, {size / 2 ** 20:.1f} MiB, {elapsed:.2f} s)")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Benchmarks the different ways of loading the periodic table data.
+
+Compares the compiled periodic table module against parsing the CSV file,
+both with the standard library (the fallback) and with pandas. Each load
+is run in a fresh interpreter, so that import costs are included.
+
+Run it from the repository root with `python benchmarks/table_load_benchmark.py`.
+"""
+import sys
+import subprocess
+
+LOADERS = {
+   'compiled module': "from chemsolve.utils import _periodic_data",
+   'CSV (standard library)':
+      "from chemsolve.utils.tabledata import read_table_csv; read_table_csv()",
+   'CSV (pandas)':
+      "import pandas as pd; from chemsolve.utils.tabledata import pt_path; "
+      "pd.read_csv(pt_path)",
+}
+
+# Times only the loading statement, after `chemsolve.utils.tabledata`
+# has been imported (importing it on its own does not load any data).
+TEMPLATE = """
+import sys, time
+sys.modules.setdefault('chemsolve', type(sys)('chemsolve'))
+sys.modules['chemsolve'].__path__ = [{path!r}]
+import chemsolve.utils.tabledata
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+def time_load(statement, repeat = 5):
+   """Returns the best time of a statement in a fresh process, in milliseconds."""
+   import chemsolve
+   code = TEMPLATE.format(path = chemsolve.__path__[0], statement = statement)
+   return min(float(subprocess.check_output([sys.executable, '-c', code]))
+              for _ in range(repeat)) * 1e3
+
+if __name__ == '__main__':
+   for name, statement in LOADERS.items():
+      print(f"{name:>24}: {time_load(statement):8.2f} ms")
@@ -19,12 +19,28 @@ class DuplicateLog(object):
 from ._release import __version__
 __version__ = '.'.join(str(item) for item in __version__)
 
-# Import general Chemsolve functionalities.
-from .element import *
-from .compound import *
-from .reaction import *
-
-from .solutions.molar import molarity
+# General Chemsolve functionalities. These depend on heavy third-party
+# libraries (pandas, numpy, sympy, chempy), so rather than importing them
+# with the package, they are imported on their first access instead.
+_LAZY_ATTRIBUTES = {
+   'Element': '.element', 'ElementArray': '.element', 'SpecialElement': '.element',
+   'Compound': '.compound', 'CompoundTable': '.compound', 'FormulaCompound': '.compound',
+   'CarbonDioxide': '.compound', 'Water': '.compound',
+   'Reaction': '.reaction', 'CombustionTrain': '.reaction',
+   'molarity': '.solutions.molar'
+}
+
+def __getattr__(name):
+   # Import lazily-loaded attributes on their first access.
+   if name in _LAZY_ATTRIBUTES:
+      import importlib
+      value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+      globals()[name] = value
+      return value
+   raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+   return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 from .utils.constants import *
 from .utils.conversion import convert_pressure_units, convert_temperature_units
@@ -49,8 +65,8 @@ def list_valid_elements():
    """
    elements = []
 
-   from .utils.periodictable import PeriodicTable as _PeriodicTable
-   _table = _PeriodicTable()
+   from .utils.periodictable import get_periodic_table as _get_periodic_table
+   _table = _get_periodic_table()
 
    for _element in _table['Name']:
       elements.append(_element)
@@ -70,9 +86,10 @@ def list_strong_acids(return_compounds = False):
    -------
    A list of each of the valid strong acids.
    """
+   from .compound import Compound as _Compound
    from .utils.constants import STRONG_ACIDS as _STRONG_ACIDS
    if return_compounds:
-      return [Compound(strong_acid) for strong_acid in _STRONG_ACIDS]
+      return [_Compound(strong_acid) for strong_acid in _STRONG_ACIDS]
    else:
       return _STRONG_ACIDS
 
@@ -89,10 +106,14 @@ def list_strong_bases(return_compounds = False):
    -------
    A list of each of the valid strong bases.
    """
+   from .compound import Compound as _Compound
    from .utils.constants import STRONG_BASES as _STRONG_BASES
    if return_compounds:
-      return [Compound(strong_base) for strong_base in _STRONG_BASES]
+      return [_Compound(strong_base) for strong_base in _STRONG_BASES]
    else:
       return _STRONG_BASES
 
+# The names exported by `from chemsolve import *`, including lazy ones.
+__all__ = [name for name in globals() if not name.startswith('_')] + list(_LAZY_ATTRIBUTES)
+
 
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Streaming batch computations over files of formulas and quantities.
+
+This is the `chemsolve-batch` command, which reads a CSV or JSONL file
+where each row contains a `formula` and optionally one of `grams`,
+`moles`, or `molecules`, and writes the molar mass, quantities, and
+composition of each row. Rows are read, computed, and written in chunks
+of a bounded size, so that memory use stays flat regardless of the size
+of the file, and chunks can be computed in parallel by a process pool.
+
+Examples
+--------
+   chemsolve-batch samples.csv -o results.csv
+   chemsolve-batch samples.jsonl --output-format jsonl --processes 4
+"""
+import os
+import sys
+import csv
+import json
+import argparse
+import itertools
+import collections
+import concurrent.futures
+
+import numpy as np
+
+from chemsolve.utils.constants import AVOGADRO
+from chemsolve.utils.tabledata import get_column
+from chemsolve.utils.composition import composition_matrix, _mass_vector
+
+__all__ = ['process_chunk', 'read_rows', 'write_rows', 'main']
+
+# The columns of each output row.
+OUTPUT_COLUMNS = ['formula', 'mass', 'mole_amount', 'gram_amount',
+                  'molecules', 'composition', 'error']
+
+# The quantities which can be provided in each input row.
+_QUANTITIES = ('moles', 'grams', 'molecules')
+
+def _read_quantity(value):
+   """Converts an input quantity into a float, or NaN if it is missing."""
+   if value is None or value == '':
+      return np.nan
+   return float(value)
+
+def process_chunk(rows):
+   """Computes the masses, quantities, and compositions of a chunk of rows.
+
+   The calculations are done for the entire chunk at once, in the same way
+   as `Compound` does them. The quantities are rounded with `np.round`, so
+   they can differ from those of `Compound` by one unit in their last digit.
+   Invalid rows are reported in their `error` column rather than stopping
+   the rest of the chunk.
+
+   Parameters
+   ----------
+   rows: list
+      A list of dictionaries, each containing a `formula` and optionally
+      one of `grams`, `moles`, or `molecules`.
+
+   Returns
+   -------
+   A list of the output dictionaries, one for each row, with the keys
+   in `OUTPUT_COLUMNS`.
+   """
+   formulas = [row.get('formula') for row in rows]
+   matrix, errors = composition_matrix(formulas)
+   errors = {row: str(error) for row, error in errors.items()}
+
+   # Read the provided quantities, with a column for each kind.
+   quantities = np.full((len(rows), len(_QUANTITIES)), np.nan)
+   for indx, row in enumerate(rows):
+      try:
+         quantities[indx] = [_read_quantity(row.get(key)) for key in _QUANTITIES]
+      except (TypeError, ValueError):
+         errors.setdefault(indx, f"Received an invalid quantity for {row.get('formula')}.")
+         continue
+      if np.count_nonzero(~np.isnan(quantities[indx])) > 1:
+         errors.setdefault(indx, "You cannot provide multiple quantities "
+                                 "of the compound at a single time.")
+   moles, grams, molecules = quantities.T
+
+   # Calculate the unknown quantities from whichever one was provided.
+   mass = matrix.dot(_mass_vector())
+   with np.errstate(invalid = 'ignore', divide = 'ignore'):
+      mole_amount = np.where(~np.isnan(moles), moles, np.where(
+         ~np.isnan(grams), np.round(grams / mass, 4), np.round(molecules / AVOGADRO, 4)))
+      gram_amount = np.where(~np.isnan(grams), grams, np.where(
+         ~np.isnan(moles), np.round(moles * mass, 4), np.round(mass * mole_amount)))
+      molecule_amount = np.where(~np.isnan(molecules), molecules, np.where(
+         ~np.isnan(moles), np.round(moles * AVOGADRO, 4), np.round(mole_amount * AVOGADRO, 4)))
+
+   symbols = get_column('Symbol')
+   output = []
+   for indx, formula in enumerate(formulas):
+      if indx in errors:
+         output.append(dict.fromkeys(OUTPUT_COLUMNS, None))
+         output[-1].update(formula = formula, error = errors[indx])
+         continue
+      start, end = matrix.indptr[indx], matrix.indptr[indx + 1]
+      output.append({
+         'formula': formula, 'mass': float(mass[indx]),
+         'mole_amount': _write_quantity(mole_amount[indx]),
+         'gram_amount': _write_quantity(gram_amount[indx]),
+         'molecules': _write_quantity(molecule_amount[indx]),
+         'composition': {symbols[column]: int(count) for column, count
+                         in zip(matrix.indices[start:end], matrix.data[start:end])},
+         'error': None})
+   return output
+
+def _write_quantity(value):
+   """Converts an output quantity into a float, or None if it is missing."""
+   return None if np.isnan(value) else float(value)
+
+def read_rows(stream, input_format):
+   """Lazily reads the rows of a CSV or JSONL stream as dictionaries."""
+   if input_format == 'csv':
+      yield from csv.DictReader(stream)
+   else:
+      for line in stream:
+         if line.strip():
+            yield json.loads(line)
+
+def write_rows(stream, rows, output_format, header = False):
+   """Writes output rows to a CSV or JSONL stream."""
+   if output_format == 'csv':
+      writer = csv.DictWriter(stream, fieldnames = OUTPUT_COLUMNS)
+      if header:
+         writer.writeheader()
+      for row in rows:
+         writer.writerow({key: json.dumps(value) if key == 'composition' and value is not None
+                          else '' if value is None else value for key, value in row.items()})
+   else:
+      for row in rows:
+         stream.write(json.dumps(row) + "\n")
+
+def _chunks(rows, chunk_size):
+   """Splits an iterable of rows into lists of at most `chunk_size` rows."""
+   rows = iter(rows)
+   while True:
+      chunk = list(itertools.islice(rows, chunk_size))
+      if not chunk:
+         return
+      yield chunk
+
+def _bounded_map(executor, func, chunks, window, pending):
+   """Maps `func` over chunks in order, with at most `window` pending chunks.
+
+   The submitted futures which have not yet been yielded are kept in
+   the `pending` deque, so that they can be cancelled by the caller.
+   """
+   for chunk in chunks:
+      pending.append(executor.submit(func, chunk))
+      if len(pending) >= window:
+         yield pending.popleft().result()
+   while pending:
+      yield pending.popleft().result()
+
+def _detect_format(path, default = 'csv'):
+   """Determines the format of a file from its extension."""
+   extension = os.path.splitext(path)[1].lower()
+   if extension in ('.jsonl', '.json', '.ndjson'):
+      return 'jsonl'
+   return 'csv' if extension == '.csv' else default
+
+def main(argv = None):
+   """The entry point of the `chemsolve-batch` command."""
+   parser = argparse.ArgumentParser(
+      prog = 'chemsolve-batch',
+      description = "Computes the molar mass, quantities, and composition of each "
+                    "formula in a CSV or JSONL file, streaming it in chunks.")
+   parser.add_argument('input', help = "The input file, or - to read from standard input.")
+   parser.add_argument('-o', '--output', default = '-',
+                       help = "The output file, or - (the default) to write to standard output.")
+   parser.add_argument('--input-format', choices = ['csv', 'jsonl'],
+                       help = "The format of the input, by default from its extension.")
+   parser.add_argument('--output-format', choices = ['csv', 'jsonl'],
+                       help = "The format of the output, by default the same as the input.")
+   parser.add_argument('--chunk-size', type = int, default = 10000,
+                       help = "The number of rows computed at once (default 10000).")
+   parser.add_argument('--processes', type = int, default = 1,
+                       help = "The number of processes to compute chunks with (default 1).")
+   args = parser.parse_args(argv)
+   if args.chunk_size < 1 or args.processes < 1:
+      parser.error("The chunk size and number of processes must be positive.")
+
+   input_format = args.input_format or _detect_format(args.input)
+   output_format = args.output_format or (
+      _detect_format(args.output, input_format) if args.output != '-' else input_format)
+   source = sys.stdin if args.input == '-' else open(args.input, newline = '', encoding = 'utf-8')
+   target = sys.stdout if args.output == '-' else open(args.output, 'w', newline = '', encoding = 'utf-8')
+
+   try:
+      chunks = _chunks(read_rows(source, input_format), args.chunk_size)
+      if args.processes > 1:
+         executor, pending = concurrent.futures.ProcessPoolExecutor(args.processes), collections.deque()
+         results = _bounded_map(executor, process_chunk, chunks, 2 * args.processes, pending)
+      else:
+         executor, pending = None, ()
+         results = map(process_chunk, chunks)
+      try:
+         for indx, result in enumerate(results):
+            write_rows(target, result, output_format, header = indx == 0)
+      finally:
+         if executor is not None:
+            # Cancel the chunks which haven't started (`shutdown` can only
+            # cancel them itself from Python 3.9), then wait for the rest.
+            for future in pending:
+               future.cancel()
+            executor.shutdown()
+   finally:
+      if source is not sys.stdin:
+         source.close()
+      if target is not sys.stdout:
+         target.close()
+   return 0
+
+if __name__ == '__main__':
+   sys.exit(main())
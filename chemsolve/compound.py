@@ -1,29 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding = utf-8 -*-
-import re
-import sys
-import math
 import operator
-import pyparsing
 
-import periodictable as pt
-from chempy import Substance
+import numpy as np
 
 from chemsolve.element import Element
-from chemsolve.utils.from_formula import determine_empirical_coef
+from chemsolve.utils.formula import get_species, canonical_keys
+from chemsolve.utils.tabledata import get_column
+from chemsolve.utils.candidates import candidate_formulas
+from chemsolve.utils.isotopes import monoisotopic_mass, isotope_pattern, isotope_patterns
+from chemsolve.utils.composition import molar_masses, composition_matrix
+from chemsolve.utils.composition import _mass_vector, _symbol_columns
+from chemsolve.utils.from_formula import determine_empirical_coef, molecular_formulas
 from chemsolve.utils.from_formula import determine_empirical, determine_molecular
-from chemsolve.utils.parsing import convert_string_no_charge
+from chemsolve.utils.quantities import QuantityArray
 from chemsolve.utils.constants import *
 from chemsolve.utils.warnings import ChemsolveDeprecationWarning
 from chemsolve.utils.errors import InvalidCompoundError
 
-__all__ = ['Compound', 'FormulaCompound', 'CarbonDioxide', 'Water']
-
-# Since the `chemsolve.utils.string_op` file contains an import
-# of this actual `chemsolve.compound` file, we cannot directly
-# import the method from there due to circular imports. Instead,
-# the function is redefined here to enable its usage in this module.
-def split(string): return [char for char in string]
+__all__ = ['Compound', 'CompoundTable', 'FormulaCompound', 'CarbonDioxide', 'Water']
 
 class Compound(object):
    """The core compound object class.
@@ -72,6 +67,17 @@ class Compound(object):
    compound: str
       The chemical formula of the compound that you want to use.
    """
+   # The formula, mass, and composition of the compound are stored in a
+   # single `Species` record shared by every compound of the same formula,
+   # so instances only hold their formula string and their quantities.
+   __slots__ = ('_species', 'compound', 'mole_amount', 'gram_amount', 'molecules',
+                'structure', 'empirical', '_elements', '_substance')
+
+   # The quantities of the compound, and the slots which are derived from
+   # its species (and so are recreated rather than pickled).
+   _quantities = ('mole_amount', 'gram_amount', 'molecules')
+   _derived = ('_species', '_elements', '_substance')
+
    def __init__(self, compound, **kwargs):
       # The Compound class will either be instantiated as a regular
       # compound, or from the `Compound.from_formula` method, and 
@@ -86,25 +92,15 @@ class Compound(object):
 
          # Set the original empirical calculation as well as the new
          # molecular calculation to the class (for accessibility).
-         self.compound = pt.formula(compound)
          self.empirical = mol_comp[1]
-      else:
-         try: # Check if a valid element has been passed.
-            self.compound = pt.formula(compound)
-         except pyparsing.ParseException:
-            # Pass a chemistry-related error rather than a parsing error.
-            raise InvalidCompoundError(compound)
-         except Exception as e:
-            # An unknown exception.
-            raise e
-
-      # Set the different class values.
-      self.mass = self.get_mass()
-      self.compound_elements_list = self._get_compound_ions(compound)
-      self.compound_elements = {}
-      self.compound.elements = self.get_elements_in_compound()
-      self.print_compound = Substance.from_formula(compound) # Deprecated attribute.
-      self.store_comp = compound
+
+      # Get the parsed formula (along with its mass and rendering) from
+      # the species cache, so each formula is only ever parsed once.
+      self._species = get_species(compound)
+      self.compound = compound
+
+      # The mass, element dictionaries, and the deprecated `print_compound`
+      # are read from the species (or created from it) when accessed.
 
       if 'bypass' not in kwargs:
          # If a subclass is initialized, then don't set default values.
@@ -112,7 +108,7 @@ class Compound(object):
 
    def __str__(self):
       # Return the unicode name of the compound (rendered correctly).
-      return convert_string_no_charge(str(self.compound))
+      return self._species.rendered
 
    def __repr__(self):
       # Return a object-based representation for internal use.
@@ -127,26 +123,93 @@ class Compound(object):
       # Return the mass of the compound as a float.
       return self.mass
 
+   def __getstate__(self):
+      # Only the formula and quantities of the compound are pickled, and
+      # the shared species is looked up (or parsed) when it is unpickled,
+      # so the derived attributes are recreated lazily on the other side.
+      pickled = ('compound', *self._quantities, *self._derived)
+      extras = {slot: getattr(self, slot) for cls in type(self).__mro__
+                for slot in vars(cls).get('__slots__', ())
+                if slot not in pickled and getattr(self, slot, None) is not None}
+      extras.update(getattr(self, '__dict__', {}))
+      return (self.compound, *(getattr(self, slot, None) for slot in self._quantities),
+              extras or None)
+
+   def __setstate__(self, state):
+      compound, moles, grams, molecules, extras = state
+      self._species = get_species(compound)
+      self.compound = compound
+      for slot, value in zip(self._quantities, (moles, grams, molecules)):
+         if value is not None:
+            setattr(self, slot, value)
+      for attribute, value in (extras or {}).items():
+         setattr(self, attribute, value)
+
+   def __eq__(self, other):
+      # Compounds are equal if they are the same species, regardless of
+      # how their formulas were written or of their quantities.
+      if isinstance(other, Compound):
+         return self._species.key == other._species.key
+      return NotImplemented
+
+   def __hash__(self):
+      # The hash of the canonical key (which is cached by the string).
+      return hash(self._species.key)
+
+   @property
+   def key(self):
+      # The canonical (Hill order) key of the compound, e.g. `C2H6`.
+      return self._species.key
+
    def __getattr__(self, item):
       if item not in ["mole_amount", "gram_amount", "volume"]:
          raise AttributeError("The attribute " + str(item) + " does not exist within this class.")
 
-   def __getattribute__(self, item):
-      # Check for deprecated methods and warn about their removal.
-      if item == 'print_compound':
-         ChemsolveDeprecationWarning('The attribute `Compound.print_compound` is deprecated and will '
-                                     'be removed in v2.0.0. Use repr(Compound) instead.',
-                                     future_version = 'bypass')
-      return object.__getattribute__(self, item)
+   @property
+   def mass(self):
+      # The molar mass of the compound.
+      return self._species.mass
+
+   @property
+   def store_comp(self):
+      # The formula of the compound, as it was provided.
+      return self.compound
+
+   @property
+   def compound_elements(self):
+      # A dictionary of the elements in the compound and their quantities,
+      # only copied from the (read-only) species when it is first accessed.
+      try:
+         return self._elements
+      except AttributeError:
+         self._elements = dict(self._species.elements)
+         return self._elements
+
+   @property
+   def compound_elements_list(self):
+      # A list of the symbols of the elements in the compound.
+      return list(self._species.elements)
+
+   @property
+   def print_compound(self):
+      # Deprecated attribute, warn about its removal.
+      ChemsolveDeprecationWarning('The attribute `Compound.print_compound` is deprecated and will '
+                                  'be removed in v2.0.0. Use repr(Compound) instead.',
+                                  future_version = 'bypass')
+      try:
+         return self._substance
+      except AttributeError:
+         # The chempy substance is only created when it is first accessed.
+         from chempy import Substance
+         self._substance = Substance.from_formula(self._species.formula)
+         return self._substance
 
    def __contains__(self, item):
       # Determine whether a element is in the compound.
       if isinstance(item, Element):
-         if item.element_symbol in self.compound_elements_list:
-            return True
+         return item.element_symbol in self._species.elements
       elif isinstance(item, str):
-         if item in self.compound_elements_list:
-            return True
+         return item in self._species.elements
       return False
 
    def __call__(self, **kwargs):
@@ -213,7 +276,7 @@ class Compound(object):
       # Determine compound coefficients, and create compound from them.
       empirical_coef = determine_empirical_coef(compound_elements)
       empirical = Compound(determine_empirical(compound_elements, empirical_coef))
-      empirical_mass = Compound(empirical.__repr__()).mass
+      empirical_mass = empirical.mass
 
       # Create primary Compound class.
       if molecular:
@@ -228,62 +291,162 @@ class Compound(object):
       """A transitional method for v2.0.0, will eventually replace fromFormula."""
       return Compound.fromFormula(*args, molecular = molecular, **kwargs)
 
+   @classmethod
+   def from_molar_mass(cls, mass, tolerance = 0.05, elements = 'CHNOS',
+                       rdbe_range = None, all_matches = False):
+      """Instantiates a compound from a provided molar mass.
+
+      Given a measured molar mass, this method enumerates every formula of
+      the allowed elements whose mass is within `tolerance` of it, and
+      instantiates the class from the closest one of those formulas. The
+      formulas are found by a pruned search (see `candidate_formulas`), so
+      this remains fast for large molar masses.
+
+      Examples
+      --------
+      Find the formulas of C, H, and O with the molar mass of glucose.
+
+      >>> glucose = Compound.from_molar_mass(180.156, tolerance = 0.01, elements = 'CHO')
+      >>> candidates = Compound.from_molar_mass(
+      ...    180.16, elements = {'C': (1, 10), 'H': 20, 'O': None},
+      ...    rdbe_range = (0, 10), all_matches = True)
+
+      Parameters
+      ----------
+      mass: float
+         The molar mass of the compound which you want to create.
+      tolerance: float
+         The maximum difference between the provided molar mass and the
+         molar mass of the compound, by default 0.05.
+      elements: str, iterable, or dict
+         The elements which the compound can contain, either as a string
+         of symbols (by default 'CHNOS'), an iterable of elements, or a
+         dictionary mapping each element to its maximum count or to a
+         tuple of its minimum and maximum counts.
+      rdbe_range: tuple
+         An optional (minimum, maximum) range of the ring-plus-double-bond
+         equivalents of the compound, which must also be a whole number.
+      all_matches: bool
+         If set to true, then this method will return a list of every
+         compound within the tolerance, from the closest to the furthest.
+
+      Returns
+      -------
+      An instantiated Compound class from the molar mass value.
+      """
+      matches = candidate_formulas(mass, tolerance, elements, rdbe_range)
+      if not matches:
+         raise ValueError(f"Received invalid molar mass {mass}, not close to the "
+                          f"molar mass of any formula of the provided elements.")
+      if all_matches:
+         return [cls(match.formula) for match in matches]
+      return cls(matches[0].formula)
+
+   @staticmethod
+   def from_formulas(amounts, elements, molar_masses = None, basis = 'percent', **kwargs):
+      """Determines the formulas of many samples of elemental analysis at once.
+
+      This is the batch equivalent of `Compound.from_formula`, which takes
+      a table of the amount of each element in each sample (and optionally
+      the measured molar mass of each sample) and solves all of the samples
+      at once, without creating any `Element` or `Compound` objects.
+
+      Examples
+      --------
+      >>> empirical, molecular, errors = Compound.from_formulas(
+      ...    [[75.95, 17.72, 6.33]], ['C', 'N', 'H'], molar_masses = [240])
+      >>> molecular
+      ['C15N3H15']
+
+      Parameters
+      ----------
+      amounts: array_like
+         An (n_samples x n_elements) array of the percents, grams, or moles
+         of each element in each sample.
+      elements: iterable
+         The elements of the columns of `amounts`, as `Element` objects,
+         symbols, names, or atomic numbers.
+      molar_masses: array_like
+         The measured molar mass of each sample, or NaN where it is unknown.
+      basis: str
+         What the amounts are: 'percent', 'grams', or 'moles'.
+
+      Returns
+      -------
+      A tuple containing a list of the empirical formula of each sample, a
+      list of the molecular formula of each sample (None where the molar
+      mass is unknown), and a dictionary mapping each sample which could not
+      be solved to its error.
+      """
+      return molecular_formulas(amounts, elements, molar_masses, basis, **kwargs)
+
+   @staticmethod
+   def canonical_keys(formulas):
+      """Computes the canonical (Hill order) keys of a batch of formulas.
+
+      Formulas which are written differently but contain the same elements
+      (e.g. `C2H6`, `H6C2`, and `CH3CH3`) have the same key, which is also
+      the `key` (and the basis of the equality) of their `Compound`.
+
+      Examples
+      --------
+      >>> keys, errors = Compound.canonical_keys(['C2H6', 'H6C2', 'CH3CH3'])
+      >>> set(keys)
+      {'C2H6'}
+
+      Parameters
+      ----------
+      formulas: iterable
+         The chemical formulas, as strings.
+
+      Returns
+      -------
+      A tuple containing a list of the canonical key of each formula (None
+      for invalid formulas), and a dictionary mapping the row of each
+      invalid formula to its error.
+      """
+      return canonical_keys(formulas)
+
+   @staticmethod
+   def molar_masses(formulas):
+      """Computes the molar masses of a batch of formulas at once.
+
+      This is much faster than creating a `Compound` for each formula,
+      since the masses are computed using a single matrix product over
+      the compositions of all of the formulas.
+
+      Examples
+      --------
+      >>> masses, errors = Compound.molar_masses(['H2O', 'CO2', 'NaCl'])
+
+      Parameters
+      ----------
+      formulas: iterable
+         The chemical formulas, as strings.
+
+      Returns
+      -------
+      A tuple containing an array of the molar mass of each formula (NaN
+      for invalid formulas), and a dictionary mapping the row of each
+      invalid formula to its error.
+      """
+      return molar_masses(formulas)
+
    def get_mass(self):
       '''
       Returns the atomic (and therefore molar) mass of the compound.
       '''
-      return self.compound.mass # noqa
+      return self._species.mass
 
    @staticmethod
    def _get_compound_ions(compound):
-      """Returns each of the individual polyatomic ions in
-      the element (both element symbol and number)."""
-      # Start by checking whether there is a parenthesis in the compound.
-      if "(" in compound:
-         # Ensure that there is an end parenthesis or else the parser will break.
-         if ")" not in compound:
-            raise InvalidCompoundError(
-               "Received opening parenthesis but no closing parenthesis"
-               f"in compound {compound}.", property_type = 'bypass'
-            )
-
-         # Parse all of the information inside of the actual parenthesis.
-         left = compound.index("(")
-         right = compound.index(")")
-         charge = int(compound[right + 1])
-         f = re.findall('[A-Z][^A-Z]*', compound[(left + 1):right])
-         replacer = ""
-         for val in f:
-            val = str(val)
-            if val[-1].isdigit():
-               z = val[-1]
-               val = val[:-1]
-               q = str(int(z) * int(charge))
-               val += q
-            else:
-               val += str(charge)
-            replacer += val
-
-         # Re-create the compound with the parenthesis information resolved.
-         compound = compound[:left] + str(replacer)
-
-      # Return the parsed compound.
-      return re.findall('[A-Z][^A-Z]*', str(compound))
+      """Returns each of the individual elements in the compound
+      (both element symbol and number), with any groups expanded."""
+      return [symbol + (str(count) if count != 1 else '') for symbol, count
+              in get_species(compound).elements.items()]
 
    def get_elements_in_compound(self):
       """Returns a dictionary containing the elements in the compound and the quantity of each element."""
-      for item in self.compound_elements_list:
-         item_val = split(item)
-         if item_val[-1].isdigit():
-            if item_val[-2].isdigit():
-               pass
-               self.compound_elements.update({''.join(item_val[:-2]):
-                                                 int(''.join(item_val[-2:]))})
-            else:
-               self.compound_elements.update({''.join(item_val[:-1]):
-                                                 int(item_val[-1])})
-         else:
-            self.compound_elements.update({item: 1})
       return self.compound_elements
 
    def moles_in_compound(self, element):
@@ -316,7 +479,9 @@ class Compound(object):
       """Returns the percentage of a certain element inside of the compound.
 
       Finds the percentage of the compound's mass that is made up of
-      a certain provided element and returns that value.
+      a certain provided element and returns that value. The percentage
+      of every element is computed once for each formula, so this is
+      only a lookup.
 
       Examples
       --------
@@ -330,13 +495,285 @@ class Compound(object):
       element: str or Element
          The element that you want to find the quantity of.
       """
+      symbol = element.element_symbol if isinstance(element, Element) else str(element).title()
       try:
-         return round((Element(str(element).title()).mass *
-                       self.compound_elements[element]) / self.mass, 4)
+         return round(self._species.fractions[symbol], 4)
       except KeyError:
          print("That is not an element in this compound.")
-      except AttributeError:
-         print("That is not an element.")
+
+   @property
+   def mass_fractions(self):
+      # The (read-only) mass fraction of each element in the compound.
+      return self._species.fractions
+
+   def composition_report(self):
+      """Returns the complete composition of the compound.
+
+      Examples
+      --------
+      >>> Compound('H2O').composition_report()
+      {'H': {'count': 2, 'mass': 2.01588, 'percent': 0.1119},
+       'O': {'count': 1, 'mass': 15.9994, 'percent': 0.8881}}
+
+      Returns
+      -------
+      A dictionary mapping each element in the compound to its count,
+      the mass which it contributes to one mole of the compound, and its
+      percentage of the compound's mass (as in `percent_in_compound`).
+      """
+      return {symbol: {'count': count,
+                       'mass': self._species.fractions[symbol] * self.mass,
+                       'percent': round(self._species.fractions[symbol], 4)}
+              for symbol, count in self._species.elements.items()}
+
+   @property
+   def monoisotopic_mass(self):
+      # The mass of the compound with the most abundant isotope of each element.
+      return monoisotopic_mass(self._species.formula)
+
+   def isotope_pattern(self, resolution = 0.01, cutoff = 1e-6):
+      """Computes the isotopic distribution of the compound.
+
+      Examples
+      --------
+      >>> pattern = Compound('C6H12O6').isotope_pattern(resolution = 0.5)
+      >>> pattern.masses[0], pattern.abundances[0]
+      (180.0633881178, 0.9226...)
+
+      Parameters
+      ----------
+      resolution: float
+         The mass difference within which peaks are merged into a single
+         peak, by default 0.01. Use 0.5 for a pattern at unit resolution.
+      cutoff: float
+         The probability below which peaks are discarded, by default 1e-6.
+
+      Returns
+      -------
+      An `IsotopePattern` containing arrays of the masses of the peaks of the
+      distribution (in increasing order), and the probability of each peak.
+      """
+      return isotope_pattern(self._species.formula, resolution, cutoff)
+
+   @staticmethod
+   def isotope_patterns(formulas, resolution = 0.01, cutoff = 1e-6):
+      """Computes the isotopic distributions of a batch of formulas.
+
+      Examples
+      --------
+      >>> patterns, errors = Compound.isotope_patterns(['H2O', 'C6H12O6', 'C200H300N50O60S2'])
+
+      Parameters
+      ----------
+      formulas: iterable
+         The chemical formulas, as strings.
+      resolution: float
+         The mass difference within which peaks are merged, by default 0.01.
+      cutoff: float
+         The probability below which peaks are discarded, by default 1e-6.
+
+      Returns
+      -------
+      A tuple containing a list of the `IsotopePattern` of each formula
+      (None for invalid formulas), and a dictionary mapping the row of
+      each invalid formula to its error.
+      """
+      return isotope_patterns(formulas, resolution, cutoff)
+
+
+class CompoundTable(QuantityArray):
+   """A columnar table of many compounds and their quantities.
+
+   This class holds a whole library of compounds at once, with each of
+   their properties stored as NumPy columns rather than as individual
+   `Compound` objects. The composition matrix (with one column for each
+   element which appears in the table), molar masses, mass fractions, and
+   element presence bitmasks are all computed in bulk, and quantities are
+   calculated in the same way as the `Compound` class does (including
+   rounding), but for every compound at once.
+
+   The columns of the table are `formula`, `mass`, `mole_amount`,
+   `gram_amount`, and `molecules`, as well as the count of each element
+   (e.g. `O`) and the mass fraction of each element (e.g. `percent_O`),
+   and any of them can be accessed, filtered, or sorted by.
+
+   Examples
+   --------
+   Create a table of measured gram values.
+
+   >>> samples = CompoundTable(['H2O', 'C6H12O6', 'NaCl'], grams = [2.0, 1.5, 3.0])
+   >>> # Access the calculated quantities and mass fractions.
+   >>> print(samples['mole_amount'])
+   >>> print(samples['percent_O'])
+   >>> # Select only the compounds containing oxygen, sorted by mass.
+   >>> oxygenated = samples.with_elements('O').sort('mass')
+
+   Parameters
+   ----------
+   compounds: iterable
+      The compounds, as `Compound` objects or formulas.
+   moles, grams, molecules: array_like
+      The quantity of each compound, of which only one can be provided.
+   """
+   # The columns of the table (see `QuantityArray`).
+   _label_column = 'formulas'
+   _name_column = 'formulas'
+   _row_columns = ('composition', 'mass', 'mass_fractions', 'presence')
+   _shared_columns = ('elements',)
+   _noun = 'compounds'
+
+   def __init__(self, compounds, **kwargs):
+      compounds = list(compounds)
+      formulas = np.array([compound.compound if isinstance(compound, Compound)
+                           else compound for compound in compounds], dtype = object)
+      matrix, errors = composition_matrix(formulas)
+      if errors:
+         row = min(errors)
+         raise InvalidCompoundError(
+            f"Received invalid formula {formulas[row]} in row {row} of the table: "
+            f"{errors[row]}", property_type = "bypass")
+
+      # Only keep the columns of the elements which appear in the table.
+      present = np.unique(matrix.indices)
+      self.formulas = formulas
+      self.elements = tuple(get_column('Symbol')[present].tolist())
+      self.composition = matrix.toarray()[:, present]
+      # The masses are summed in the same order as `Compound.mass`.
+      self.mass = matrix.dot(_mass_vector())
+      self._compute_columns(_mass_vector()[present])
+
+      if compounds and not kwargs and all(isinstance(c, Compound) for c in compounds):
+         # Keep the existing quantities of the compounds.
+         self.mole_amount = np.array([np.nan if c.mole_amount is None else c.mole_amount
+                                      for c in compounds], dtype = float)
+         self.gram_amount = np.array([np.nan if c.gram_amount is None else c.gram_amount
+                                      for c in compounds], dtype = float)
+         self.molecules = np.array([getattr(c, 'molecules', np.nan)
+                                    for c in compounds], dtype = float)
+      else:
+         self._parse_quantities(**kwargs)
+
+   def _compute_columns(self, element_masses):
+      # Calculate the mass fraction and presence columns in bulk.
+      element_mass = self.composition * element_masses
+      self.mass_fractions = element_mass / self.mass[:, np.newaxis]
+
+      # Each element's presence is a bit in one of the words of the bitmask.
+      present = self.composition > 0
+      words = np.zeros((len(self.formulas), max(1, -(-len(self.elements) // 64))),
+                       dtype = np.uint64)
+      for column in range(len(self.elements)):
+         words[:, column // 64] |= present[:, column].astype(np.uint64) << np.uint64(column % 64)
+      self.presence = words
+
+   @property
+   def columns(self):
+      # The names of every column of the table.
+      return ['formula', 'mass', 'mole_amount', 'gram_amount', 'molecules',
+              *self.elements, *(f'percent_{symbol}' for symbol in self.elements)]
+
+   def column(self, name):
+      """Returns a column of the table.
+
+      Parameters
+      ----------
+      name: str
+         The name of the column: `formula`, `mass`, `mole_amount`,
+         `gram_amount`, `molecules`, an element symbol for the count of
+         that element, or `percent_` and an element symbol for the mass
+         fraction of that element (e.g. `percent_O`).
+
+      Returns
+      -------
+      An array containing the value of the column for each compound.
+      """
+      if name == 'formula':
+         return self.formulas
+      if name in ('mass', 'mole_amount', 'gram_amount', 'molecules'):
+         return getattr(self, name)
+      symbol = name[len('percent_'):] if name.startswith('percent_') else name
+      if symbol in self.elements:
+         column = self.elements.index(symbol)
+         values = self.mass_fractions if name.startswith('percent_') else self.composition
+         return values[:, column]
+      if symbol in _symbol_columns():
+         # A valid element which isn't in any of the compounds.
+         return np.zeros(len(self), dtype = float if name.startswith('percent_') else np.int64)
+      raise KeyError(f"Received invalid column {name}, expected one of {self.columns}.")
+
+   def _presence_mask(self, elements):
+      # Create the presence bitmask of a set of elements, and whether
+      # every one of the elements appears anywhere in the table.
+      mask = np.zeros(self.presence.shape[1], dtype = np.uint64)
+      in_table = True
+      for element in elements:
+         symbol = element.element_symbol if isinstance(element, Element) else element
+         if symbol not in _symbol_columns():
+            raise InvalidCompoundError(
+               f"Received invalid element {symbol}.", property_type = "bypass")
+         if symbol not in self.elements:
+            in_table = False
+            continue
+         column = self.elements.index(symbol)
+         mask[column // 64] |= np.uint64(1) << np.uint64(column % 64)
+      return mask, in_table
+
+   def with_elements(self, *elements):
+      """Returns the compounds which contain every one of the elements."""
+      mask, in_table = self._presence_mask(elements)
+      return self[((self.presence & mask) == mask).all(axis = 1) & in_table]
+
+   def without_elements(self, *elements):
+      """Returns the compounds which contain none of the elements."""
+      mask, _ = self._presence_mask(elements)
+      return self[((self.presence & mask) == 0).all(axis = 1)]
+
+   def sort(self, by, descending = False):
+      """Returns the table sorted by one or more of its columns.
+
+      Parameters
+      ----------
+      by: str or list
+         The column to sort by, or a list of columns, in which case ties
+         are broken by the later columns.
+      descending: bool
+         Whether to sort from greatest to least, instead of least to greatest.
+
+      Returns
+      -------
+      A new `CompoundTable` containing the sorted compounds.
+      """
+      keys = [self.column(name) for name in ([by] if isinstance(by, str) else by)]
+      if descending:
+         # Formulas are strings, so they are reversed using their ranks.
+         keys = [-np.unique(key, return_inverse = True)[1] if key.dtype == object
+                 else -key for key in keys]
+      return self[np.lexsort(keys[::-1])]
+
+   def _create_item(self, formula):
+      return Compound(formula)
+
+   def __getitem__(self, item):
+      # A column name returns the column, a single index returns a
+      # `Compound`, while any slice, mask, or array of indices returns
+      # a new `CompoundTable`.
+      if isinstance(item, str):
+         return self.column(item)
+      return super().__getitem__(item)
+
+   @classmethod
+   def from_compounds(cls, compounds):
+      """Creates a table from `Compound` objects, keeping their quantities."""
+      return cls(compounds)
+
+   def to_compounds(self):
+      """Converts the table into a list of `Compound` objects."""
+      return list(self)
+
+   def to_dataframe(self):
+      """Converts the table into a `pandas.DataFrame` of its columns."""
+      import pandas as pd
+      return pd.DataFrame({name: self.column(name) for name in self.columns})
 
 
 class SolutionCompound(Compound):
@@ -420,57 +857,7 @@ class FormulaCompound(Compound):
       '''
       Private method. Returns the coefficients of the empirical formula of the element.
       '''
-      coef_list = []
-      for element in self.__compound_elements:
-         if element.percent_of != False:
-            coef_list.append(operator.truediv(operator.mul(element.percent_of, 100), element.mass))
-         if element.gram_amount != False:
-            coef_list.append(operator.truediv(element.gram_amount, element.mass))
-         if element.mole_amount != False:
-            coef_list.append(element.mole_amount)
-
-      least = sys.maxsize
-      for item in coef_list:
-         if item < least:
-            least = item
-      coef_list_2 = []
-      solved = True
-      for item in coef_list:
-         t = round(operator.truediv(item, least), 2)
-         if not math.isclose(t, math.floor(t), abs_tol = 10 ** -1) and not math.isclose(t, math.ceil(t), abs_tol= 10 ** -1):
-            solved = False
-            coef_list_2.append(t)
-         else:
-            coef_list_2.append(round(t, 1))
-
-      factor = 2
-      coef_list_3 = coef_list_2.copy()
-      coef_list_4 = []
-      overall_solved = True
-      while solved == False:
-         overall_solved = False
-         if solved == False:
-            for item in coef_list_3:
-               if not math.isclose(item, math.floor(item), abs_tol=10 ** -1) and not math.isclose(item, math.ceil(item), abs_tol=10 ** -1):
-                  z = True
-                  while z == True:
-                     if round(operator.mul(item, factor), 1).is_integer():
-                        z = False
-                     else:
-                        factor += 1
-            for item in coef_list_3:
-               coef_list_4.append(round(operator.mul(item, factor), 1))
-            coef_list_3 = coef_list_4.copy()
-            coef_list_4 = []
-            for t in coef_list_3:
-               if not math.isclose(t, math.floor(t), abs_tol=10 ** -1) and not math.isclose(t, math.ceil(t), abs_tol=10 ** -1):
-                  solved = False
-               else:
-                  solved = True
-
-      if overall_solved == False:
-         return coef_list_3
-      return coef_list_2
+      return determine_empirical_coef(self.__compound_elements)
 
    def determine_empirical(self):
       '''
@@ -522,6 +909,8 @@ class CarbonDioxide(Compound):
    """
    An extension of the Compound class for Carbon Dioxide, to be used in the CombustionTrain class.
    """
+   __slots__ = ('geometry',)
+
    def __init__(self, **kwargs):
       super().__init__(compound = "CO2", **kwargs)
       self.geometry = "linear"
@@ -530,6 +919,8 @@ class Water(Compound):
    """
    An extension of the Compound class for Water, to be used in the CombustionTrain class/
    """
+   __slots__ = ('geometry',)
+
    def __init__(self, **kwargs):
       super().__init__(compound = "H2O", **kwargs)
       self.geometry = "bent"
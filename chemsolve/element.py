@@ -4,12 +4,15 @@ from __future__ import division
 
 import operator
 
-from chemsolve.utils.periodictable import PeriodicTable
+from chemsolve.utils.tabledata import lookup_element, get_column, atomic_numbers
+from chemsolve.utils.tabledata import find_molar_mass, match_molar_masses
+from chemsolve.utils.orbitals import find_electron_configuration
+from chemsolve.utils.quantities import QuantityArray
 from chemsolve.utils.warnings import ChemsolveDeprecationWarning
 from chemsolve.utils.constants import *
 from chemsolve.utils.errors import InvalidElementError
 
-__all__ = ['Element', 'SpecialElement']
+__all__ = ['Element', 'ElementArray', 'SpecialElement']
 
 class Element(object):
    """The core element object class.
@@ -21,7 +24,8 @@ class Element(object):
    and electron affinity. These can all be accessed as attributes.
 
    The element can be instantiated traditionally, from its symbol, but can
-   also be created from molar mass or noble gas/complete electron configuration.
+   also be created from its name or atomic number, or from its molar mass
+   or noble gas/complete electron configuration.
 
    Furthermore, with provided amounts of grams, moles, or molecules, the
    element class can automatically calculate the second and third unknown
@@ -45,30 +49,18 @@ class Element(object):
 
    Parameters
    ----------
-   element_symbol: str
-      The element symbol representing the element you want to initialize.
+   element_symbol: str or int
+      The symbol or name (either case-insensitive) or the atomic number
+      of the element which you want to initialize.
    """
-   def __init__(self, element_symbol, **kwargs):
-      # Initialize class properties from PeriodicTable object.
-      self._properties = PeriodicTable().get_properties(element_symbol)
-
-      # Element Symbol/Name.
-      self.element_symbol = element_symbol
-      self.element_name = self.get_element_name()
-
-      # Atomic Mass and Number.
-      self.mass = self._properties['AtomicMass']
-      self.number = self._properties['AtomicNumber']
-
-      # Electron Configurations.
-      self.electron_configuration = self._properties['ElectronConfiguration']
-      self.full_electron_configuration = self._get_full_electron_configuration()
+   # The properties of the element are stored in a single `ElementData`
+   # record shared by every instance of the element, so instances only
+   # hold the quantities of the element which they represent.
+   __slots__ = ('_data', 'mole_amount', 'gram_amount', 'molecules', 'percent_of')
 
-      # Miscellaneous Properties.
-      self.radius = self._properties['AtomicRadius']
-      self.electronegativity = self._properties['Electronegativity']
-      self.ionization = self._properties['IonizationEnergy']
-      self.electron_affinity = self._properties['ElectronAffinity']
+   def __init__(self, element_symbol, **kwargs):
+      # Get the shared properties of the element from the periodic table.
+      self._data = lookup_element(element_symbol)
 
       # Class Value Calculations.
       if "moles" in kwargs:
@@ -103,6 +95,65 @@ class Element(object):
          raise Exception("You cannot provide multiple different quantities "
                          "of the element at a single time.")
 
+   def __getstate__(self):
+      # Only the atomic number and the quantities of the element are
+      # pickled, and the shared record is looked up when it is unpickled.
+      quantities = {slot: getattr(self, slot) for slot in Element.__slots__[1:]
+                    if hasattr(self, slot)}
+      quantities.update(getattr(self, '__dict__', {}))
+      return self._data.number, quantities
+
+   def __setstate__(self, state):
+      number, quantities = state
+      self._data = lookup_element(number)
+      for attribute, value in quantities.items():
+         setattr(self, attribute, value)
+
+   @property
+   def _properties(self):
+      # A read-only mapping of all of the element's properties.
+      return self._data.properties
+
+   @property
+   def element_symbol(self):
+      return self._data.symbol
+
+   @property
+   def element_name(self):
+      return self._data.name
+
+   @property
+   def mass(self):
+      return self._data.mass
+
+   @property
+   def number(self):
+      return self._data.number
+
+   @property
+   def electron_configuration(self):
+      return self._data.electron_configuration
+
+   @property
+   def full_electron_configuration(self):
+      return self._data.full_electron_configuration
+
+   @property
+   def radius(self):
+      return self._data.radius
+
+   @property
+   def electronegativity(self):
+      return self._data.electronegativity
+
+   @property
+   def ionization(self):
+      return self._data.ionization
+
+   @property
+   def electron_affinity(self):
+      return self._data.electron_affinity
+
    def __str__(self):
       # For __str__, return the entire name of the element.
       return str(self.element_name.title())
@@ -201,12 +252,13 @@ class Element(object):
                           "of the element at a single time.")
 
    @classmethod
-   def from_molar_mass(cls, mass):
+   def from_molar_mass(cls, mass, tolerance = 0.05, all_matches = False):
       """Instantiates an element from a provided molar mass.
 
       Given a certain molar mass value, this method checks to see whether there
-      is an existing element with a defined molar mass value within 0.05 of the
-      provided molar mass value, and instantiates the class from that.
+      is an existing element with a defined molar mass value within `tolerance`
+      of the provided molar mass value, and instantiates the class from the
+      closest one of those elements.
 
       Examples
       --------
@@ -218,19 +270,54 @@ class Element(object):
       ----------
       mass: float
          The molar mass of the element which you want to create.
+      tolerance: float
+         The maximum difference between the provided molar mass and the
+         molar mass of the element, by default 0.05.
+      all_matches: bool
+         If set to true, then this method will return a list of every
+         element within the tolerance, from the closest to the furthest.
 
       Returns
       -------
       An instantiated Element class from the molar mass value.
       """
-      table = PeriodicTable()
+      matches = find_molar_mass(mass, tolerance)
+      if not matches:
+         raise ValueError(f"Received invalid molar mass {mass}, not "
+                          f"close to any molar masses on the periodic table.")
+      if all_matches:
+         return [cls(match.number) for match in matches]
+      return cls(matches[0].number)
+
+   @classmethod
+   def from_molar_masses(cls, masses, tolerance = 0.05):
+      """Instantiates elements from an array of molar masses.
+
+      This is a vectorized version of `Element.from_molar_mass`, which
+      finds the closest element to each of the provided molar masses
+      in a single operation.
+
+      Examples
+      --------
+      Identify a set of measured molar masses.
+
+      >>> elements = Element.from_molar_masses([1.01, 12.0, 15.99, 50.0])
+
+      Parameters
+      ----------
+      masses: array_like
+         The molar masses of the elements which you want to create.
+      tolerance: float
+         The maximum difference between each of the molar masses and the
+         molar mass of its element, by default 0.05.
 
-      for indx, molar_mass in enumerate(table['AtomicMass']):
-         if abs(mass - molar_mass) <= 0.05:
-            # If the molar mass provided is close to the actual one.
-            return cls(table['Symbol'][indx])
-      raise ValueError(f"Received invalid molar mass {mass}, not "
-                       f"close to any molar masses on the periodic table.")
+      Returns
+      -------
+      A list containing an Element for each of the molar masses, or None
+      where there is no element within the tolerance of the molar mass.
+      """
+      return [cls(number) if number else None
+              for number in match_molar_masses(masses, tolerance).tolist()]
 
    @classmethod
    def from_electron_configuration(cls, config):
@@ -239,6 +326,8 @@ class Element(object):
       Given an electron configuration, either the complete one or the noble
       gas abbreviation, this method gets the element associated with that
       electron configuration and instantiates the Element class from it.
+      The subshells of the configuration can be in any order and have any
+      spacing between them, e.g. '1s2 2s2 2p6 3s2' or '3s2 [Ne]'.
 
       Examples
       --------
@@ -255,36 +344,16 @@ class Element(object):
       -------
       An instantiated Element class from the electron configruation.
       """
-      table = PeriodicTable()
-
-      for indx, configuration in enumerate(table['ElectronConfiguration']):
-         if config == configuration:
-            return cls(table['Symbol'][indx])
-      for indx, element in enumerate(table['Symbol']):
-         if config == Element(table['Symbol'][indx]).full_electron_configuration:
-            return cls(table['Symbol'][indx])
-      raise ValueError(
-         f"Received invalid electron configuration {config}, not a valid noble gas "
-         f"configuration or complete configuration on the periodic table.")
+      return cls(find_electron_configuration(config).number)
 
    @ChemsolveDeprecationWarning('Element.get_element_name', future_version = '2.0.0')
    def get_element_name(self):
       """Returns the element name from the symbol."""
-      try:
-         return self._properties['Name']
-      except AttributeError:
-         raise InvalidElementError(
-            f"Invalid element {self.element_symbol} received.")
+      return self._data.name
 
    def _get_full_electron_configuration(self):
       """Returns the entire electron configuration of the element."""
-      if self.electron_configuration[0] == "[":
-         config = Element(self.electron_configuration[1:3])\
-                     .full_electron_configuration + " "
-         config += self.electron_configuration[4:]
-         return config
-      else:
-         return self.electron_configuration
+      return self._data.full_electron_configuration
 
    @ChemsolveDeprecationWarning('Element.calculate_moles', future_version = '2.0.0')
    def calculate_moles(self):
@@ -296,6 +365,59 @@ class Element(object):
       """Calculates the class gram quantity from moles."""
       return operator.mul(self.mole_amount, self.mass)
 
+class ElementArray(QuantityArray):
+   """A vectorized batch of elements and their quantities.
+
+   This class holds many elements at once, with each of their properties
+   and quantities stored as NumPy columns rather than as individual
+   `Element` objects. Quantities are calculated in the same way as the
+   `Element` class does (including rounding), but for every element at
+   once, and the array can be sliced, masked, and converted back into
+   `Element` objects when necessary.
+
+   Examples
+   --------
+   Create an array of measured gram values.
+
+   >>> samples = ElementArray(['Ca', 'Na', 'Ca', 'Fe'], grams = [2.0, 1.5, 3.0, 0.7])
+   >>> # Access the calculated quantities.
+   >>> print(samples.mole_amount)
+   >>> # Select only the calcium samples and convert them to elements.
+   >>> calcium = samples[samples.symbols == 'Ca'].to_elements()
+
+   Parameters
+   ----------
+   elements: iterable
+      The elements, as `Element` objects, symbols, names, or atomic numbers.
+   moles, grams, molecules: array_like
+      The quantity of each element, of which only one can be provided.
+   """
+   # The columns of the array (see `QuantityArray`).
+   _label_column = 'numbers'
+   _name_column = 'symbols'
+   _noun = 'elements'
+
+   def __init__(self, elements, **kwargs):
+      self.numbers = atomic_numbers(elements)
+      self._parse_quantities(**kwargs)
+
+   def _create_item(self, number):
+      return Element(int(number))
+
+   @property
+   def symbols(self):
+      # The symbol of each element.
+      return get_column('Symbol')[self.numbers - 1]
+
+   @property
+   def mass(self):
+      # The molar mass of each element.
+      return get_column('AtomicMass')[self.numbers - 1]
+
+   def to_elements(self):
+      """Converts the array into a list of `Element` objects."""
+      return list(self)
+
 @ChemsolveDeprecationWarning('SpecialElement', future_version = '2.0.0')
 class SpecialElement(Element):
    """
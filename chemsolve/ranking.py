@@ -1,9 +1,127 @@
 #!/usr/bin/env python3
 # -*- coding = utf-8 -*-
+import numpy as np
+
 from chemsolve.element import Element
-from chemsolve.utils.validation import maybe_elements
+from chemsolve.utils.tabledata import load_table_data, get_column, atomic_numbers
 from chemsolve.utils.errors import InvalidElementError
 
+# Element attribute names which differ from their periodic table columns.
+_PROPERTY_ALIASES = {
+   'mass': 'AtomicMass',
+   'number': 'AtomicNumber',
+   'radius': 'AtomicRadius',
+   'ionization': 'IonizationEnergy',
+}
+
+def _resolve_column(prop):
+   """Converts a property name into a numeric periodic table column."""
+   columns = load_table_data()
+   column = _PROPERTY_ALIASES.get(prop, prop)
+   if column not in columns:
+      # Convert Element-style attribute names, e.g. `melting_point`.
+      column = ''.join(word.title() for word in column.split('_'))
+   if column not in columns or get_column(column).dtype == object:
+      raise ValueError(f"Received invalid property {prop}, expected a "
+                       f"numeric periodic table column.")
+   return column
+
+def _ranking_order(numbers, by, descending = False, top = None, missing = 'last'):
+   """Returns the order of the elements, as indices into `numbers`."""
+   if missing not in ['last', 'first', 'drop', 'raise']:
+      raise ValueError(f"Received invalid missing value policy {missing}, "
+                       f"expected one of 'last', 'first', 'drop', or 'raise'.")
+   properties = [by] if isinstance(by, str) else list(by)
+   keys = [get_column(_resolve_column(prop))[numbers - 1].astype(float)
+           for prop in properties]
+   if descending:
+      keys = [-key for key in keys]
+
+   # Apply the missing value policy to elements missing any property.
+   positions = np.arange(len(numbers))
+   absent = np.zeros(len(numbers), dtype = bool)
+   for key in keys:
+      absent |= np.isnan(key)
+   if absent.any():
+      if missing == 'raise':
+         raise ValueError(
+            f"Received elements without values for {', '.join(properties)}: "
+            f"{get_column('Symbol')[numbers[absent] - 1].tolist()}.")
+      if missing == 'drop':
+         keys = [key[~absent] for key in keys]
+         positions = positions[~absent]
+         absent = absent[~absent]
+
+   # Sort by the missing values first, and then by each of the properties
+   # in order (`np.lexsort` uses the last key as the primary key).
+   sort_keys = keys[::-1] + [~absent if missing == 'first' else absent]
+   if top is not None and top < len(positions) and len(keys) == 1 and not absent.any():
+      # Only the top elements are needed, so partially sort the values.
+      selected = np.argpartition(keys[0], top)[:top] if top > 0 else positions[:0]
+      return positions[selected[np.lexsort([key[selected] for key in sort_keys])]]
+   order = positions[np.lexsort(sort_keys)]
+   return order if top is None else order[:top]
+
+def rank_elements(elements = None, by = 'Electronegativity', descending = False,
+                  top = None, missing = 'last', return_values = False):
+   """Ranks elements by any numeric property of the periodic table.
+
+   The ranking is done directly on the columns of the periodic table,
+   so no `Element` objects are created at all.
+
+   Examples
+   --------
+   Get the five densest elements.
+
+   >>> print(rank_elements(by = 'Density', descending = True, top = 5))
+
+   Rank halogens by their melting point, with ties broken by boiling point.
+
+   >>> print(rank_elements(['F', 'Cl', 'Br', 'I'], by = ['MeltingPoint', 'BoilingPoint']))
+
+   Parameters
+   ----------
+   elements: iterable
+      The elements to rank, as `Element` objects, symbols, names, or atomic
+      numbers. If not provided, every element of the periodic table is ranked.
+   by: str or list
+      The property to rank by, either as a periodic table column (e.g. 'Density')
+      or as an element attribute (e.g. 'radius' or 'melting_point'). If a list
+      of properties is provided, ties are broken by the later properties.
+   descending: bool
+      Whether to rank from greatest to least, instead of least to greatest.
+   top: int
+      If provided, only the first `top` elements of the ranking are returned.
+   missing: str
+      What to do with elements which have no value for the property: either
+      'last' or 'first' to place them at the end or start of the ranking,
+      'drop' to remove them from the ranking, or 'raise' to raise an error.
+   return_values: bool
+      If set to true, the values of the (first) property are also returned.
+
+   Returns
+   -------
+   An array of the ranked element symbols, as well as an array of their
+   values if `return_values` is set to true.
+   """
+   numbers = np.arange(1, len(get_column('AtomicNumber')) + 1) \
+             if elements is None else atomic_numbers(elements)
+   ranked = numbers[_ranking_order(numbers, by, descending, top, missing)]
+   symbols = get_column('Symbol')[ranked - 1]
+   if return_values:
+      by = by if isinstance(by, str) else by[0]
+      return symbols, get_column(_resolve_column(by))[ranked - 1]
+   return symbols
+
+def _rank_provided(elements, by):
+   """Ranks provided `Element` objects or symbols, returning elements."""
+   for element in elements:
+      if not isinstance(element, (Element, str)):
+         raise InvalidElementError(element, property_type = "type")
+   order = _ranking_order(atomic_numbers(elements), by)
+   return tuple(elements[indx] if isinstance(elements[indx], Element)
+                else Element(elements[indx]) for indx in order)
+
 def rank_electronegativity(*elements):
    """Ranks provided elements by their electronegativity.
 
@@ -21,19 +139,7 @@ def rank_electronegativity(*elements):
    -------
    The elements ranked from least to greatest electronegativity.
    """
-   # First, validate the provided elements.
-   elements = maybe_elements(*elements)
-
-   # Then, get the electronegativities of each element.
-   electronegativities = []
-   for element in elements:
-      electronegativities.append(element.electronegativity)
-
-   # Sort the electronegativities.
-   _, sorted_elements = zip(*sorted(zip(electronegativities, elements)))
-
-   # Return the sorted list.
-   return sorted_elements
+   return _rank_provided(elements, 'Electronegativity')
 
 def rank_atomic_radius(*elements):
    """Ranks provided elements by their atomic radii.
@@ -52,19 +158,7 @@ def rank_atomic_radius(*elements):
    -------
    The elements ranked from least to greatest atomic radius.
    """
-   # First, validate the provided elements.
-   elements = maybe_elements(*elements)
-
-   # Then, get the atomic radii of each element.
-   atomic_radii = []
-   for element in elements:
-      atomic_radii.append(element.electronegativity)
-
-   # Sort the atomic radii.
-   _, sorted_elements = zip(*sorted(zip(atomic_radii, elements)))
-
-   # Return the sorted list.
-   return sorted_elements
+   return _rank_provided(elements, 'AtomicRadius')
 
 def rank_first_ionization_energy(*elements):
    """Ranks provided elements by their first ionization energy.
@@ -83,19 +177,7 @@ def rank_first_ionization_energy(*elements):
    -------
    The elements ranked from least to greatest first ionization energy.
    """
-   # First, validate the provided elements.
-   elements = maybe_elements(*elements)
-
-   # Then, get the first ionization energy of each element.
-   ionization_energies = []
-   for element in elements:
-      ionization_energies.append(element.ionization)
-
-   # Sort the atomic radii.
-   _, sorted_elements = zip(*sorted(zip(ionization_energies, elements)))
-
-   # Return the sorted list.
-   return sorted_elements
+   return _rank_provided(elements, 'IonizationEnergy')
 
 def rank_electron_affinity(*elements):
    """Ranks provided elements by their electron_affinity.
@@ -114,16 +196,4 @@ def rank_electron_affinity(*elements):
    -------
    The elements ranked from least to greatest electron affinity.
    """
-   # First, validate the provided elements.
-   elements = maybe_elements(*elements)
-
-   # Then, get the first ionization energy of each element.
-   electron_affinities = []
-   for element in elements:
-      electron_affinities.append(element.electron_affinity)
-
-   # Sort the atomic radii.
-   _, sorted_elements = zip(*sorted(zip(electron_affinities, elements)))
-
-   # Return the sorted list.
-   return sorted_elements
+   return _rank_provided(elements, 'ElectronAffinity')
@@ -1,17 +1,13 @@
 import operator
 import re
 import sys
-import sympy
-
-import pyparsing
-
-from chempy import Substance
-from chempy import balance_stoichiometry
 
 from chemsolve.element import Element
 from chemsolve.element import SpecialElement
 from chemsolve.compound import Compound
 from chemsolve.compound import FormulaCompound
+from chemsolve.utils.formula import canonical_key
+from chemsolve.utils.balance import balance_stoichiometry
 from chemsolve.utils.combustion import determine_main_compound
 from chemsolve.utils.validation import assert_chemical_presence
 from chemsolve.utils.warnings import ChemsolveDeprecationWarning
@@ -59,7 +55,7 @@ class Reaction(object):
          ChemsolveDeprecationWarning("Adding compounds to a Reaction using *args is deprecated and will be "
                                      "removed in v2.0.0. Start using the `reactants` and `products` arguments.",
                                      future_version = 'bypass')
-         for compound in args:
+         for indx, compound in enumerate(args):
             if isinstance(compound, str):
                self._original_reaction += str("--> ")
                temp = self.products
@@ -67,7 +63,7 @@ class Reaction(object):
             else:
                temp2.append(compound)
                self._original_reaction += str(compound.__str__() + " ")
-               if compound != args[-1] and not isinstance(args[args.index(compound) + 1], str):
+               if indx < len(args) - 1 and not isinstance(args[indx + 1], str):
                   self._original_reaction += str("+ ")
                if not isinstance(compound, (Element, Compound)):
                   raise TypeError("The object " + str(compound) + " is not of type "
@@ -90,20 +86,26 @@ class Reaction(object):
 
    def __contains__(self, item):
       # Determine if a compound is in the reaction.
+      # Compounds are matched by their canonical keys, so that formulas
+      # which are written differently are still found in the reaction.
       if isinstance(item, Compound):
-         if repr(item) in self.reactants or repr(item) in self.products:
-            return True
+         key = item.key
       elif isinstance(item, str):
-         if item in self.reactants or item in self.products:
-            return True
-      return False
+         try:
+            key = canonical_key(item)
+         except InvalidCompoundError:
+            return False
+      else:
+         return False
+      return any(canonical_key(compound) == key
+                 for compound in self.reactants + self.products)
 
    def _initialize_reaction(self, reactants, products):
       """Internal method to initialize the class reaction from inputs."""
       # Add reactants to list of reactants and original reaction string.
-      for reactant in reactants:
+      for indx, reactant in enumerate(reactants):
          self._original_reaction += str(str(reactant) + " ")
-         if reactant != reactants[-1]:
+         if indx < len(reactants) - 1:
             self._original_reaction += str("+ ")
          self._reactant_store.append(reactant)
          self.reactants.append(repr(reactant))
@@ -112,9 +114,9 @@ class Reaction(object):
       self._original_reaction += "--> "
 
       # Add products to list of products and original reaction string.
-      for product in products:
+      for indx, product in enumerate(products):
          self._original_reaction += str(str(product) + " ")
-         if product != products[-1]:
+         if indx < len(products) - 1:
             self._original_reaction += str("+ ")
          self._product_store.append(product)
          self.products.append(repr(product))
@@ -253,13 +255,8 @@ class Reaction(object):
    def _balance(self):
       """Internal method, returns ordered dictionaries containing
       the balanced reaction's reactants and products."""
-      try:
-         return balance_stoichiometry({f for f in self.reactants}, {f for f in self.products})
-      except pyparsing.ParseException:
-         raise InvalidReactionError("Received an invalid reaction, there is a reactant "
-                                    "which does not appear on the products side, or a product"
-                                    "which does not appear on the reactants side.",
-                                    property_type = "bypass")
+      # The species are sorted, as they were by the previous (chempy) balancer.
+      return balance_stoichiometry(sorted(set(self.reactants)), sorted(set(self.products)))
 
    def balanced_display(self):
       """Returns a displayable version of the balanced reaction."""
@@ -319,7 +316,7 @@ class Reaction(object):
       # Iterate over the different reactants.
       for item in list((self._balanced[0]).items()):
          for com in self._reactant_store:
-            if str(Compound(item[0])) == str(com):
+            if canonical_key(item[0]) == canonical_key(repr(com)):
                # Calculate the mole values.
                moles = com.mole_amount
                org_moles = moles
@@ -0,0 +1,298 @@
+# -*- coding = utf-8 -*-
+# Automatically generated from PT_complete.csv by `chemsolve.utils.tabledata`,
+# do not edit by hand. Rebuild using: python -m chemsolve.utils.tabledata
+nan = float('nan')
+
+CSV_DIGEST = '9e63ca11a3e0d276450ccd72aef54717b049ad34'
+
+TABLE_DATA = {
+   'AtomicNumber': (
+      1, 2, 3, 4, 5, 6, 7, 8,
+      9, 10, 11, 12, 13, 14, 15, 16,
+      17, 18, 19, 20, 21, 22, 23, 24,
+      25, 26, 27, 28, 29, 30, 31, 32,
+      33, 34, 35, 36, 37, 38, 39, 40,
+      41, 42, 43, 44, 45, 46, 47, 48,
+      49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64,
+      65, 66, 67, 68, 69, 70, 71, 72,
+      73, 74, 75, 76, 77, 78, 79, 80,
+      81, 82, 83, 84, 85, 86, 87, 88,
+      89, 90, 91, 92, 93, 94, 95, 96,
+      97, 98, 99, 100, 101, 102, 103, 104,
+      105, 106, 107, 108, 109, 110, 111, 112,
+      113, 114, 115, 116, 117, 118,
+   ),
+   'Symbol': (
+      'H', 'He', 'Li', 'Be', 'B', 'C', 'N', 'O',
+      'F', 'Ne', 'Na', 'Mg', 'Al', 'Si', 'P', 'S',
+      'Cl', 'Ar', 'K', 'Ca', 'Sc', 'Ti', 'V', 'Cr',
+      'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn', 'Ga', 'Ge',
+      'As', 'Se', 'Br', 'Kr', 'Rb', 'Sr', 'Y', 'Zr',
+      'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd',
+      'In', 'Sn', 'Sb', 'Te', 'I', 'Xe', 'Cs', 'Ba',
+      'La', 'Ce', 'Pr', 'Nd', 'Pm', 'Sm', 'Eu', 'Gd',
+      'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb', 'Lu', 'Hf',
+      'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg',
+      'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn', 'Fr', 'Ra',
+      'Ac', 'Th', 'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm',
+      'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No', 'Lr', 'Rf',
+      'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds', 'Rg', 'Cn',
+      'Nh', 'Fl', 'Mc', 'Lv', 'Ts', 'Og',
+   ),
+   'Name': (
+      'Hydrogen', 'Helium', 'Lithium', 'Beryllium', 'Boron', 'Carbon', 'Nitrogen', 'Oxygen',
+      'Fluorine', 'Neon', 'Sodium', 'Magnesium', 'Aluminum', 'Silicon', 'Phosphorus', 'Sulfur',
+      'Chlorine', 'Argon', 'Potassium', 'Calcium', 'Scandium', 'Titanium', 'Vanadium', 'Chromium',
+      'Manganese', 'Iron', 'Cobalt', 'Nickel', 'Copper', 'Zinc', 'Gallium', 'Germanium',
+      'Arsenic', 'Selenium', 'Bromine', 'Krypton', 'Rubidium', 'Strontium', 'Yttrium', 'Zirconium',
+      'Niobium', 'Molybdenum', 'Technetium', 'Ruthenium', 'Rhodium', 'Palladium', 'Silver', 'Cadmium',
+      'Indium', 'Tin', 'Antimony', 'Tellurium', 'Iodine', 'Xenon', 'Cesium', 'Barium',
+      'Lanthanum', 'Cerium', 'Praseodymium', 'Neodymium', 'Promethium', 'Samarium', 'Europium', 'Gadolinium',
+      'Terbium', 'Dysprosium', 'Holmium', 'Erbium', 'Thulium', 'Ytterbium', 'Lutetium', 'Hafnium',
+      'Tantalum', 'Tungsten', 'Rhenium', 'Osmium', 'Iridium', 'Platinum', 'Gold', 'Mercury',
+      'Thallium', 'Lead', 'Bismuth', 'Polonium', 'Astatine', 'Radon', 'Francium', 'Radium',
+      'Actinium', 'Thorium', 'Protactinium', 'Uranium', 'Neptunium', 'Plutonium', 'Americium', 'Curium',
+      'Berkelium', 'Californium', 'Einsteinium', 'Fermium', 'Mendelevium', 'Nobelium', 'Lawrencium', 'Rutherfordium',
+      'Dubnium', 'Seaborgium', 'Bohrium', 'Hassium', 'Meitnerium', 'Darmstadtium', 'Roentgenium', 'Copernicium',
+      'Nihonium', 'Flerovium', 'Moscovium', 'Livermorium', 'Tennessine', 'Oganesson',
+   ),
+   'AtomicMass': (
+      1.008, 4.0026, 7.0, 9.012183, 10.81, 12.011, 14.007, 15.999,
+      18.99840316, 20.18, 22.9897693, 24.305, 26.981538, 28.085, 30.973762, 32.07,
+      35.45, 39.9, 39.098, 40.08, 44.95591, 47.87, 50.941, 51.996,
+      54.93804, 55.84, 58.93319, 58.693, 63.55, 65.4, 69.72, 72.63,
+      74.92159, 78.97, 79.9, 83.8, 85.468, 87.6, 88.9058, 91.22,
+      92.9064, 96.0, 97.90721, 101.1, 102.9055, 106.4, 107.868, 112.41,
+      114.82, 118.71, 121.76, 127.6, 126.9045, 131.29, 132.905452, 137.33,
+      138.9055, 140.12, 140.9077, 144.24, 144.91276, 150.4, 151.96, 157.2,
+      158.92535, 162.5, 164.93033, 167.26, 168.93422, 173.04, 174.967, 178.5,
+      180.9479, 183.8, 186.21, 190.2, 192.22, 195.08, 196.96657, 200.59,
+      204.383, 207.0, 208.9804, 208.98243, 209.98715, 222.01758, 223.01973, 226.02541,
+      227.02775, 232.038, 231.0359, 238.0289, 237.04817, 244.0642, 243.06138, 247.07035,
+      247.07031, 251.07959, 252.083, 257.09511, 258.09843, 259.101, 262.11, 267.122,
+      268.126, 271.134, 274.144, 277.152, 278.156, 281.165, 282.169, 285.177,
+      286.183, 289.191, 290.196, 293.205, 294.211, 294.214,
+   ),
+   'CPKHexColor': (
+      'FFFFFF', 'D9FFFF', 'CC80FF', 'C2FF00', 'FFB5B5', '909090', '3050F8', 'FF0D0D',
+      '90E050', 'B3E3F5', 'AB5CF2', '8AFF00', 'BFA6A6', 'F0C8A0', 'FF8000', 'FFFF30',
+      '1FF01F', '80D1E3', '8F40D4', '3DFF00', 'E6E6E6', 'BFC2C7', 'A6A6AB', '8A99C7',
+      '9C7AC7', 'E06633', 'F090A0', '50D050', 'C88033', '7D80B0', 'C28F8F', '668F8F',
+      'BD80E3', 'FFA100', 'A62929', '5CB8D1', '702EB0', '00FF00', '94FFFF', '94E0E0',
+      '73C2C9', '54B5B5', '3B9E9E', '248F8F', '0A7D8C', '6985', 'C0C0C0', 'FFD98F',
+      'A67573', '668080', '9E63B5', 'D47A00', '940094', '429EB0', '57178F', '00C900',
+      '70D4FF', 'FFFFC7', 'D9FFC7', 'C7FFC7', 'A3FFC7', '8FFFC7', '61FFC7', '45FFC7',
+      '30FFC7', '1FFFC7', '00FF9C', nan, '00D452', '00BF38', '00AB24', '4DC2FF',
+      '4DA6FF', '2194D6', '267DAB', '266696', '175487', 'D0D0E0', 'FFD123', 'B8B8D0',
+      'A6544D', '575961', '9E4FB5', 'AB5C00', '754F45', '428296', '420066', '007D00',
+      '70ABFA', '00BAFF', '00A1FF', '008FFF', '0080FF', '006BFF', '545CF2', '785CE3',
+      '8A4FE3', 'A136D4', 'B31FD4', 'B31FBA', 'B30DA6', 'BD0D87', 'C70066', 'CC0059',
+      'D1004F', 'D90045', 'E00038', 'E6002E', 'EB0026', nan, nan, nan,
+      nan, nan, nan, nan, nan, nan,
+   ),
+   'ElectronConfiguration': (
+      '1s1', '1s2', '[He]2s1', '[He]2s2', '[He]2s2 2p1', '[He]2s2 2p2', '[He] 2s2 2p3', '[He]2s2 2p4',
+      '[He]2s2 2p5', '[He]2s2 2p6', '[Ne]3s1', '[Ne]3s2', '[Ne]3s2 3p1', '[Ne]3s2 3p2', '[Ne]3s2 3p3', '[Ne]3s2 3p4',
+      '[Ne]3s2 3p5', '[Ne]3s2 3p6', '[Ar]4s1', '[Ar]4s2', '[Ar]4s2 3d1', '[Ar]4s2 3d2', '[Ar]4s2 3d3', '[Ar]3d5 4s1',
+      '[Ar]4s2 3d5', '[Ar]4s2 3d6', '[Ar]4s2 3d7', '[Ar]4s2 3d8', '[Ar]4s1 3d10', '[Ar]4s2 3d10', '[Ar]4s2 3d10 4p1', '[Ar]4s2 3d10 4p2',
+      '[Ar]4s2 3d10 4p3', '[Ar]4s2 3d10 4p4', '[Ar]4s2 3d10 4p5', '[Ar]4s2 3d10 4p6', '[Kr]5s1', '[Kr]5s2', '[Kr]5s2 4d1', '[Kr]5s2 4d2',
+      '[Kr]5s1 4d4', '[Kr]5s1 4d5', '[Kr]5s2 4d5', '[Kr]5s1 4d7', '[Kr]5s1 4d8', '[Kr]4d10', '[Kr]5s1 4d10', '[Kr]5s2 4d10',
+      '[Kr]5s2 4d10 5p1', '[Kr]5s2 4d10 5p2', '[Kr]5s2 4d10 5p3', '[Kr]5s2 4d10 5p4', '[Kr]5s2 4d10 5p5', '[Kr]5s2 4d10 5p6', '[Xe]6s1', '[Xe]6s2',
+      '[Xe]6s2 5d1', '[Xe]6s2 4f1 5d1', '[Xe]6s2 4f3', '[Xe]6s2 4f4', '[Xe]6s2 4f5', '[Xe]6s2 4f6', '[Xe]6s2 4f7', '[Xe]6s2 4f7 5d1',
+      '[Xe]6s2 4f9', '[Xe]6s2 4f10', '[Xe]6s2 4f11', '[Xe]6s2 4f12', '[Xe]6s2 4f13', '[Xe]6s2 4f14', '[Xe]6s2 4f14 5d1', '[Xe]6s2 4f14 5d2',
+      '[Xe]6s2 4f14 5d3', '[Xe]6s2 4f14 5d4', '[Xe]6s2 4f14 5d5', '[Xe]6s2 4f14 5d6', '[Xe]6s2 4f14 5d7', '[Xe]6s1 4f14 5d9', '[Xe]6s1 4f14 5d10', '[Xe]6s2 4f14 5d10',
+      '[Xe]6s2 4f14 5d10 6p1', '[Xe]6s2 4f14 5d10 6p2', '[Xe]6s2 4f14 5d10 6p3', '[Xe]6s2 4f14 5d10 6p4', '[Xe]6s2 4f14 5d10 6p5', '[Xe]6s2 4f14 5d10 6p6', '[Rn]7s1', '[Rn]7s2',
+      '[Rn]7s2 6d1', '[Rn]7s2 6d2', '[Rn]7s2 5f2 6d1', '[Rn]7s2 5f3 6d1', '[Rn]7s2 5f4 6d1', '[Rn]7s2 5f6', '[Rn]7s2 5f7', '[Rn]7s2 5f7 6d1',
+      '[Rn]7s2 5f9', '[Rn]7s2 5f10', '[Rn]7s2 5f11', '[Rn] 5f12 7s2', '[Rn]7s2 5f13', '[Rn]7s2 5f14', '[Rn]7s2 5f14 6d1', '[Rn]7s2 5f14 6d2',
+      '[Rn]7s2 5f14 6d3', '[Rn]7s2 5f14 6d4', '[Rn]7s2 5f14 6d5', '[Rn]7s2 5f14 6d6', '[Rn]7s2 5f14 6d7 (calculated)', '[Rn]7s2 5f14 6d8 (predicted)', '[Rn]7s2 5f14 6d9 (predicted)', '[Rn]7s2 5f14 6d10 (predicted)',
+      '[Rn]5f14 6d10 7s2 7p1 (predicted)', '[Rn]7s2 7p2 5f14 6d10 (predicted)', '[Rn]7s2 7p3 5f14 6d10 (predicted)', '[Rn]7s2 7p4 5f14 6d10 (predicted)', '[Rn]7s2 7p5 5f14 6d10 (predicted)', '[Rn]7s2 7p6 5f14 6d10 (predicted)',
+   ),
+   'Electronegativity': (
+      2.2, nan, 0.98, 1.57, 2.04, 2.55, 3.04, 3.44,
+      3.98, nan, 0.93, 1.31, 1.61, 1.9, 2.19, 2.58,
+      3.16, nan, 0.82, 1.0, 1.36, 1.54, 1.63, 1.66,
+      1.55, 1.83, 1.88, 1.91, 1.9, 1.65, 1.81, 2.01,
+      2.18, 2.55, 2.96, 3.0, 0.82, 0.95, 1.22, 1.33,
+      1.6, 2.16, 1.9, 2.2, 2.28, 2.2, 1.93, 1.69,
+      1.78, 1.96, 2.05, 2.1, 2.66, 2.6, 0.79, 0.89,
+      1.1, 1.12, 1.13, 1.14, nan, 1.17, nan, 1.2,
+      nan, 1.22, 1.23, 1.24, 1.25, nan, 1.27, 1.3,
+      1.5, 2.36, 1.9, 2.2, 2.2, 2.28, 2.54, 2.0,
+      1.62, 2.33, 2.02, 2.0, 2.2, nan, 0.7, 0.9,
+      1.1, 1.3, 1.5, 1.38, 1.36, 1.28, 1.3, 1.3,
+      1.3, 1.3, 1.3, 1.3, 1.3, 1.3, 1.3, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan,
+   ),
+   'AtomicRadius': (
+      120.0, 140.0, 182.0, 153.0, 192.0, 170.0, 155.0, 152.0,
+      135.0, 154.0, 227.0, 173.0, 184.0, 210.0, 180.0, 180.0,
+      175.0, 188.0, 275.0, 231.0, 211.0, 187.0, 179.0, 189.0,
+      197.0, 194.0, 192.0, 163.0, 140.0, 139.0, 187.0, 211.0,
+      185.0, 190.0, 183.0, 202.0, 303.0, 249.0, 219.0, 186.0,
+      207.0, 209.0, 209.0, 207.0, 195.0, 202.0, 172.0, 158.0,
+      193.0, 217.0, 206.0, 206.0, 198.0, 216.0, 343.0, 268.0,
+      240.0, 235.0, 239.0, 229.0, 236.0, 229.0, 233.0, 237.0,
+      221.0, 229.0, 216.0, 235.0, 227.0, 242.0, 221.0, 212.0,
+      217.0, 210.0, 217.0, 216.0, 202.0, 209.0, 166.0, 209.0,
+      196.0, 202.0, 207.0, 197.0, 202.0, 220.0, 348.0, 283.0,
+      260.0, 237.0, 243.0, 240.0, 221.0, 243.0, 244.0, 245.0,
+      244.0, 245.0, 245.0, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan,
+   ),
+   'IonizationEnergy': (
+      13.598, 24.587, 5.392, 9.323, 8.298, 11.26, 14.534, 13.618,
+      17.423, 21.565, 5.139, 7.646, 5.986, 8.152, 10.487, 10.36,
+      12.968, 15.76, 4.341, 6.113, 6.561, 6.828, 6.746, 6.767,
+      7.434, 7.902, 7.881, 7.64, 7.726, 9.394, 5.999, 7.9,
+      9.815, 9.752, 11.814, 14.0, 4.177, 5.695, 6.217, 6.634,
+      6.759, 7.092, 7.28, 7.361, 7.459, 8.337, 7.576, 8.994,
+      5.786, 7.344, 8.64, 9.01, 10.451, 12.13, 3.894, 5.212,
+      5.577, 5.539, 5.464, 5.525, 5.55, 5.644, 5.67, 6.15,
+      5.864, 5.939, 6.022, 6.108, 6.184, 6.254, 5.426, 6.825,
+      7.89, 7.98, 7.88, 8.7, 9.1, 9.0, 9.226, 10.438,
+      6.108, 7.417, 7.289, 8.417, 9.5, 10.745, 3.9, 5.279,
+      5.17, 6.08, 5.89, 6.194, 6.266, 6.06, 5.993, 6.02,
+      6.23, 6.3, 6.42, 6.5, 6.58, 6.65, nan, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan,
+   ),
+   'ElectronAffinity': (
+      0.754, nan, 0.618, nan, 0.277, 1.263, nan, 1.461,
+      3.339, nan, 0.548, nan, 0.441, 1.385, 0.746, 2.077,
+      3.617, nan, 0.501, nan, 0.188, 0.079, 0.525, 0.666,
+      nan, 0.163, 0.661, 1.156, 1.228, nan, 0.3, 1.35,
+      0.81, 2.021, 3.365, nan, 0.468, nan, 0.307, 0.426,
+      0.893, 0.746, 0.55, 1.05, 1.137, 0.557, 1.302, nan,
+      0.3, 1.2, 1.07, 1.971, 3.059, nan, 0.472, nan,
+      0.5, 0.5, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      0.322, 0.815, 0.15, 1.1, 1.565, 2.128, 2.309, nan,
+      0.2, 0.36, 0.946, 1.9, 2.8, nan, 0.47, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan,
+   ),
+   'OxidationStates': (
+      '+1, -1', '0', '+1', '+2', '+3', '+4, +2, -4', '+5, +4, +3, +2, +1, -1, -2, -3', '-2',
+      '-1', '0', '+1', '+2', '+3', '+4, +2, -4', '+5, +3, -3', '+6, +4, -2',
+      '+7, +5, +1, -1', '0', '+1', '+2', '+3', '+4, +3, +2', '+5, +4, +3, +2', '+6, +3, +2',
+      '+7, +4, +3, +2', '+3, +2', '+3, +2', '+3, +2', '+2, +1', '+2', '+3', '+4, +2',
+      '+5, +3, -3', '+6, +4, -2', '+5, +1, -1', '0', '+1', '+2', '+3', '+4',
+      '+5, +3', '+6', '+7, +6, +4', '+3', '+3', '+3, +2', '+1', '+2',
+      '+3', '+4, +2', '+5, +3, -3', '+6, +4, -2', '+7, +5, +1, -1', '0', '+1', '+2',
+      '+3', '+4, +3', '+3', '+3', '+3', '+3, +2', '+3, +2', '+3',
+      '+3', '+3', '+3', '+3', '+3', '+3, +2', '+3', '+4',
+      '+5', '+6', '+7, +6, +4', '+4, +3', '+4, +3', '+4, +2', '+3, +1', '+2, +1',
+      '+3, +1', '+4, +2', '+5, +3', '+4, +2', '7, 5, 3, 1, -1', '0', '+1', '+2',
+      '+3', '+4', '+5, +4', '+6, +5, +4, +3', '+6, +5, +4, +3', '+6, +5, +4, +3', '+6, +5, +4, +3', '+3',
+      '+4, +3', '+3', '+3', '+3', '+3, +2', '+3, +2', '+3', '+4',
+      '5, 4, 3', '6, 5, 4, 3, 0', '7, 5, 4, 3', '8, 6, 5, 4, 3, 2', '9, 8, 6, 4, 3, 1', '8, 6, 4, 2, 0', '5, 3, 1, -1', '2, 1, 0',
+      nan, '6, 4,2, 1, 0', '3, 1', '+4, +2, -2', '+5, +3, +1, -1', '+6, +4, +2, +1, 0, -1',
+   ),
+   'StandardState': (
+      'Gas', 'Gas', 'Solid', 'Solid', 'Solid', 'Solid', 'Gas', 'Gas',
+      'Gas', 'Gas', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Gas', 'Gas', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Liquid', 'Gas', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Gas', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Liquid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Gas', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Solid',
+      'Solid', 'Solid', 'Solid', 'Solid', 'Solid', 'Expected to be a Solid', 'Expected to be a Solid', 'Expected to be a Solid',
+      'Expected to be a Solid', 'Expected to be a Solid', 'Expected to be a Solid', 'Expected to be a Solid', 'Expected to be a Solid', 'Expected to be a Gas',
+   ),
+   'MeltingPoint': (
+      13.81, 0.95, 453.65, 1560.0, 2348.0, 3823.0, 63.15, 54.36,
+      53.53, 24.56, 370.95, 923.0, 933.437, 1687.0, 317.3, 388.36,
+      171.65, 83.8, 336.53, 1115.0, 1814.0, 1941.0, 2183.0, 2180.0,
+      1519.0, 1811.0, 1768.0, 1728.0, 1357.77, 692.68, 302.91, 1211.4,
+      1090.0, 493.65, 265.95, 115.79, 312.46, 1050.0, 1795.0, 2128.0,
+      2750.0, 2896.0, 2430.0, 2607.0, 2237.0, 1828.05, 1234.93, 594.22,
+      429.75, 505.08, 903.78, 722.66, 386.85, 161.36, 301.59, 1000.0,
+      1191.0, 1071.0, 1204.0, 1294.0, 1315.0, 1347.0, 1095.0, 1586.0,
+      1629.0, 1685.0, 1747.0, 1802.0, 1818.0, 1092.0, 1936.0, 2506.0,
+      3290.0, 3695.0, 3459.0, 3306.0, 2719.0, 2041.55, 1337.33, 234.32,
+      577.0, 600.61, 544.55, 527.0, 575.0, 202.0, 300.0, 973.0,
+      1324.0, 2023.0, 1845.0, 1408.0, 917.0, 913.0, 1449.0, 1618.0,
+      1323.0, 1173.0, 1133.0, 1800.0, 1100.0, 1100.0, 1900.0, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan,
+   ),
+   'BoilingPoint': (
+      20.28, 4.22, 1615.0, 2744.0, 4273.0, 4098.0, 77.36, 90.2,
+      85.03, 27.07, 1156.0, 1363.0, 2792.0, 3538.0, 553.65, 717.75,
+      239.11, 87.3, 1032.0, 1757.0, 3109.0, 3560.0, 3680.0, 2944.0,
+      2334.0, 3134.0, 3200.0, 3186.0, 2835.0, 1180.0, 2477.0, 3106.0,
+      887.0, 958.0, 331.95, 119.93, 961.0, 1655.0, 3618.0, 4682.0,
+      5017.0, 4912.0, 4538.0, 4423.0, 3968.0, 3236.0, 2435.0, 1040.0,
+      2345.0, 2875.0, 1860.0, 1261.0, 457.55, 165.03, 944.0, 2170.0,
+      3737.0, 3697.0, 3793.0, 3347.0, 3273.0, 2067.0, 1802.0, 3546.0,
+      3503.0, 2840.0, 2973.0, 3141.0, 2223.0, 1469.0, 3675.0, 4876.0,
+      5731.0, 5828.0, 5869.0, 5285.0, 4701.0, 4098.0, 3129.0, 629.88,
+      1746.0, 2022.0, 1837.0, 1235.0, nan, 211.45, nan, 1413.0,
+      3471.0, 5061.0, nan, 4404.0, 4175.0, 3501.0, 2284.0, 3400.0,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan,
+   ),
+   'Density': (
+      8.988e-05, 0.0001785, 0.534, 1.85, 2.37, 2.267, 0.0012506, 0.001429,
+      0.001696, 0.0008999, 0.97, 1.74, 2.7, 2.3296, 1.82, 2.067,
+      0.003214, 0.0017837, 0.89, 1.54, 2.99, 4.5, 6.0, 7.15,
+      7.3, 7.874, 8.86, 8.912, 8.933, 7.134, 5.91, 5.323,
+      5.776, 4.809, 3.11, 0.003733, 1.53, 2.64, 4.47, 6.52,
+      8.57, 10.2, 11.0, 12.1, 12.4, 12.0, 10.501, 8.69,
+      7.31, 7.287, 6.685, 6.232, 4.93, 0.005887, 1.93, 3.62,
+      6.15, 6.77, 6.77, 7.01, 7.26, 7.52, 5.24, 7.9,
+      8.23, 8.55, 8.8, 9.07, 9.32, 6.9, 9.84, 13.3,
+      16.4, 19.3, 20.8, 22.57, 22.42, 21.46, 19.282, 13.5336,
+      11.8, 11.342, 9.807, 9.32, 7.0, 0.00973, nan, 5.0,
+      10.07, 11.72, 15.37, 18.95, 20.25, 19.84, 13.69, 13.51,
+      14.0, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan, nan, nan,
+      nan, nan, nan, nan, nan, nan,
+   ),
+   'GroupBlock': (
+      'Nonmetal', 'Noble gas', 'Alkali metal', 'Alkaline earth metal', 'Metalloid', 'Nonmetal', 'Nonmetal', 'Nonmetal',
+      'Halogen', 'Noble gas', 'Alkali metal', 'Alkaline earth metal', 'Post-transition metal', 'Metalloid', 'Nonmetal', 'Nonmetal',
+      'Halogen', 'Noble gas', 'Alkali metal', 'Alkaline earth metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal',
+      'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Post-transition metal', 'Metalloid',
+      'Metalloid', 'Nonmetal', 'Halogen', 'Noble gas', 'Alkali metal', 'Alkaline earth metal', 'Transition metal', 'Transition metal',
+      'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal',
+      'Post-transition metal', 'Post-transition metal', 'Metalloid', 'Metalloid', 'Halogen', 'Noble gas', 'Alkali metal', 'Alkaline earth metal',
+      'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide',
+      'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide', 'Lanthanide', 'Transition metal',
+      'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal',
+      'Post-transition metal', 'Post-transition metal', 'Post-transition metal', 'Metalloid', 'Halogen', 'Noble gas', 'Alkali metal', 'Alkaline earth metal',
+      'Actinide', 'Actinide', 'Actinide', 'Actinide', 'Actinide', 'Actinide', 'Actinide', 'Actinide',
+      'Actinide', 'Actinide', 'Actinide', 'Actinide', 'Actinide', 'Actinide', 'Actinide', 'Transition metal',
+      'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal', 'Transition metal',
+      'Post-transition metal', 'Post-transition metal', 'Post-transition metal', 'Post-transition metal', 'Halogen', 'Noble gas',
+   ),
+   'YearDiscovered': (
+      '1766', '1868', '1817', '1798', '1808', 'Ancient', '1772', '1774',
+      '1670', '1898', '1807', '1808', 'Ancient', '1854', '1669', 'Ancient',
+      '1774', '1894', '1807', 'Ancient', '1879', '1791', '1801', '1797',
+      '1774', 'Ancient', '1735', '1751', 'Ancient', '1746', '1875', '1886',
+      'Ancient', '1817', '1826', '1898', '1861', '1790', '1794', '1789',
+      '1801', '1778', '1937', '1827', '1803', '1803', 'Ancient', '1817',
+      '1863', 'Ancient', 'Ancient', '1782', '1811', '1898', '1860', '1808',
+      '1839', '1803', '1885', '1885', '1945', '1879', '1901', '1880',
+      '1843', '1886', '1878', '1843', '1879', '1878', '1907', '1923',
+      '1802', '1783', '1925', '1803', '1803', '1735', 'Ancient', 'Ancient',
+      '1861', 'Ancient', '1753', '1898', '1940', '1900', '1939', '1898',
+      '1899', '1828', '1913', '1789', '1940', '1940', '1944', '1944',
+      '1949', '1950', '1952', '1952', '1955', '1957', '1961', '1964',
+      '1967', '1974', '1976', '1984', '1982', '1994', '1994', '1996',
+      '2004', '1998', '2003', '2000', '2010', '2006',
+   ),
+}
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Compiling the periodic table CSV file into a Python module.
+
+This module only uses the standard library, and doesn't import anything
+from `chemsolve`, so that the package build can load it directly from
+its file to compile the periodic table, without installing (or even
+importing) any of the package's dependencies such as NumPy.
+"""
+import os
+import csv
+import hashlib
+
+# Create the paths to the periodic table and its compiled version.
+pt_path = os.path.join(os.path.dirname(__file__), "assets", "PT_complete.csv")
+compiled_path = os.path.join(os.path.dirname(__file__), "_periodic_data.py")
+
+def _csv_digest(path = pt_path):
+   """Returns the digest of the periodic table CSV file."""
+   with open(path, 'rb') as f:
+      return hashlib.sha1(f.read()).hexdigest()
+
+def _convert_column(values):
+   """Converts a column of CSV strings into ints, floats, or strings.
+
+   This follows the same conventions as `pandas.read_csv`, so missing
+   values are converted to NaN and a numeric column with any missing
+   values is converted to floats, so that the DataFrame built from the
+   loaded data is identical to one which was read from the CSV file.
+   """
+   present = [value for value in values if value != '']
+   for converter in (int, float):
+      try:
+         converted = [converter(value) for value in present]
+      except ValueError:
+         continue
+      else:
+         if converter is int and len(present) != len(values):
+            continue
+         converted = iter(converted)
+         return tuple(next(converted) if value != '' else float('nan')
+                      for value in values)
+   return tuple(value if value != '' else float('nan') for value in values)
+
+def read_table_csv(path = pt_path):
+   """Parses the periodic table CSV file into a dictionary of columns."""
+   with open(path, newline = '', encoding = 'utf-8') as f:
+      reader = csv.reader(f)
+      columns = next(reader)
+      rows = list(reader)
+   return {column: _convert_column([row[indx] for row in rows])
+           for indx, column in enumerate(columns)}
+
+def compile_periodic_table(path = pt_path, out_path = compiled_path):
+   """Compiles the periodic table CSV file into a Python module.
+
+   Parameters
+   ----------
+   path: str
+      The path to the periodic table CSV file.
+   out_path: str
+      The path of the Python module to write.
+   """
+   data = read_table_csv(path)
+   lines = [
+      "# -*- coding = utf-8 -*-",
+      "# Automatically generated from PT_complete.csv by "
+      "`chemsolve.utils.tabledata`,",
+      "# do not edit by hand. Rebuild using: python -m chemsolve.utils.tabledata",
+      "nan = float('nan')", "",
+      f"CSV_DIGEST = {_csv_digest(path)!r}", "",
+      "TABLE_DATA = {"
+   ]
+   for column, values in data.items():
+      lines.append(f"   {column!r}: (")
+      for indx in range(0, len(values), 8):
+         lines.append("      " + " ".join(
+            f"{value!r}," for value in values[indx:indx + 8]))
+      lines.append("   ),")
+   lines.append("}")
+   with open(out_path, 'w', encoding = 'utf-8') as f:
+      f.write("\n".join(lines) + "\n")
+
+if __name__ == '__main__':
+   compile_periodic_table()
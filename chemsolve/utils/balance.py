@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Balancing of chemical reactions by exact integer linear algebra.
+
+A reaction is balanced when, for each element (and for the charge), the
+atoms in the reactants equal the atoms in the products. Writing the
+counts of each element in each species as a composition matrix (with
+the reactant columns negated), the coefficients of the balanced reaction
+are a vector in the nullspace of the matrix with every entry positive.
+
+The matrix is reduced with fraction-free Gauss-Jordan elimination, where
+rows are only ever combined using integer multiples of each other (and
+divided by the greatest common divisor of their entries), so there is no
+rounding and the integers stay small. A reaction can then be balanced
+exactly when the nullspace has a single dimension, and the coefficients
+are read directly from the reduced matrix.
+"""
+import math
+import functools
+from collections import OrderedDict
+
+from chemsolve.utils.formula import get_species, canonical_key
+from chemsolve.utils.errors import InvalidCompoundError, InvalidReactionError
+
+__all__ = ['reaction_matrix', 'integer_nullspace', 'balance_stoichiometry']
+
+def _gcd(values):
+   """Returns the greatest common divisor of a sequence of integers."""
+   return functools.reduce(math.gcd, values, 0)
+
+def _lcm(first, second):
+   """Returns the least common multiple of two positive integers."""
+   return first * second // math.gcd(first, second)
+
+def _reaction_error(message):
+   """Returns an error for a reaction which cannot be balanced."""
+   return InvalidReactionError(message, property_type = "bypass")
+
+def reaction_matrix(reactants, products):
+   """Builds the composition matrix of the species in a reaction.
+
+   Examples
+   --------
+   >>> reaction_matrix(['H2', 'O2'], ['H2O'])
+   (['H', 'O'], [[-2, 0, 2], [0, -2, 1]])
+
+   Parameters
+   ----------
+   reactants: iterable
+      The formulas of the reactants.
+   products: iterable
+      The formulas of the products.
+
+   Returns
+   -------
+   A tuple containing the components (the elements in order of appearance,
+   followed by the charge if any of the species are charged) and a list
+   of the rows of the matrix, with the count of each component in each of
+   the reactants (negated) and then in each of the products.
+   """
+   species = []
+   try:
+      for formula in reactants:
+         species.append((get_species(formula), -1))
+      for formula in products:
+         species.append((get_species(formula), 1))
+   except InvalidCompoundError as e:
+      raise _reaction_error(f"Received an invalid reaction, {e}") from None
+
+   components = list(dict.fromkeys(
+      symbol for parsed, _ in species for symbol in parsed.elements))
+   matrix = [[sign * parsed.elements.get(symbol, 0) for parsed, sign in species]
+             for symbol in components]
+   if any(parsed.charge for parsed, _ in species):
+      components.append('charge')
+      matrix.append([sign * parsed.charge for parsed, sign in species])
+   return components, matrix
+
+def integer_nullspace(matrix, columns = None):
+   """Computes a basis of the integer nullspace of an integer matrix.
+
+   Examples
+   --------
+   >>> integer_nullspace([[-2, 0, 2], [0, -2, 1]])
+   [[2, 1, 2]]
+
+   Parameters
+   ----------
+   matrix: list
+      The rows of the matrix, as lists of integers.
+   columns: int
+      The number of columns of the matrix, only needed if it has no rows.
+
+   Returns
+   -------
+   A list of the basis vectors of the nullspace, each of which has integer
+   entries without a common divisor and a positive last non-zero entry.
+   """
+   rows = [[int(value) for value in row] for row in matrix]
+   columns = len(rows[0]) if rows else columns
+
+   # Reduce the matrix with fraction-free Gauss-Jordan elimination.
+   pivots = []
+   for column in range(columns):
+      rank = len(pivots)
+      pivot = next((indx for indx in range(rank, len(rows)) if rows[indx][column]), None)
+      if pivot is None:
+         continue
+      rows[rank], rows[pivot] = rows[pivot], rows[rank]
+      pivot_row = rows[rank]
+      for indx, row in enumerate(rows):
+         if indx != rank and row[column]:
+            factor, scale = row[column], pivot_row[column]
+            row = [scale * value - factor * pivot_value
+                   for value, pivot_value in zip(row, pivot_row)]
+            divisor = _gcd(row)
+            rows[indx] = [value // divisor for value in row] if divisor > 1 else row
+      pivots.append(column)
+
+   # Each free column gives a basis vector: setting the free variable to
+   # the least common multiple of the pivots keeps every entry an integer.
+   basis = []
+   for free in (column for column in range(columns) if column not in pivots):
+      multiple = functools.reduce(_lcm, (abs(rows[rank][pivot]) for rank, pivot
+                                         in enumerate(pivots) if rows[rank][free]), 1)
+      vector = [0] * columns
+      vector[free] = multiple
+      for rank, pivot in enumerate(pivots):
+         vector[pivot] = -rows[rank][free] * multiple // rows[rank][pivot]
+      divisor = _gcd(vector)
+      basis.append([value // divisor for value in vector])
+   return basis
+
+def balance_stoichiometry(reactants, products):
+   """Balances the stoichiometric coefficients of a reaction.
+
+   Examples
+   --------
+   >>> balance_stoichiometry(['CH4', 'O2'], ['CO2', 'H2O'])
+   (OrderedDict([('CH4', 1), ('O2', 2)]), OrderedDict([('CO2', 1), ('H2O', 2)]))
+
+   Parameters
+   ----------
+   reactants: iterable
+      The formulas of the reactants.
+   products: iterable
+      The formulas of the products.
+
+   Returns
+   -------
+   A tuple containing ordered dictionaries of the reactants and of the
+   products (in the order they were received), mapping each formula to
+   its coefficient, as the smallest positive integers which balance it.
+   """
+   reactants, products = list(dict.fromkeys(reactants)), list(dict.fromkeys(products))
+   if not reactants or not products:
+      raise _reaction_error("Received an invalid reaction, a reaction needs "
+                            "at least one reactant and one product.")
+   components, matrix = reaction_matrix(reactants, products)
+   species = reactants + products
+
+   # Compare the canonical keys, so that a species written differently on
+   # each side (e.g. OH and HO) is still found, as in `Reaction.__contains__`.
+   product_keys = {canonical_key(formula) for formula in products}
+   both = [formula for formula in reactants if canonical_key(formula) in product_keys]
+   if both:
+      raise _reaction_error(f"Received an invalid reaction, {', '.join(both)} "
+                            f"appears as both a reactant and a product.")
+
+   # Check that each element appears on both sides of the reaction.
+   for component, row in zip(components, matrix):
+      if component == 'charge':
+         continue
+      if not any(value < 0 for value in row):
+         raise _reaction_error(f"Received an invalid reaction, the element {component} "
+                               f"appears in the products but not in the reactants.")
+      if not any(value > 0 for value in row):
+         raise _reaction_error(f"Received an invalid reaction, the element {component} "
+                               f"appears in the reactants but not in the products.")
+
+   basis = integer_nullspace(matrix, len(species))
+   if not basis:
+      raise _reaction_error("The reaction cannot be balanced, there are no coefficients "
+                            "which balance all of its elements.")
+   if len(basis) > 1:
+      raise _reaction_error(f"The reaction has {len(basis)} independent ways of being "
+                            f"balanced, so its coefficients are not unique. Split it "
+                            f"into separate reactions.")
+   coefficients = basis[0]
+   if coefficients[-1] < 0:
+      coefficients = [-value for value in coefficients]
+   superfluous = [formula for formula, value in zip(species, coefficients) if value == 0]
+   if superfluous:
+      raise _reaction_error(f"The reaction cannot be balanced with {', '.join(superfluous)}, "
+                            f"which would have a coefficient of zero.")
+   if any(value < 0 for value in coefficients):
+      raise _reaction_error("The reaction cannot be balanced with all of its species on "
+                            "their given sides, some of the reactants or products would "
+                            "need negative coefficients.")
+   return (OrderedDict(zip(reactants, coefficients[:len(reactants)])),
+           OrderedDict(zip(products, coefficients[len(reactants):])))
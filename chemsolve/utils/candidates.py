@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Enumeration of the candidate formulas of a measured molar mass.
+
+Rather than trying every combination of element counts, the candidates
+are built one element at a time (from the heaviest to the lightest),
+keeping every partial formula whose mass can still reach the target.
+For each partial formula, the range of counts of the next element is
+computed directly from the lightest and heaviest masses which the
+remaining elements can add, so partial formulas which cannot reach the
+target are never created, and the lightest element (usually hydrogen)
+is solved directly rather than searched.
+"""
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from chemsolve.utils.formula import hill_order
+from chemsolve.utils.tabledata import atomic_numbers, get_column
+
+__all__ = ['Candidate', 'candidate_formulas', 'rdbe']
+
+# A single candidate formula: the formula (in Hill order), its molar
+# mass, the difference between its mass and the target mass, and its
+# ring-plus-double-bond equivalents (or None if it can't be computed).
+Candidate = namedtuple('Candidate', ['formula', 'mass', 'error', 'rdbe'])
+
+# The usual valence of the elements for which ring-plus-double-bond
+# equivalents can be calculated.
+_VALENCES = {'H': 1, 'D': 1, 'B': 3, 'C': 4, 'N': 3, 'O': 2, 'F': 1, 'Si': 4,
+             'P': 3, 'S': 2, 'Cl': 1, 'Se': 2, 'Br': 1, 'I': 1, 'Li': 1,
+             'Na': 1, 'K': 1, 'Mg': 2, 'Ca': 2}
+
+def _parse_element_bounds(elements):
+   """Converts the allowed elements into symbols and count bounds."""
+   if isinstance(elements, str):
+      elements = re.findall(r'[A-Z][a-z]?', elements)
+   if not isinstance(elements, dict):
+      elements = dict.fromkeys(elements)
+   symbols, minimums, maximums = [], [], []
+   for element, bounds in elements.items():
+      if bounds is None:
+         bounds = (0, None)
+      elif not isinstance(bounds, (tuple, list)):
+         bounds = (0, bounds)
+      if bounds[1] is not None and not 0 <= bounds[0] <= bounds[1]:
+         raise ValueError(f"Received invalid bounds {bounds} for element {element}.")
+      symbols.append(element)
+      minimums.append(bounds[0])
+      maximums.append(np.inf if bounds[1] is None else bounds[1])
+   numbers = atomic_numbers(symbols)
+   if len(set(numbers.tolist())) != len(numbers):
+      raise ValueError(f"Received duplicate elements in {symbols}.")
+   return numbers, np.array(minimums, dtype = float), np.array(maximums, dtype = float)
+
+def rdbe(counts, symbols):
+   """Calculates the ring-plus-double-bond equivalents of element counts.
+
+   Examples
+   --------
+   >>> rdbe([[6, 6], [2, 6]], ['C', 'H'])
+   array([4., 0.])
+
+   Parameters
+   ----------
+   counts: array_like
+      The counts of each element, either for a single formula or as
+      an (n_formulas x n_elements) array.
+   symbols: iterable
+      The symbols of the elements of the columns of `counts`.
+
+   Returns
+   -------
+   An array of the ring-plus-double-bond equivalents of each formula,
+   which is `1 + sum(n * (valence - 2)) / 2` over each of the elements.
+   """
+   try:
+      valences = np.array([_VALENCES[symbol] for symbol in symbols], dtype = float)
+   except KeyError as e:
+      raise ValueError(f"Cannot calculate the ring-plus-double-bond "
+                       f"equivalents of element {e.args[0]}.") from None
+   return 1 + np.asarray(counts) @ (valences - 2) / 2
+
+def candidate_formulas(mass, tolerance = 0.05, elements = 'CHNOS', rdbe_range = None,
+                       masses = None):
+   """Finds every formula with a molar mass close to a measured molar mass.
+
+   Examples
+   --------
+   >>> candidate_formulas(180.156, tolerance = 0.01, elements = 'CHO')[0]
+   Candidate(formula='C6H12O6', mass=180.15588, error=-0.0001..., rdbe=1.0)
+
+   Parameters
+   ----------
+   mass: float
+      The measured molar mass.
+   tolerance: float
+      The maximum difference between the measured molar mass and the
+      mass of a candidate formula, by default 0.05.
+   elements: str, iterable, or dict
+      The elements which candidate formulas can contain, either as a
+      string of symbols (e.g. 'CHNOS'), an iterable of elements, or a
+      dictionary mapping each element to its maximum count or to a
+      tuple of its minimum and maximum counts (with None for no limit).
+   rdbe_range: tuple
+      An optional (minimum, maximum) range of the ring-plus-double-bond
+      equivalents of the candidates. Candidates must then also have a
+      whole number of equivalents, as is the case for neutral molecules.
+   masses: array_like
+      The mass of each element, in order of atomic number, by default
+      the element masses used for `Compound.mass`.
+
+   Returns
+   -------
+   A list of the `Candidate` formulas, sorted from the smallest absolute
+   difference between their mass and the measured mass to the largest.
+   """
+   numbers, minimums, maximums = _parse_element_bounds(elements)
+   if masses is None:
+      from chemsolve.utils.composition import _mass_vector
+      masses = _mass_vector()
+   element_masses = np.asarray(masses, dtype = float)[numbers - 1]
+   symbols = get_column('Symbol')[numbers - 1].tolist()
+   if rdbe_range is not None:
+      # Check that the elements have valences before searching.
+      rdbe(np.zeros(len(symbols)), symbols)
+
+   # Build the formulas from the heaviest element to the lightest, with
+   # the lightest and heaviest masses which the remaining elements add.
+   order = np.argsort(-element_masses, kind = 'stable')
+   lightest = np.append(np.cumsum((minimums * element_masses)[order][::-1])[::-1][1:], 0.0)
+   heaviest = np.append(np.cumsum((maximums * element_masses)[order][::-1])[::-1][1:], 0.0)
+   lower, upper = mass - tolerance, mass + tolerance
+
+   partial_masses = np.zeros(1)
+   counts = np.zeros((1, 0), dtype = np.int64)
+   for step, column in enumerate(order):
+      element_mass = element_masses[column]
+      with np.errstate(invalid = 'ignore'):
+         low = np.ceil((lower - partial_masses - heaviest[step]) / element_mass)
+         high = np.floor((upper - partial_masses - lightest[step]) / element_mass)
+      low = np.maximum(np.nan_to_num(low, nan = 0.0, neginf = 0.0), minimums[column])
+      high = np.minimum(high, maximums[column])
+      sizes = np.maximum(high - low + 1, 0).astype(np.int64)
+
+      # Expand each partial formula by each of its possible counts.
+      rows = np.repeat(np.arange(len(sizes)), sizes)
+      offsets = np.arange(len(rows)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+      element_counts = low.astype(np.int64)[rows] + offsets
+      partial_masses = partial_masses[rows] + element_counts * element_mass
+      counts = np.column_stack([counts[rows], element_counts])
+      if not len(rows):
+         break
+
+   # Restore the original order of the elements, and discard empty formulas.
+   formula_counts = np.zeros((len(counts), len(numbers)), dtype = np.int64)
+   formula_counts[:, order[:counts.shape[1]]] = counts
+   keep = formula_counts.any(axis = 1) & (np.abs(partial_masses - mass) <= tolerance)
+   equivalents = rdbe(formula_counts, symbols) if all(
+      symbol in _VALENCES for symbol in symbols) else np.full(len(formula_counts), np.nan)
+   if rdbe_range is not None:
+      keep &= ((equivalents >= rdbe_range[0]) & (equivalents <= rdbe_range[1])
+               & (equivalents == np.floor(equivalents)))
+   formula_counts, partial_masses = formula_counts[keep], partial_masses[keep]
+   equivalents = equivalents[keep]
+
+   ranking = np.argsort(np.abs(partial_masses - mass), kind = 'stable')
+   hill = [symbols.index(symbol) for symbol in hill_order(symbols)]
+   candidates = []
+   for row in ranking.tolist():
+      row_counts = formula_counts[row].tolist()
+      formula = ''.join(f"{symbols[column]}{row_counts[column] if row_counts[column] != 1 else ''}"
+                        for column in hill if row_counts[column])
+      candidates.append(Candidate(formula, float(partial_masses[row]),
+                                  float(partial_masses[row] - mass),
+                                  None if np.isnan(equivalents[row]) else float(equivalents[row])))
+   return candidates
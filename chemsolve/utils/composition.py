@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Batch computations over the compositions of many formulas.
+
+A batch of formulas is parsed into a sparse composition matrix, with one
+row for each formula and one column for each element (column `j` is the
+element with atomic number `j + 1`), so that properties of the entire
+batch, such as the molar masses, are single matrix-vector products.
+"""
+import functools
+
+import numpy as np
+
+from chemsolve.utils.tabledata import _table_indexes, get_column
+from chemsolve.utils.formula import parse_formula, _element_masses
+from chemsolve.utils.errors import InvalidCompoundError
+
+__all__ = ['CompositionMatrix', 'composition_matrix', 'molar_masses']
+
+class CompositionMatrix(object):
+   """A sparse matrix of the element counts of a batch of formulas.
+
+   The matrix is stored in the compressed sparse row format: the counts
+   of row `i` are `data[indptr[i]:indptr[i + 1]]`, in the element columns
+   `indices[indptr[i]:indptr[i + 1]]`. Rows of invalid formulas are empty.
+
+   Parameters
+   ----------
+   data: np.ndarray
+      The non-zero element counts.
+   indices: np.ndarray
+      The column (atomic number minus one) of each count.
+   indptr: np.ndarray
+      The start of each row in `data` and `indices`, followed by their length.
+   """
+   __slots__ = ('data', 'indices', 'indptr', 'shape')
+
+   def __init__(self, data, indices, indptr):
+      self.data = np.asarray(data, dtype = np.int64)
+      self.indices = np.asarray(indices, dtype = np.int64)
+      self.indptr = np.asarray(indptr, dtype = np.int64)
+      self.shape = (len(self.indptr) - 1, len(get_column('AtomicNumber')))
+
+   def __len__(self):
+      return self.shape[0]
+
+   def __repr__(self):
+      return f"<CompositionMatrix ({self.shape[0]} formulas, {len(self.data)} entries)>"
+
+   def row_indices(self):
+      """Returns the row of each of the non-zero counts."""
+      return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+   def dot(self, vector):
+      """Returns the product of the matrix with a vector of element values.
+
+      Parameters
+      ----------
+      vector: array_like
+         A value for each element, in order of atomic number.
+
+      Returns
+      -------
+      An array containing the sum of the values of each row's elements,
+      weighted by their counts.
+      """
+      vector = np.asarray(vector, dtype = float)
+      return np.bincount(self.row_indices(), weights = self.data * vector[self.indices],
+                         minlength = self.shape[0])
+
+   def toarray(self):
+      """Returns the matrix as a dense integer array."""
+      dense = np.zeros(self.shape, dtype = np.int64)
+      dense[self.row_indices(), self.indices] = self.data
+      return dense
+
+   def tocsr(self):
+      """Returns the matrix as a `scipy.sparse.csr_matrix` (requires SciPy)."""
+      from scipy.sparse import csr_matrix
+      return csr_matrix((self.data, self.indices, self.indptr), shape = self.shape)
+
+@functools.lru_cache(maxsize = None)
+def _symbol_columns():
+   """Returns the composition matrix column of each element symbol."""
+   return {record.symbol: record.number - 1 for record in _table_indexes()[2].values()}
+
+@functools.lru_cache(maxsize = None)
+def _mass_vector():
+   """Returns the element masses used for compound masses, by atomic number.
+
+   These are the same masses as are used by `Compound`, so that the masses
+   of a batch are identical to the masses of the individual compounds.
+   """
+   masses = _element_masses()
+   vector = np.array([masses[symbol] for symbol in get_column('Symbol')], dtype = float)
+   vector.flags.writeable = False
+   return vector
+
+def composition_matrix(formulas):
+   """Parses a batch of formulas into a sparse composition matrix.
+
+   Each distinct formula is only parsed once, and invalid formulas are
+   reported for their row rather than stopping the rest of the batch.
+
+   Examples
+   --------
+   >>> matrix, errors = composition_matrix(['H2O', 'CO2', 'Xx'])
+   >>> matrix.toarray()[:, :8]
+   array([[2, 0, 0, 0, 0, 0, 0, 1],
+          [0, 0, 0, 0, 0, 1, 0, 2],
+          [0, 0, 0, 0, 0, 0, 0, 0]])
+   >>> errors
+   {2: InvalidCompoundError(...)}
+
+   Parameters
+   ----------
+   formulas: iterable
+      The chemical formulas, as strings.
+
+   Returns
+   -------
+   A tuple containing the `CompositionMatrix` of the formulas and a
+   dictionary mapping the row of each invalid formula to its error.
+   """
+   columns_of = _symbol_columns()
+   parsed = {}
+   errors = {}
+   indices, data, indptr = [], [], [0]
+   for row, formula in enumerate(formulas):
+      try:
+         columns, counts = parsed[formula]
+      except (KeyError, TypeError):
+         try:
+            elements = parse_formula(formula).elements
+         except InvalidCompoundError as e:
+            errors[row] = e
+            columns, counts = (), ()
+         else:
+            columns = tuple(columns_of[symbol] for symbol in elements)
+            counts = tuple(elements.values())
+            try:
+               parsed[formula] = columns, counts
+            except TypeError:
+               pass
+      indices.extend(columns)
+      data.extend(counts)
+      indptr.append(len(indices))
+   return CompositionMatrix(data, indices, indptr), errors
+
+def molar_masses(formulas):
+   """Computes the molar masses of a batch of formulas at once.
+
+   The masses are computed as the product of the composition matrix of
+   the formulas and the vector of atomic masses, so they are identical
+   to the masses of the individual `Compound` objects.
+
+   Examples
+   --------
+   >>> masses, errors = molar_masses(['H2O', 'Pb(NO3)2', 'H2$'])
+   >>> masses
+   array([ 18.01528, 331.2098 ,       nan])
+
+   Parameters
+   ----------
+   formulas: iterable
+      The chemical formulas, as strings.
+
+   Returns
+   -------
+   A tuple containing an array of the molar mass of each formula (NaN
+   for invalid formulas), and a dictionary mapping the row of each
+   invalid formula to its error.
+   """
+   matrix, errors = composition_matrix(formulas)
+   masses = matrix.dot(_mass_vector())
+   if errors:
+      masses[list(errors)] = np.nan
+   return masses, errors
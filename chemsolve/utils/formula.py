@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Parsing of chemical formulas.
+
+Formulas are parsed by a small tokenizer and a stack-based parser in a
+single pass over the formula, which supports nested groups using either
+parentheses or brackets (e.g. `K4[Fe(CN)6]`), hydrates and other adducts
+separated by a dot (e.g. `CuSO4·5H2O` or `CuSO4*5H2O`), charges (e.g.
+`SO4^2-`, `SO4-2`, or `Na+`), and states (e.g. `NaCl(aq)`). A sign which
+directly follows a count, as in `Fe3+` or `NO3-`, could be read either
+as the magnitude of the charge or as a count, so it is rejected; these
+are written as `Fe^3+` (or `Fe+3`) and `NO3^-` instead.
+
+Parsed formulas, along with their mass and unicode rendering, are kept
+in a bounded process-wide cache (`species_cache`), so that creating the
+same compound repeatedly only requires a single dictionary lookup.
+"""
+import re
+import types
+import threading
+import functools
+from collections import namedtuple, OrderedDict
+
+from chemsolve.utils.tabledata import _table_indexes
+from chemsolve.utils.errors import InvalidCompoundError
+from chemsolve.utils._unicode_constants import SUBSCRIPT_CONVERSION
+from chemsolve.utils._unicode_constants import SUPERSCRIPT_CONVERSION, SYMBOL_CONVERSION
+
+__all__ = ['ParsedFormula', 'parse_formula', 'formula_mass', 'render_formula',
+           'hill_order', 'hill_formula', 'canonical_key', 'canonical_keys',
+           'Species', 'SpeciesCache', 'species_cache', 'get_species']
+
+# The result of parsing a formula: the formula itself (without its charge
+# or state), a dictionary of the element counts in order of their first
+# appearance, the integer charge, and the state (or None).
+ParsedFormula = namedtuple('ParsedFormula', ['formula', 'elements', 'charge', 'state'])
+
+# A single token of a formula. Anything which is not one of the
+# valid tokens is matched as `invalid`, so that it can be reported.
+_FORMULA_TOKEN = re.compile(
+   r'(?P<element>[A-Z][a-z]?)|(?P<count>\d+)|(?P<open>[(\[])'
+   r'|(?P<close>[)\]])|(?P<separator>[·•*.])|(?P<invalid>.)')
+
+# A formula without any groups or adducts, e.g. `C6H12O6`, which
+# can be split into its elements and counts directly.
+_SIMPLE_FORMULA = re.compile(r'(?:[A-Z][a-z]?\d*)+')
+_SIMPLE_FORMULA_ELEMENT = re.compile(r'([A-Z][a-z]?)(\d*)')
+
+# The optional state and charge at the end of a formula. A trailing sign
+# directly after a count (e.g. `Fe3+`, which could be Fe with a charge
+# of 3+ or Fe3 with a charge of 1+) is ambiguous, and is rejected.
+_FORMULA_STATE = re.compile(r'\((?P<state>s|l|g|aq)\)$')
+_FORMULA_CHARGE = re.compile(
+   r'(?:\^\{?(?P<magnitude>\d*)(?P<sign>[+-])\}?'
+   r'|(?P<trailing_sign>[+-])(?P<trailing_magnitude>\d*))$')
+
+# The matching closing bracket for each opening bracket.
+_CLOSING_BRACKETS = {'(': ')', '[': ']'}
+
+@functools.lru_cache(maxsize = None)
+def _element_symbols():
+   """Returns the (case-sensitive) symbols of every element."""
+   return frozenset(record.symbol for record in _table_indexes()[0].values())
+
+def _split_suffixes(formula):
+   """Splits the state and charge from the end of a formula."""
+   state = None
+   match = _FORMULA_STATE.search(formula)
+   if match:
+      state = match.group('state')
+      formula = formula[:match.start()]
+   charge = 0
+   match = _FORMULA_CHARGE.search(formula)
+   if match:
+      if match.group('sign'):
+         sign, magnitude = match.group('sign'), match.group('magnitude')
+      else:
+         sign, magnitude = match.group('trailing_sign'), match.group('trailing_magnitude')
+         if not magnitude and formula[:match.start()][-1:].isdigit():
+            raise InvalidCompoundError(
+               f"Received an ambiguous charge in {formula}, where the count before the "
+               f"sign could be either a count or the charge. Write the charge with a "
+               f"caret (e.g. Fe^3+ or NO3^-), or with its magnitude after its sign "
+               f"(e.g. Fe+3 or NO3-1).", property_type = "bypass")
+      charge = int(magnitude or 1) * (-1 if sign == '-' else 1)
+      formula = formula[:match.start()]
+   return formula, charge, state
+
+def parse_formula(formula):
+   """Parses a chemical formula into its element counts.
+
+   Examples
+   --------
+   >>> parse_formula('Pb(NO3)2').elements
+   {'Pb': 1, 'N': 2, 'O': 6}
+   >>> parse_formula('CuSO4·5H2O').elements
+   {'Cu': 1, 'S': 1, 'O': 9, 'H': 10}
+   >>> parse_formula('SO4^2-(aq)')
+   ParsedFormula(formula='SO4', elements={'S': 1, 'O': 4}, charge=-2, state='aq')
+
+   Parameters
+   ----------
+   formula: str
+      The chemical formula, optionally followed by a charge and a state.
+
+   Returns
+   -------
+   A `ParsedFormula` containing the formula without its charge and state,
+   the number of atoms of each element, the charge, and the state.
+   """
+   if not isinstance(formula, str):
+      raise InvalidCompoundError(formula, property_type = "type")
+   body, charge, state = _split_suffixes(formula.replace(' ', ''))
+   symbols = _element_symbols()
+
+   if _SIMPLE_FORMULA.fullmatch(body):
+      # Most formulas have no groups, so don't need the full parser.
+      elements = {}
+      for symbol, count in _SIMPLE_FORMULA_ELEMENT.findall(body):
+         count = int(count) if count else 1
+         if symbol not in symbols or count == 0:
+            break
+         elements[symbol] = elements.get(symbol, 0) + count
+      else:
+         return ParsedFormula(body, elements, charge, state)
+
+   # Each group (and each part of an adduct) is counted separately on
+   # the stack, and merged into its parent once it has been completed.
+   # The last item of the stack is the group or part currently being
+   # parsed, while `last` holds what a following count applies to.
+   stack = [({}, None)]
+   part, coefficient = {}, 1
+   last = None
+   for match in _FORMULA_TOKEN.finditer(body):
+      kind, token = match.lastgroup, match.group()
+      if kind == 'element':
+         if token not in symbols:
+            raise InvalidCompoundError(
+               f"Received invalid element {token} in formula {formula}.",
+               property_type = "bypass")
+         stack[-1][0][token] = stack[-1][0].get(token, 0) + 1
+         last = ('element', token)
+      elif kind == 'count':
+         count = int(token)
+         if count == 0:
+            raise InvalidCompoundError(
+               f"Received a count of zero in formula {formula}.",
+               property_type = "bypass")
+         if last is None and len(stack) == 1 and not stack[0][0] and coefficient == 1:
+            # A leading count is the coefficient of an adduct, e.g. `5H2O`.
+            coefficient = count
+         elif last is None:
+            raise InvalidCompoundError(
+               f"Received unexpected count {token} in formula {formula}.",
+               property_type = "bypass")
+         elif last[0] == 'element':
+            stack[-1][0][last[1]] += count - 1
+         else:
+            for symbol, number in last[1].items():
+               stack[-1][0][symbol] += number * (count - 1)
+         last = None
+      elif kind == 'open':
+         stack.append(({}, _CLOSING_BRACKETS[token]))
+         last = None
+      elif kind == 'close':
+         group, closing = stack.pop() if len(stack) > 1 else (None, None)
+         if closing != token or not group:
+            raise InvalidCompoundError(
+               f"Received unbalanced or empty group in formula {formula}.",
+               property_type = "bypass")
+         for symbol, number in group.items():
+            stack[-1][0][symbol] = stack[-1][0].get(symbol, 0) + number
+         last = ('group', group)
+      elif kind == 'separator':
+         if len(stack) > 1 or not stack[0][0]:
+            break
+         for symbol, number in stack[0][0].items():
+            part[symbol] = part.get(symbol, 0) + number * coefficient
+         stack, coefficient, last = [({}, None)], 1, None
+      else:
+         break
+   else:
+      if len(stack) == 1 and stack[0][0]:
+         for symbol, number in stack[0][0].items():
+            part[symbol] = part.get(symbol, 0) + number * coefficient
+         return ParsedFormula(body, part, charge, state)
+   raise InvalidCompoundError(formula)
+
+@functools.lru_cache(maxsize = None)
+def _element_masses():
+   """Returns the atomic mass of each element used for compound masses.
+
+   Compound masses have always been computed using the element masses
+   of `periodictable`, which are kept here so that they don't change.
+   """
+   from periodictable import elements
+   return {element.symbol: element.mass for element in elements}
+
+def formula_mass(elements):
+   """Returns the molar mass of a dictionary of element counts."""
+   masses = _element_masses()
+   return sum(masses[symbol] * count for symbol, count in elements.items())
+
+def render_formula(parsed):
+   """Renders a parsed formula as unicode, e.g. `SO₄²⁻` or `CuSO₄·5H₂O`."""
+   rendered = []
+   for match in _FORMULA_TOKEN.finditer(parsed.formula):
+      token = match.group()
+      if match.lastgroup == 'count' and rendered and rendered[-1] not in '·•*.':
+         token = ''.join(SUBSCRIPT_CONVERSION[digit] for digit in token)
+      elif match.lastgroup == 'separator':
+         token = '·'
+      rendered.append(token)
+   if parsed.charge:
+      magnitude = str(abs(parsed.charge)) if abs(parsed.charge) != 1 else ''
+      rendered.append(''.join(SUPERSCRIPT_CONVERSION[digit] for digit in magnitude)
+                      + SYMBOL_CONVERSION['+' if parsed.charge > 0 else '-'])
+   if parsed.state:
+      rendered.append(f"({parsed.state})")
+   return ''.join(rendered)
+
+def hill_order(symbols):
+   """Sorts element symbols into Hill order.
+
+   In Hill order, carbon comes first and hydrogen second (if there is any
+   carbon), followed by every other element in alphabetical order.
+   """
+   symbols = sorted(symbols)
+   if 'C' in symbols:
+      head = ['C', 'H'] if 'H' in symbols else ['C']
+      symbols = head + [symbol for symbol in symbols if symbol not in head]
+   return symbols
+
+def hill_formula(parsed):
+   """Writes a parsed formula in Hill order, e.g. `C2H6` or `O4S^2-(aq)`.
+
+   Every formula with the same elements, counts, charge, and state has the
+   same Hill formula, regardless of how it was written (e.g. `C2H6`, `H6C2`,
+   and `CH3CH3`), so it can be used as the canonical key of the formula.
+   """
+   elements = parsed.elements
+   formula = ''.join(f"{symbol}{elements[symbol] if elements[symbol] != 1 else ''}"
+                     for symbol in hill_order(elements))
+   if parsed.charge:
+      magnitude = abs(parsed.charge) if abs(parsed.charge) != 1 else ''
+      formula += f"^{magnitude}{'+' if parsed.charge > 0 else '-'}"
+   if parsed.state:
+      formula += f"({parsed.state})"
+   return formula
+
+def canonical_key(formula):
+   """Returns the canonical (Hill order) key of a formula.
+
+   Examples
+   --------
+   >>> canonical_key('CH3CH3') == canonical_key('H6C2') == 'C2H6'
+   True
+   """
+   return species_cache.get(formula).key
+
+def canonical_keys(formulas):
+   """Returns the canonical (Hill order) keys of a batch of formulas.
+
+   Each distinct formula is only parsed once, so deduplicating formulas
+   written in different ways is a set operation over the keys.
+
+   Examples
+   --------
+   >>> keys, errors = canonical_keys(['C2H6', 'H6C2', 'CH3CH3', 'H2O'])
+   >>> len(set(keys))
+   2
+
+   Parameters
+   ----------
+   formulas: iterable
+      The chemical formulas, as strings.
+
+   Returns
+   -------
+   A tuple containing a list of the canonical key of each formula (None
+   for invalid formulas), and a dictionary mapping the row of each
+   invalid formula to its error.
+   """
+   computed, keys, errors = {}, [], {}
+   for row, formula in enumerate(formulas):
+      try:
+         key = computed[formula]
+      except (KeyError, TypeError):
+         try:
+            key = hill_formula(parse_formula(formula))
+         except InvalidCompoundError as e:
+            errors[row], key = e, None
+         else:
+            try:
+               computed[formula] = key
+            except TypeError:
+               pass
+      keys.append(key)
+   return keys, errors
+
+class Species(object):
+   """An immutable parsed species, shared by every compound of its formula.
+
+   A species holds the parsed formula's fields (the formula without its
+   charge or state, the read-only element counts, the charge, and the
+   state), along with its molar mass and its canonical (Hill order) key.
+   The mass fraction of each element and the unicode rendering are only
+   computed when they are first accessed, since most species never need
+   them, and are then kept for every compound which shares the species.
+   """
+   __slots__ = ('_formula', '_elements', '_charge', '_state', '_mass', '_key',
+                '_fractions', '_rendered')
+
+   def __init__(self, parsed):
+      self._formula = parsed.formula
+      self._elements = types.MappingProxyType(parsed.elements)
+      self._charge, self._state = parsed.charge, parsed.state
+      self._mass = formula_mass(parsed.elements)
+      self._key = hill_formula(parsed)
+      self._fractions = self._rendered = None
+
+   formula = property(lambda self: self._formula)
+   elements = property(lambda self: self._elements)
+   charge = property(lambda self: self._charge)
+   state = property(lambda self: self._state)
+   mass = property(lambda self: self._mass)
+   key = property(lambda self: self._key)
+
+   @property
+   def fractions(self):
+      # The (read-only) mass fraction of each element.
+      if self._fractions is None:
+         masses = _element_masses()
+         self._fractions = types.MappingProxyType(
+            {symbol: masses[symbol] * count / self._mass
+             for symbol, count in self._elements.items()})
+      return self._fractions
+
+   @property
+   def rendered(self):
+      # The unicode rendering of the species, e.g. `SO₄²⁻`.
+      if self._rendered is None:
+         self._rendered = render_formula(
+            ParsedFormula(self._formula, self._elements, self._charge, self._state))
+      return self._rendered
+
+   def __reduce__(self):
+      # Pickle the parsed formula, from which the species is recreated.
+      return (Species, (ParsedFormula(self._formula, dict(self._elements),
+                                      self._charge, self._state),))
+
+   def __repr__(self):
+      return (f"Species(formula={self._formula!r}, elements={dict(self._elements)!r}, "
+              f"charge={self._charge!r}, state={self._state!r}, mass={self._mass!r})")
+
+# The statistics of a `SpeciesCache`, as with `functools.lru_cache`.
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class SpeciesCache(object):
+   """A bounded, thread-safe, least recently used cache of parsed species.
+
+   Examples
+   --------
+   >>> cache = SpeciesCache(maxsize = 2)
+   >>> cache.get('H2O').mass
+   18.01528
+   >>> cache.cache_info()
+   CacheInfo(hits=0, misses=1, maxsize=2, currsize=1)
+
+   Parameters
+   ----------
+   maxsize: int
+      The maximum number of species to keep, or None for no limit.
+   """
+   def __init__(self, maxsize = 4096):
+      self._species = OrderedDict()
+      self._lock = threading.Lock()
+      self._maxsize = None
+      self.hits = self.misses = 0
+      self.maxsize = maxsize
+
+   @property
+   def maxsize(self):
+      return self._maxsize
+
+   @maxsize.setter
+   def maxsize(self, maxsize):
+      # Changing the size evicts the least recently used species.
+      if maxsize is not None and maxsize < 0:
+         raise ValueError(f"Received invalid cache size {maxsize}, "
+                          f"expected a non-negative integer or None.")
+      with self._lock:
+         self._maxsize = maxsize
+         self._evict()
+
+   def _evict(self):
+      # Remove the least recently used species until the cache fits.
+      while self._maxsize is not None and len(self._species) > self._maxsize:
+         self._species.popitem(last = False)
+
+   def get(self, formula):
+      """Returns the parsed species for a formula, parsing it if necessary."""
+      with self._lock:
+         try:
+            species = self._species[formula]
+         except KeyError:
+            self.misses += 1
+         except TypeError:
+            raise InvalidCompoundError(formula, property_type = "type")
+         else:
+            self.hits += 1
+            self._species.move_to_end(formula)
+            return species
+
+      # Parse outside of the lock, since invalid formulas raise errors.
+      species = Species(parse_formula(formula))
+      with self._lock:
+         self._species[formula] = species
+         self._evict()
+      return species
+
+   def cache_info(self):
+      """Returns the hits, misses, maximum size, and current size of the cache."""
+      with self._lock:
+         return CacheInfo(self.hits, self.misses, self._maxsize, len(self._species))
+
+   def clear(self):
+      """Removes every species from the cache and resets its statistics."""
+      with self._lock:
+         self._species.clear()
+         self.hits = self.misses = 0
+
+   def __len__(self):
+      return len(self._species)
+
+   def __contains__(self, formula):
+      return formula in self._species
+
+# The process-wide cache used by `Compound`.
+species_cache = SpeciesCache()
+
+def get_species(formula):
+   """Returns the parsed species for a formula from the process-wide cache.
+
+   Parameters
+   ----------
+   formula: str
+      The chemical formula, optionally followed by a charge and a state.
+
+   Returns
+   -------
+   An immutable `Species` containing the parsed formula, its molar
+   mass, the mass fraction of each element, and its unicode rendering.
+   """
+   return species_cache.get(formula)
@@ -1,67 +1,210 @@
-import sys
 import operator
 
-from math import isclose
-from math import floor, ceil
+import numpy as np
+
+from chemsolve.utils.tabledata import get_column, atomic_numbers
 
 # Methods used by the former FormulaCompound class.
 # Returns the empirical/molecular formula of a compound based on the elements in it.
 
-def determine_empirical_coef(compound_elements):
-   '''
-   Returns the coefficients of the empirical formula of the element.
-   '''
-   coef_list = []
+def solve_empirical(moles, tolerance = 0.1, max_subscript = 100):
+   """Finds the integer subscripts of empirical formulas from mole amounts.
+
+   The mole amounts of each sample are divided by the smallest non-zero
+   amount, and the subscripts are then the smallest integer multiple of
+   these ratios which has every subscript within `tolerance` of an integer,
+   i.e., the best rational approximation of the ratios with a common
+   denominator. The search is bounded by `max_subscript`, so noisy data
+   fails quickly rather than searching indefinitely, and every sample is
+   solved at once.
+
+   Examples
+   --------
+   >>> solve_empirical([[4.757, 6.111, 0.6797, 1.699]])
+   (array([[14, 18,  2,  5]]), {})
+
+   Parameters
+   ----------
+   moles: array_like
+      The mole amounts of each element, either for a single sample or as
+      an (n_samples x n_elements) array. Missing elements can be zero or NaN.
+   tolerance: float
+      The maximum difference between a scaled ratio and its integer subscript.
+   max_subscript: int
+      The largest subscript (and therefore multiplier) which is searched.
+
+   Returns
+   -------
+   A tuple containing an integer array of the subscripts of each sample
+   (zero for samples which could not be solved), and a dictionary mapping
+   each sample which could not be solved to its error.
+   """
+   moles = np.atleast_2d(np.asarray(moles, dtype = float))
+   moles = np.where(np.isnan(moles) | (moles < 0), 0.0, moles)
+   present = moles > 0
+   with np.errstate(invalid = 'ignore', divide = 'ignore'):
+      least = np.where(present, moles, np.inf).min(axis = 1, keepdims = True)
+      ratios = moles / least
+
+   subscripts = np.zeros(moles.shape, dtype = np.int64)
+   unsolved = np.flatnonzero(present.any(axis = 1))
+   for multiplier in range(1, max_subscript + 1):
+      if not len(unsolved):
+         break
+      scaled = ratios[unsolved] * multiplier
+      rounded = np.rint(scaled)
+      solved = ((np.abs(scaled - rounded) <= tolerance) & (rounded <= max_subscript)
+                | ~present[unsolved]).all(axis = 1)
+      subscripts[unsolved[solved]] = rounded[solved]
+      unsolved = unsolved[~solved]
+
+   errors = {}
+   for sample in np.flatnonzero(~subscripts.any(axis = 1)):
+      if not present[sample].any():
+         errors[int(sample)] = ValueError(f"Received sample {sample} without any elements.")
+      else:
+         errors[int(sample)] = ValueError(
+            f"Could not find integer subscripts within {tolerance} for sample "
+            f"{sample} with a subscript of at most {max_subscript}.")
+   return subscripts, errors
+
+def empirical_formulas(amounts, elements, basis = 'percent', tolerance = 0.1, max_subscript = 100):
+   """Determines the empirical formulas of many samples at once.
+
+   Examples
+   --------
+   >>> empirical_formulas([[0.5714, 0.0616, 0.0952, 0.2718],
+   ...                     [0.7595, 0.0633, 0.1772, 0.0]], ['C', 'H', 'N', 'O'])
+   (['C14H18N2O5', 'C5H5N'], {})
+
+   Parameters
+   ----------
+   amounts: array_like
+      An (n_samples x n_elements) array of the percents, grams, or moles
+      of each element in each sample.
+   elements: iterable
+      The elements of the columns of `amounts`, as `Element` objects,
+      symbols, names, or atomic numbers.
+   basis: str
+      What the amounts are: 'percent', 'grams', or 'moles'.
+   tolerance: float
+      The maximum difference between a scaled ratio and its integer subscript.
+   max_subscript: int
+      The largest subscript (and therefore multiplier) which is searched.
+
+   Returns
+   -------
+   A tuple containing a list of the empirical formula of each sample (None
+   for samples which could not be solved), and a dictionary mapping each
+   sample which could not be solved to its error.
+   """
+   numbers, subscripts, errors = _solve_amounts(amounts, elements, basis, tolerance, max_subscript)
+   return _format_formulas(numbers, subscripts, errors), errors
+
+def _solve_amounts(amounts, elements, basis, tolerance, max_subscript):
+   """Solves the empirical subscripts of a table of element amounts."""
+   if basis not in ['percent', 'grams', 'moles']:
+      raise ValueError(f"Received invalid basis {basis}, expected one "
+                       f"of 'percent', 'grams', or 'moles'.")
+   numbers = atomic_numbers(elements)
+   amounts = np.atleast_2d(np.asarray(amounts, dtype = float))
+   if amounts.shape[1] != len(numbers):
+      raise ValueError(f"Received {amounts.shape[1]} columns of amounts "
+                       f"for {len(numbers)} elements.")
+   moles = amounts if basis == 'moles' else amounts / get_column('AtomicMass')[numbers - 1]
+   subscripts, errors = solve_empirical(moles, tolerance, max_subscript)
+   return numbers, subscripts, errors
+
+def _format_formulas(numbers, subscripts, errors):
+   """Writes the formula of each row of subscripts, or None for errors."""
+   symbols = get_column('Symbol')[numbers - 1]
+   return [None if sample in errors else ''.join(
+              f"{symbol}{count if count != 1 else ''}"
+              for symbol, count in zip(symbols, row) if count)
+           for sample, row in enumerate(subscripts.tolist())]
+
+def molecular_formulas(amounts, elements, molar_masses = None, basis = 'percent',
+                       tolerance = 0.1, max_subscript = 100):
+   """Determines the empirical and molecular formulas of many samples at once.
+
+   This is the batch equivalent of `Compound.from_formula`: the empirical
+   formulas are solved for every sample at once, and where a measured molar
+   mass is provided, the molecular formula is the empirical formula scaled
+   by the (integer) ratio of the molar mass to the empirical formula's mass.
+
+   Examples
+   --------
+   >>> molecular_formulas([[0.7595, 0.1772, 0.0633], [0.7595, 0.1772, 0.0633]],
+   ...                    ['C', 'N', 'H'], molar_masses = [240, np.nan])
+   (['C5NH5', 'C5NH5'], ['C15N3H15', None], {})
+
+   Parameters
+   ----------
+   amounts: array_like
+      An (n_samples x n_elements) array of the percents, grams, or moles
+      of each element in each sample.
+   elements: iterable
+      The elements of the columns of `amounts`, as `Element` objects,
+      symbols, names, or atomic numbers.
+   molar_masses: array_like
+      The measured molar mass of each sample, or NaN where it is unknown.
+   basis: str
+      What the amounts are: 'percent', 'grams', or 'moles'.
+   tolerance: float
+      The maximum difference between a scaled ratio and its integer subscript.
+   max_subscript: int
+      The largest subscript of the empirical formulas which is searched.
+
+   Returns
+   -------
+   A tuple containing a list of the empirical formula of each sample, a
+   list of the molecular formula of each sample (None where the molar
+   mass is unknown), and a dictionary mapping each sample which could not
+   be solved to its error.
+   """
+   from chemsolve.utils.composition import _mass_vector
+
+   numbers, subscripts, errors = _solve_amounts(amounts, elements, basis, tolerance, max_subscript)
+   empirical = _format_formulas(numbers, subscripts, errors)
+   if molar_masses is None:
+      return empirical, [None] * len(empirical), errors
+
+   # Scale each empirical formula by the ratio of the masses, which
+   # should be an integer (within the precision of the measurement).
+   molar_masses = np.broadcast_to(np.asarray(molar_masses, dtype = float), (len(subscripts),))
+   empirical_masses = subscripts @ _mass_vector()[numbers - 1]
+   with np.errstate(invalid = 'ignore', divide = 'ignore'):
+      ratios = np.round(molar_masses / empirical_masses, 1)
+   for sample in np.flatnonzero(~np.isnan(molar_masses)):
+      if sample not in errors and (ratios[sample] < 1 or not ratios[sample].is_integer()):
+         errors[int(sample)] = ValueError(
+            f"The molar mass {molar_masses[sample]} of sample {sample} is not an integer "
+            f"multiple of its empirical mass {empirical_masses[sample]:.4f}.")
+   known = ~np.isnan(molar_masses)
+   multipliers = np.where(known & np.isfinite(ratios), ratios, 0).astype(np.int64)
+   molecular = _format_formulas(numbers, subscripts * multipliers[:, np.newaxis], errors)
+   return empirical, [formula if known[sample] else None
+                      for sample, formula in enumerate(molecular)], errors
+
+def determine_empirical_coef(compound_elements, tolerance = 0.1, max_subscript = 100):
+   """Returns the coefficients of the empirical formula of the elements.
+
+   Each of the elements should have one of a percent, gram amount, or
+   mole amount, from which its number of moles is calculated.
+   """
+   moles = []
    for element in compound_elements:
-      if element.percent_of != False:
-         coef_list.append(operator.truediv(operator.mul(element.percent_of, 100), element.mass))
-      if element.gram_amount != False:
-         coef_list.append(operator.truediv(element.gram_amount, element.mass))
-      if element.mole_amount != False:
-         coef_list.append(element.mole_amount)
-
-   least = sys.maxsize
-   for item in coef_list:
-      if item < least:
-         least = item
-   coef_list_2 = []
-   solved = True
-   for item in coef_list:
-      t = round(operator.truediv(item, least), 2)
-      if not isclose(t, floor(t), abs_tol=10 ** -1) and not isclose(t, ceil(t), abs_tol=10 ** -1):
-         solved = False
-         coef_list_2.append(t)
+      if getattr(element, 'percent_of', False):
+         moles.append(operator.truediv(operator.mul(element.percent_of, 100), element.mass))
+      elif getattr(element, 'gram_amount', False):
+         moles.append(operator.truediv(element.gram_amount, element.mass))
       else:
-         coef_list_2.append(round(t, 1))
-
-   factor = 2
-   coef_list_3 = coef_list_2.copy()
-   coef_list_4 = []
-   overall_solved = True
-   while solved == False:
-      overall_solved = False
-      if solved == False:
-         for item in coef_list_3:
-            if not isclose(item, floor(item), abs_tol=10 ** -1) and not isclose(item, ceil(item), abs_tol=10 ** -1):
-               z = True
-               while z == True:
-                  if round(operator.mul(item, factor), 1).is_integer():
-                     z = False
-                  else:
-                     factor += 1
-         for item in coef_list_3:
-            coef_list_4.append(round(operator.mul(item, factor), 1))
-         coef_list_3 = coef_list_4.copy()
-         coef_list_4 = []
-         for t in coef_list_3:
-            if not isclose(t, floor(t), abs_tol=10 ** -1) and not isclose(t, ceil(t), abs_tol=10 ** -1):
-               solved = False
-            else:
-               solved = True
+         moles.append(getattr(element, 'mole_amount', False) or 0)
 
-   if overall_solved == False:
-      return coef_list_3
-   return coef_list_2
+   subscripts, errors = solve_empirical(moles, tolerance, max_subscript)
+   if errors:
+      raise errors[0]
+   return subscripts[0].tolist()
 
 
 def determine_empirical(compound_elements, empirical_coef):
@@ -89,7 +232,9 @@ def determine_empirical(compound_elements, empirical_coef):
             if int(coef) != 1:
                form += str(int(coef))
             next = False
-      else: pass
+      else:
+         # The element was already written as part of a group.
+         next = False
 
    return form
 
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Monoisotopic masses and isotopic distributions of formulas.
+
+The isotopic distribution of a formula is the product of the isotopic
+distributions of each of its atoms, i.e., a polynomial convolution. The
+distribution of `n` atoms of an element is computed by repeated squaring
+(so only about `log2(n)` convolutions are needed), and after each of the
+convolutions, peaks which are closer together than the resolution are
+merged and peaks which are less probable than the cutoff are discarded,
+so the number of peaks stays small even for very large formulas.
+
+The isotope masses and natural abundances are those of `periodictable`,
+which also provides the element masses used for `Compound.mass`.
+"""
+import functools
+from collections import namedtuple
+
+import numpy as np
+
+from chemsolve.utils.formula import get_species
+from chemsolve.utils.tabledata import get_column
+from chemsolve.utils.errors import InvalidCompoundError
+
+__all__ = ['IsotopePattern', 'monoisotopic_mass', 'monoisotopic_masses',
+           'isotope_pattern', 'isotope_patterns']
+
+# An isotopic distribution: an array of the mass of each peak, in
+# increasing order, and an array of the probability of each peak.
+IsotopePattern = namedtuple('IsotopePattern', ['masses', 'abundances'])
+
+@functools.lru_cache(maxsize = None)
+def _isotopes():
+   """Returns the masses and abundances of the natural isotopes of each element."""
+   from periodictable import elements
+   isotopes = {}
+   for element in elements:
+      natural = [isotope for isotope in element if isotope.abundance > 0]
+      if natural:
+         abundances = np.array([isotope.abundance for isotope in natural], dtype = float)
+         isotopes[element.symbol] = IsotopePattern(
+            np.array([isotope.mass for isotope in natural], dtype = float),
+            abundances / abundances.sum())
+   return isotopes
+
+def _no_isotopes_error(symbol):
+   """Returns the error for an element without any natural isotopes."""
+   return InvalidCompoundError(
+      f"Received element {symbol} without any naturally abundant isotopes.",
+      property_type = "bypass")
+
+def _element_isotopes(symbol):
+   """Returns the natural isotopes of an element, or raises an error."""
+   try:
+      return _isotopes()[symbol]
+   except KeyError:
+      raise _no_isotopes_error(symbol) from None
+
+@functools.lru_cache(maxsize = None)
+def _monoisotopic_vector():
+   """Returns the mass of the most abundant isotope of each element, by atomic number.
+
+   Elements without any naturally abundant isotopes have a mass of NaN.
+   """
+   isotopes = _isotopes()
+   vector = np.array([isotopes[symbol].masses[np.argmax(isotopes[symbol].abundances)]
+                      if symbol in isotopes else np.nan
+                      for symbol in get_column('Symbol')], dtype = float)
+   vector.flags.writeable = False
+   return vector
+
+def _prune(masses, abundances, resolution, cutoff):
+   """Merges peaks within the resolution and discards peaks below the cutoff."""
+   order = np.argsort(masses, kind = 'stable')
+   masses, abundances = masses[order], abundances[order]
+   if resolution > 0 and len(masses) > 1:
+      # Peaks are merged into their abundance-weighted mean mass.
+      groups = np.concatenate([[0], np.cumsum(np.diff(masses) > resolution)])
+      merged = np.bincount(groups, weights = abundances)
+      masses = np.bincount(groups, weights = masses * abundances) / np.where(merged > 0, merged, 1)
+      abundances = merged
+   keep = abundances >= cutoff
+   return masses[keep], abundances[keep]
+
+def _convolve(first, second, resolution, cutoff):
+   """Returns the distribution of the sum of two independent distributions."""
+   masses = np.add.outer(first.masses, second.masses).ravel()
+   abundances = np.multiply.outer(first.abundances, second.abundances).ravel()
+   return IsotopePattern(*_prune(masses, abundances, resolution, cutoff))
+
+@functools.lru_cache(maxsize = 1024)
+def _element_pattern(symbol, count, resolution, cutoff):
+   """Returns the isotopic distribution of `count` atoms of an element."""
+   power = _element_isotopes(symbol)
+   result = None
+   while True:
+      if count & 1:
+         result = power if result is None else _convolve(result, power, resolution, cutoff)
+      count >>= 1
+      if not count:
+         return result
+      power = _convolve(power, power, resolution, cutoff)
+
+def monoisotopic_mass(formula):
+   """Returns the monoisotopic mass of a formula.
+
+   This is the mass of the formula when each of its atoms is the most
+   abundant isotope of its element, as is measured by mass spectrometry
+   (rather than the average molar mass of `Compound.mass`).
+
+   Examples
+   --------
+   >>> monoisotopic_mass('C6H12O6')
+   180.0633881...
+
+   Parameters
+   ----------
+   formula: str
+      The chemical formula.
+
+   Returns
+   -------
+   The monoisotopic mass of the formula.
+   """
+   from chemsolve.utils.composition import _symbol_columns
+   vector, columns = _monoisotopic_vector(), _symbol_columns()
+   mass = 0.0
+   for symbol, count in get_species(formula).elements.items():
+      if np.isnan(vector[columns[symbol]]):
+         raise _no_isotopes_error(symbol)
+      mass += vector[columns[symbol]] * count
+   return float(mass)
+
+def monoisotopic_masses(formulas):
+   """Computes the monoisotopic masses of a batch of formulas at once.
+
+   Parameters
+   ----------
+   formulas: iterable
+      The chemical formulas, as strings.
+
+   Returns
+   -------
+   A tuple containing an array of the monoisotopic mass of each formula
+   (NaN for invalid formulas, or formulas containing elements without
+   naturally abundant isotopes), and a dictionary mapping the row of
+   each invalid formula to its error.
+   """
+   from chemsolve.utils.composition import composition_matrix
+   matrix, errors = composition_matrix(formulas)
+   vector = _monoisotopic_vector()
+   masses = matrix.dot(np.nan_to_num(vector, nan = 0.0))
+   unnatural = np.isnan(vector)[matrix.indices]
+   symbols = get_column('Symbol')
+   for row, column in zip(matrix.row_indices()[unnatural].tolist(),
+                          matrix.indices[unnatural].tolist()):
+      errors.setdefault(row, _no_isotopes_error(symbols[column]))
+   if errors:
+      masses[list(errors)] = np.nan
+   return masses, errors
+
+def isotope_pattern(formula, resolution = 0.01, cutoff = 1e-6):
+   """Computes the isotopic distribution of a formula.
+
+   Examples
+   --------
+   >>> pattern = isotope_pattern('C6H12O6', resolution = 0.5)
+   >>> pattern.masses[:3].round(4), pattern.abundances[:3].round(4)
+   (array([180.0634, 181.0668, 182.068 ]), array([0.9226, 0.0633, 0.0132]))
+
+   Parameters
+   ----------
+   formula: str
+      The chemical formula.
+   resolution: float
+      The mass difference within which peaks are merged into a single
+      peak, by default 0.01. Use 0.5 for a pattern at unit resolution.
+   cutoff: float
+      The probability below which peaks are discarded, by default 1e-6.
+
+   Returns
+   -------
+   An `IsotopePattern` containing arrays of the masses of the peaks of the
+   distribution (in increasing order), and the probability of each peak.
+   """
+   pattern = None
+   for symbol, count in get_species(formula).elements.items():
+      element = _element_pattern(symbol, count, resolution, cutoff)
+      pattern = element if pattern is None else _convolve(pattern, element, resolution, cutoff)
+   return IsotopePattern(pattern.masses.copy(), pattern.abundances.copy())
+
+def isotope_patterns(formulas, resolution = 0.01, cutoff = 1e-6):
+   """Computes the isotopic distributions of a batch of formulas.
+
+   Each distinct formula is only computed once (though every row gets its
+   own copy of the arrays of its distribution), and the distributions of
+   the elements are shared between all of the formulas in the batch.
+
+   Parameters
+   ----------
+   formulas: iterable
+      The chemical formulas, as strings.
+   resolution: float
+      The mass difference within which peaks are merged, by default 0.01.
+   cutoff: float
+      The probability below which peaks are discarded, by default 1e-6.
+
+   Returns
+   -------
+   A tuple containing a list of the `IsotopePattern` of each formula
+   (None for invalid formulas), and a dictionary mapping the row of
+   each invalid formula to its error.
+   """
+   computed, patterns, errors = {}, [], {}
+   for row, formula in enumerate(formulas):
+      try:
+         # Repeated formulas get their own copy of the distribution.
+         pattern = computed[formula]
+         pattern = IsotopePattern(pattern.masses.copy(), pattern.abundances.copy())
+      except (KeyError, TypeError):
+         try:
+            pattern = isotope_pattern(formula, resolution, cutoff)
+         except InvalidCompoundError as e:
+            errors[row], pattern = e, None
+         else:
+            try:
+               computed[formula] = pattern
+            except TypeError:
+               pass
+      patterns.append(pattern)
+   return patterns, errors
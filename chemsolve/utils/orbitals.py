@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import re
+import functools
+
+import numpy as np
+
+from chemsolve.utils.tabledata import lookup_element, atomic_numbers, _table_indexes
+from chemsolve.utils.errors import InvalidElementError
+
+# The subshell letters, in order of their azimuthal quantum number.
+SUBSHELL_LETTERS = 'spdfghi'
+
+# A single token of an electron configuration, either a noble gas
+# core such as `[Ne]` or an occupied subshell such as `3d10`. A subshell
+# holds at most 14 electrons, so configurations without any spaces
+# between their subshells (e.g. `1s22s2`) can still be split apart.
+_CONFIGURATION_TOKEN = re.compile(
+   r'\[(?P<core>[A-Za-z]{1,2})\]'
+   r'|(?P<n>\d)(?P<l>[spdfghiSPDFGHI])(?P<electrons>1[0-4]|\d)')
+
+# Annotations which are ignored, such as `(predicted)`.
+_CONFIGURATION_ANNOTATION = re.compile(r'\([^)]*\)')
+
+def parse_electron_configuration(config):
+   """Parses an electron configuration into its subshell occupancies.
+
+   Noble gas cores are expanded, and the subshells can be in any order
+   and separated by any amount of whitespace (or none at all).
+
+   Examples
+   --------
+   >>> parse_electron_configuration('[Ne]3s2')
+   {(1, 0): 2, (2, 0): 2, (2, 1): 6, (3, 0): 2}
+
+   Parameters
+   ----------
+   config: str
+      The complete or noble gas abbreviated electron configuration.
+
+   Returns
+   -------
+   A dictionary mapping each occupied subshell, as a tuple of its
+   principal and azimuthal quantum numbers, to its number of electrons.
+   """
+   occupancy = {}
+   position = 0
+   stripped = _CONFIGURATION_ANNOTATION.sub(' ', config).strip()
+   for match in _CONFIGURATION_TOKEN.finditer(stripped):
+      if stripped[position:match.start()].strip():
+         break
+      position = match.end()
+      if match.group('core'):
+         try:
+            subshells = _core_occupancy(match.group('core'))
+         except InvalidElementError:
+            break
+      else:
+         subshell = (int(match.group('n')),
+                     SUBSHELL_LETTERS.index(match.group('l').lower()))
+         subshells = {subshell: int(match.group('electrons'))}
+      for subshell, electrons in subshells.items():
+         occupancy[subshell] = occupancy.get(subshell, 0) + electrons
+   else:
+      if not stripped[position:].strip() and occupancy:
+         return occupancy
+   raise ValueError(f"Received invalid electron configuration {config}.")
+
+@functools.lru_cache(maxsize = None)
+def _core_occupancy(symbol):
+   """Returns the subshell occupancies of a noble gas core."""
+   return parse_electron_configuration(
+      lookup_element(symbol).full_electron_configuration)
+
+def configuration_key(config):
+   """Returns a normalized key for an electron configuration.
+
+   Equivalent configurations, whether noble gas abbreviated or complete,
+   with their subshells in any order or with any spacing, have the same key.
+   """
+   occupancy = parse_electron_configuration(config)
+   return tuple(sorted((subshell, electrons) for subshell, electrons
+                       in occupancy.items() if electrons))
+
+@functools.lru_cache(maxsize = None)
+def _configuration_index():
+   """Builds an index from electron configurations to elements.
+
+   Both the exact noble gas and complete configurations from the table
+   and the normalized configuration keys are indexed, so that the exact
+   configurations only need a single lookup.
+   """
+   index = {}
+   for record in sorted(_table_indexes()[2].values(), key = lambda r: r.number):
+      for key in (record.electron_configuration, record.full_electron_configuration,
+                  configuration_key(record.electron_configuration)):
+         index.setdefault(key, record)
+   return index
+
+def find_electron_configuration(config):
+   """Returns the element with a specific electron configuration.
+
+   Parameters
+   ----------
+   config: str
+      The complete or noble gas abbreviated electron configuration.
+
+   Returns
+   -------
+   The `ElementData` record for the element with the configuration.
+   """
+   index = _configuration_index()
+   try:
+      return index.get(config) or index[configuration_key(config)]
+   except (KeyError, ValueError, TypeError):
+      raise ValueError(
+         f"Received invalid electron configuration {config}, not a valid noble gas "
+         f"configuration or complete configuration on the periodic table.")
+
+def _subshell_label(subshell):
+   """Returns the label of a subshell, e.g. `3d` for (3, 2)."""
+   return f"{subshell[0]}{SUBSHELL_LETTERS[subshell[1]]}"
+
+@functools.lru_cache(maxsize = None)
+def _occupancy_table():
+   """Builds the orbital occupancy matrix of every element.
+
+   The matrix has one row for each element, in order of atomic number,
+   and one column for each subshell, in the order in which subshells are
+   filled (by n + l, and then by n). It is built once and is read-only.
+   """
+   records = sorted(_table_indexes()[2].values(), key = lambda r: r.number)
+   occupancies = [parse_electron_configuration(record.full_electron_configuration)
+                  for record in records]
+   subshells = sorted({subshell for occupancy in occupancies for subshell in occupancy},
+                      key = lambda s: (s[0] + s[1], s[0]))
+   matrix = np.array([[occupancy.get(subshell, 0) for subshell in subshells]
+                      for occupancy in occupancies], dtype = np.int64)
+   matrix.flags.writeable = False
+   principal = np.array([subshell[0] for subshell in subshells])
+   capacity = np.array([2 * (2 * subshell[1] + 1) for subshell in subshells])
+   azimuthal = np.array([subshell[1] for subshell in subshells])
+   return (matrix, tuple(_subshell_label(s) for s in subshells),
+           principal, capacity, azimuthal)
+
+def occupancy_matrix():
+   """Returns the orbital occupancy matrix of every element.
+
+   Returns
+   -------
+   A tuple containing the read-only occupancy matrix, with one row for
+   each element (row `i` is the element with atomic number `i + 1`) and
+   one column for each subshell, and the labels of the subshell columns
+   in the order in which they are filled, e.g. ('1s', '2s', '2p', ...).
+   """
+   matrix, labels, _, _, _ = _occupancy_table()
+   return matrix, labels
+
+def valence_electrons(elements):
+   """Returns the number of valence electrons of each of a set of elements.
+
+   The valence electrons are those in the s and p subshells of the
+   outermost shell, as well as the electrons in any partially filled
+   subshells (such as the 3d subshell of iron), so iron has 8 valence
+   electrons but zinc, with a filled 3d subshell, has 2.
+
+   Examples
+   --------
+   >>> valence_electrons(['O', 'Fe', 'Zn'])
+   array([6, 8, 2])
+
+   Parameters
+   ----------
+   elements: iterable
+      The elements, as `Element` objects, symbols, names, or an array
+      of atomic numbers.
+
+   Returns
+   -------
+   An integer array containing the valence electrons of each element.
+   """
+   matrix, _, principal, capacity, azimuthal = _occupancy_table()
+   occupancy = matrix[atomic_numbers(elements) - 1]
+   outermost = np.where(occupancy > 0, principal, 0).max(axis = 1, keepdims = True)
+   valence = ((principal == outermost) & (azimuthal <= 1)) \
+             | ((occupancy > 0) & (occupancy < capacity))
+   return np.where(valence, occupancy, 0).sum(axis = 1)
+
+def unpaired_electrons(elements):
+   """Returns the number of unpaired electrons of each of a set of elements.
+
+   The electrons in each subshell are paired according to Hund's rule, so
+   a subshell with `k` orbitals and `e` electrons has `min(e, 2k - e)`
+   unpaired electrons.
+
+   Examples
+   --------
+   >>> unpaired_electrons(['O', 'Fe', 'Zn'])
+   array([2, 4, 0])
+
+   Parameters
+   ----------
+   elements: iterable
+      The elements, as `Element` objects, symbols, names, or an array
+      of atomic numbers.
+
+   Returns
+   -------
+   An integer array containing the unpaired electrons of each element.
+   """
+   matrix, _, _, capacity, _ = _occupancy_table()
+   occupancy = matrix[atomic_numbers(elements) - 1]
+   return np.minimum(occupancy, capacity - occupancy).sum(axis = 1)
+
+def highest_occupied_subshell(elements):
+   """Returns the highest occupied subshell of each of a set of elements.
+
+   The subshells are ordered by the order in which they are filled, so
+   the highest occupied subshell of iron is 3d rather than 4s.
+
+   Examples
+   --------
+   >>> highest_occupied_subshell(['O', 'Fe', 'Zn'])
+   array(['2p', '3d', '3d'], dtype='<U2')
+
+   Parameters
+   ----------
+   elements: iterable
+      The elements, as `Element` objects, symbols, names, or an array
+      of atomic numbers.
+
+   Returns
+   -------
+   A string array containing the label of each element's subshell.
+   """
+   matrix, labels, _, _, _ = _occupancy_table()
+   occupied = matrix[atomic_numbers(elements) - 1] > 0
+   last = occupied.shape[1] - 1 - np.argmax(occupied[:, ::-1], axis = 1)
+   return np.array(labels)[last]
+
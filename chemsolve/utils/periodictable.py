@@ -1,19 +1,27 @@
 #!/usr/bin/env python3
 # -*- coding = utf-8 -*-
-import os
+import functools
 
 import numpy as np
 import pandas as pd
 
 from chemsolve.utils.errors import InvalidElementError
+from chemsolve.utils.tabledata import pt_path, load_table_data
 
-# Create the path to the periodic table.
-pt_path = os.path.join(os.path.dirname(__file__), "assets", "PT_complete.csv")
+@functools.lru_cache(maxsize = None)
+def _read_periodic_table():
+   """Loads the periodic table data (only once per process)."""
+   return pd.DataFrame(load_table_data())
 
 class PeriodicTable(pd.DataFrame):
-   """A DataFrame containing the periodic table, and information about elements."""
+   """A DataFrame containing the periodic table, and information about elements.
+
+   Every `PeriodicTable` is a private, mutable copy of the table, which is
+   only parsed once per process. The data shared throughout the process
+   is kept in the immutable records of `chemsolve.utils.tabledata`.
+   """
    def __init__(self):
-      super().__init__(pd.read_csv(pt_path))
+      super().__init__(_read_periodic_table().copy())
       pd.set_option("display.max_rows", None, "display.max_columns", None)
 
    def get_properties(self, symbol):
@@ -26,4 +34,24 @@ class PeriodicTable(pd.DataFrame):
       elements = list(self)
       return dict(zip(elements, properties))
 
+def get_periodic_table():
+   """Returns a copy of the periodic table.
+
+   The table data is parsed lazily the first time that this method is
+   called, and only once per process; every call then returns a new,
+   independent copy of it, so modifying the returned table never affects
+   any other table (or the lookups of `Element`, which use the immutable
+   records of `chemsolve.utils.tabledata` instead).
+
+   Examples
+   --------
+   Get the atomic mass of every element.
+
+   >>> table = get_periodic_table()
+   >>> print(table['AtomicMass'])
 
+   Returns
+   -------
+   A new `PeriodicTable`.
+   """
+   return PeriodicTable()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Quantities (moles, grams, and molecules) of batches of chemicals.
+
+`ElementArray` and `CompoundTable` both hold a batch of chemicals as
+NumPy columns, and calculate their quantities in the same way as the
+`Element` and `Compound` classes do, but for the entire batch at once.
+
+The quantity columns are rounded with `np.round` in a single pass. This
+rounds the scaled value (e.g. `value * 10 ** 4`) rather than the exact
+decimal, so an element of a column can differ from the quantity of the
+corresponding object by one unit in its last (rounded) digit, or by one
+unit in the last place of very large values. The objects returned for
+single rows recalculate their quantities from the provided one, so they
+are exactly equal to individually created objects.
+"""
+import numpy as np
+
+from chemsolve.utils.constants import AVOGADRO
+
+__all__ = ['QuantityArray']
+
+# The column holding the values of each kind of provided quantity.
+_QUANTITY_COLUMNS = {'moles': 'mole_amount', 'grams': 'gram_amount',
+                     'molecules': 'molecules'}
+
+class QuantityArray(object):
+   """Base class for batches of chemicals and their quantities.
+
+   Subclasses hold a column identifying each row (`_label_column`), any
+   other columns which are selected along with the rows (`_row_columns`),
+   columns shared by every row (`_shared_columns`), and the `mass` of each
+   row, and create the object of a single row using `_create_item`. The
+   kind of quantity which was provided, if any, is kept in `_quantity`.
+   """
+   _label_column = None
+   _name_column = None
+   _row_columns = ()
+   _shared_columns = ()
+   _noun = None
+   _quantity = None
+
+   @classmethod
+   def _from_columns(cls, source, rows):
+      # Create a batch from the selected rows of an existing batch.
+      array = cls.__new__(cls)
+      array._quantity = source._quantity
+      for column in cls._shared_columns:
+         setattr(array, column, getattr(source, column))
+      for column in (cls._label_column, *cls._row_columns,
+                     'mole_amount', 'gram_amount', 'molecules'):
+         setattr(array, column, getattr(source, column)[rows])
+      return array
+
+   def _create_item(self, label):
+      # Create the object of a single row from its label.
+      raise NotImplementedError
+
+   def _parse_quantities(self, **kwargs):
+      # Calculate the quantity columns from the provided quantity.
+      quantities = [key for key in ("moles", "grams", "molecules") if key in kwargs]
+      if len(quantities) > 1:
+         raise ValueError(f"You cannot provide multiple quantities "
+                          f"of the {self._noun} at a single time.")
+      labels = getattr(self, self._label_column)
+      self._quantity = quantities[0] if quantities else None
+      if not quantities:
+         nan = np.full(len(labels), np.nan)
+         self.mole_amount, self.gram_amount, self.molecules = nan, nan.copy(), nan.copy()
+         return
+
+      values = np.asarray(kwargs[quantities[0]], dtype = float)
+      if values.ndim == 0:
+         values = np.full(len(labels), float(values))
+      if values.shape != labels.shape:
+         raise ValueError(f"Received {len(values)} {quantities[0]} values "
+                          f"for {len(labels)} {self._noun}.")
+
+      mass = self.mass
+      if quantities[0] == "moles":
+         self.mole_amount = values
+         self.gram_amount = np.round(values * mass, 4)
+         self.molecules = np.round(values * AVOGADRO, 4)
+      elif quantities[0] == "grams":
+         self.gram_amount = values
+         self.mole_amount = np.round(values / mass, 4)
+         self.molecules = np.round(self.mole_amount * AVOGADRO, 4)
+      else:
+         self.molecules = values
+         self.mole_amount = np.round(values / AVOGADRO, 4)
+         self.gram_amount = np.round(mass * self.mole_amount)
+
+   def __len__(self):
+      return len(getattr(self, self._label_column))
+
+   def __iter__(self):
+      for indx in range(len(self)):
+         yield self[indx]
+
+   def __getitem__(self, item):
+      # A single index returns a single object, while any slice,
+      # mask, or array of indices returns a new batch.
+      if isinstance(item, (int, np.integer)):
+         chemical = self._create_item(getattr(self, self._label_column)[item])
+         if self._quantity is not None:
+            # Recalculate the quantities from the provided one, so that
+            # they are rounded exactly as those of the object itself.
+            value = getattr(self, _QUANTITY_COLUMNS[self._quantity])[item]
+            if not np.isnan(value):
+               chemical(**{self._quantity: float(value)})
+         elif not np.isnan(self.mole_amount[item]):
+            chemical.mole_amount = float(self.mole_amount[item])
+            chemical.gram_amount = float(self.gram_amount[item])
+            chemical.molecules = float(self.molecules[item])
+         return chemical
+      return self._from_columns(self, item)
+
+   def __call__(self, **kwargs):
+      # Update the quantities of moles, grams, or molecules.
+      self._parse_quantities(**kwargs)
+
+   def __repr__(self):
+      names = getattr(self, self._name_column)[:10].tolist()
+      return f"{type(self).__name__}([{', '.join(names)}" \
+             f"{', ...' if len(self) > 10 else ''}], size = {len(self)})"
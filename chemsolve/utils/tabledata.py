@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+"""Loading (and compiling) the raw periodic table data.
+
+The periodic table is stored as a CSV file, but parsing it on the start
+of every process is comparatively expensive. Instead, the CSV file is
+compiled into a generated Python module, `chemsolve.utils._periodic_data`,
+which is loaded with a regular (bytecode-cached) import and needs neither
+CSV parsing nor pandas. If the compiled module is missing or is out of
+date with the CSV file, the CSV file is parsed directly instead. The
+compiler itself lives in `chemsolve.utils._table_compiler`, which only
+uses the standard library, so that the package build doesn't need NumPy.
+
+The compiled module is rebuilt during the package build, or manually with:
+
+   python -m chemsolve.utils.tabledata
+"""
+import types
+import bisect
+import logging
+import operator
+import functools
+
+import numpy as np
+
+from chemsolve.utils.errors import InvalidElementError
+from chemsolve.utils._table_compiler import pt_path, compiled_path, _csv_digest
+from chemsolve.utils._table_compiler import read_table_csv, compile_periodic_table
+
+@functools.lru_cache(maxsize = None)
+def load_table_data():
+   """Loads the periodic table as a dictionary of column tuples.
+
+   The data is loaded from the compiled periodic table module, unless
+   it is missing or stale, in which case the CSV file is parsed instead.
+   The data is only loaded once per process, and should not be modified.
+   """
+   try:
+      from chemsolve.utils import _periodic_data
+   except ImportError:
+      logging.warning("The compiled periodic table is missing, reading "
+                      "the CSV file instead. Rebuild it using "
+                      "`python -m chemsolve.utils.tabledata`.")
+   else:
+      if _periodic_data.CSV_DIGEST == _csv_digest():
+         return _periodic_data.TABLE_DATA
+      logging.warning("The compiled periodic table is out of date, reading "
+                      "the CSV file instead. Rebuild it using "
+                      "`python -m chemsolve.utils.tabledata`.")
+   return read_table_csv()
+
+@functools.lru_cache(maxsize = None)
+def get_column(column):
+   """Returns a column of the periodic table as a read-only array.
+
+   Row `i` of the array is the element with atomic number `i + 1`, and
+   missing values are NaN. The array is created once and then shared.
+
+   Parameters
+   ----------
+   column: str
+      The name of the column, e.g. 'AtomicMass' or 'Density'.
+
+   Returns
+   -------
+   A read-only NumPy array containing the column's values.
+   """
+   data = load_table_data()
+   try:
+      values = data[column]
+   except KeyError:
+      raise KeyError(f"Received invalid periodic table column {column}, "
+                     f"expected one of {list(data)}.")
+   array = np.array(values, dtype = object if isinstance(values[0], str) else None)
+   array.flags.writeable = False
+   return array
+
+class ElementData(object):
+   """The immutable properties of a single element.
+
+   There is exactly one `ElementData` record for each atomic number, which
+   is shared by every `Element` of that element, so that the properties
+   are stored once rather than being copied into each `Element` object.
+   Records should be retrieved using `lookup_element`.
+   """
+   __slots__ = ('symbol', 'name', 'mass', 'number', 'electron_configuration',
+                'full_electron_configuration', 'radius', 'electronegativity',
+                'ionization', 'electron_affinity', 'properties')
+
+   def __init__(self, properties, full_electron_configuration):
+      for attribute, value in (
+            ('symbol', properties['Symbol']),
+            ('name', properties['Name']),
+            ('mass', properties['AtomicMass']),
+            ('number', properties['AtomicNumber']),
+            ('electron_configuration', properties['ElectronConfiguration']),
+            ('full_electron_configuration', full_electron_configuration),
+            ('radius', properties['AtomicRadius']),
+            ('electronegativity', properties['Electronegativity']),
+            ('ionization', properties['IonizationEnergy']),
+            ('electron_affinity', properties['ElectronAffinity']),
+            ('properties', types.MappingProxyType(properties))):
+         object.__setattr__(self, attribute, value)
+
+   def __setattr__(self, key, value):
+      raise AttributeError("Element data records are read-only.")
+
+   def __delattr__(self, item):
+      raise AttributeError("Element data records are read-only.")
+
+   def __repr__(self):
+      return f"<ElementData ({self.symbol})>"
+
+   def __reduce__(self):
+      # Unpickle to the shared record rather than a new copy.
+      return lookup_element, (self.number,)
+
+@functools.lru_cache(maxsize = None)
+def _table_indexes():
+   """Builds the symbol, name, and atomic number indexes of the table.
+
+   Each of the indexes maps to the same `ElementData` record. Symbols and
+   names are indexed in lowercase.
+   """
+   data = load_table_data()
+   records = []
+   full_configurations = {}
+   for row in zip(*data.values()):
+      properties = dict(zip(data, row))
+      # Expand the noble gas core, which always precedes the element.
+      configuration = properties['ElectronConfiguration']
+      if configuration[0] == "[":
+         configuration = full_configurations[configuration[1:3]] \
+                         + " " + configuration[4:]
+      full_configurations[properties['Symbol']] = configuration
+      records.append(ElementData(properties, configuration))
+   return ({record.symbol.lower(): record for record in records},
+           {record.name.lower(): record for record in records},
+           {record.number: record for record in records})
+
+def lookup_element(key):
+   """Returns the row of the periodic table for a specific element.
+
+   Examples
+   --------
+   Each of these returns the properties of calcium.
+
+   >>> lookup_element('Ca')
+   >>> lookup_element('calcium')
+   >>> lookup_element(20)
+
+   Parameters
+   ----------
+   key: str or int
+      The element's symbol or name (both case-insensitive), or its
+      atomic number.
+
+   Returns
+   -------
+   The `ElementData` record containing the element's properties.
+   """
+   by_symbol, by_name, by_number = _table_indexes()
+   if isinstance(key, str):
+      lowered = key.lower()
+      record = by_symbol.get(lowered) or by_name.get(lowered)
+   elif not isinstance(key, bool) and hasattr(key, '__index__'):
+      record = by_number.get(operator.index(key))
+   else:
+      raise InvalidElementError(key, property_type = "type")
+   if record is None:
+      raise InvalidElementError(key)
+   return record
+
+def atomic_numbers(elements):
+   """Converts a collection of elements into an array of atomic numbers.
+
+   Parameters
+   ----------
+   elements: iterable
+      The elements, as `Element` objects, symbols, names, or atomic
+      numbers (including an integer array of atomic numbers).
+
+   Returns
+   -------
+   An integer array containing the atomic number of each element.
+   """
+   if isinstance(elements, np.ndarray) and elements.dtype.kind in 'iu':
+      numbers = elements.astype(np.int64).ravel()
+      if numbers.size and (numbers.min() < 1 or numbers.max() > len(_table_indexes()[2])):
+         raise InvalidElementError(
+            "Received an atomic number outside of the periodic table.",
+            property_type = "bypass")
+      return numbers
+
+   # Each distinct key only needs to be looked up once.
+   cache = {}
+   numbers = []
+   for element in elements:
+      if isinstance(getattr(element, '_data', None), ElementData):
+         numbers.append(element._data.number)
+         continue
+      try:
+         number = cache[element]
+      except KeyError:
+         number = cache[element] = lookup_element(element).number
+      except TypeError:
+         number = lookup_element(element).number
+      numbers.append(number)
+   return np.array(numbers, dtype = np.int64)
+
+@functools.lru_cache(maxsize = None)
+def _molar_mass_index():
+   """Builds an index of the element records sorted by atomic mass."""
+   records = sorted(_table_indexes()[2].values(), key = lambda r: r.mass)
+   return ([record.mass for record in records], records,
+           np.array([record.mass for record in records]),
+           np.array([record.number for record in records]))
+
+def find_molar_mass(mass, tolerance = 0.05):
+   """Returns the elements with an atomic mass close to a molar mass.
+
+   Parameters
+   ----------
+   mass: float
+      The molar mass which you want to find elements for.
+   tolerance: float
+      The maximum difference between `mass` and an element's atomic mass.
+
+   Returns
+   -------
+   A list of the `ElementData` records within `tolerance` of `mass`,
+   sorted from the closest atomic mass to the furthest one.
+   """
+   masses, records, _, _ = _molar_mass_index()
+   lower = bisect.bisect_left(masses, mass - tolerance)
+   upper = bisect.bisect_right(masses, mass + tolerance)
+   return sorted(records[lower:upper], key = lambda r: abs(r.mass - mass))
+
+def match_molar_masses(masses, tolerance = 0.05):
+   """Finds the closest element to each of an array of molar masses.
+
+   Parameters
+   ----------
+   masses: array_like
+      The molar masses which you want to find elements for.
+   tolerance: float
+      The maximum difference between a mass and an element's atomic mass.
+
+   Returns
+   -------
+   An integer array containing the atomic number of the closest element
+   to each of the masses, or zero where no element is within `tolerance`.
+   """
+   _, _, sorted_masses, sorted_numbers = _molar_mass_index()
+   masses = np.asarray(masses, dtype = float)
+
+   # Compare each mass against its neighbours in the sorted index.
+   upper = np.clip(np.searchsorted(sorted_masses, masses), 0, len(sorted_masses) - 1)
+   lower = np.clip(upper - 1, 0, len(sorted_masses) - 1)
+   closest = np.where(np.abs(sorted_masses[lower] - masses)
+                      <= np.abs(sorted_masses[upper] - masses), lower, upper)
+
+   # Discard any matches which are outside of the tolerance.
+   numbers = sorted_numbers[closest]
+   numbers[~(np.abs(sorted_masses[closest] - masses) <= tolerance)] = 0
+   return numbers
+
+if __name__ == '__main__':
+   compile_periodic_table()
+
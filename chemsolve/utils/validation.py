@@ -4,7 +4,7 @@ import inspect
 import functools
 
 from chemsolve.element import Element
-from chemsolve.utils.periodictable import PeriodicTable
+from chemsolve.utils.tabledata import lookup_element
 from chemsolve.utils.errors import InvalidElementError
 from chemsolve.utils import constants
 
@@ -56,7 +56,11 @@ def is_valid_element(element):
       return True
 
    # Otherwise, check whether it is in the periodic table.
-   return element in [item for item in PeriodicTable()['Symbol']]
+   try:
+      lookup_element(element)
+   except InvalidElementError:
+      return False
+   return True
 
 def maybe_elements(*elements):
    """Validation method to check whether provided arguments are
@@ -3,7 +3,6 @@
 import inspect
 import logging
 import functools
-import pkg_resources
 import collections.abc
 
 # Get the next major version.
@@ -41,16 +40,17 @@ def ChemsolveDeprecationWarning(deprecated_object = None, future_version = next_
    ... def chemsolve_method(param):
    ...   return param
 
-   For deprecating a class parameter, `ChemsolveDeprecationWarning`
-   should be used in the class's `__getattribute__` method.
+   For deprecating a class attribute, `ChemsolveDeprecationWarning`
+   should be called from a property which replaces the attribute.
 
    >>> class ChemsolveClass:
-   ...   def __getattribute__(self, item):
-   ...      if item == "deprecated_parameter":
-   ...         ChemsolveDeprecationWarning(
-   ...            "The parameter `deprecated_parameter` is "
-   ...            "deprecated and will be removed following "
-   ...            "version X.", future_version = 'bypass')
+   ...   @property
+   ...   def deprecated_parameter(self):
+   ...      ChemsolveDeprecationWarning(
+   ...         "The parameter `deprecated_parameter` is "
+   ...         "deprecated and will be removed following "
+   ...         "version X.", future_version = 'bypass')
+   ...      return self._parameter
 
    Parameters
    ----------
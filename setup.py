@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding = utf-8 -*-
 import os
+import importlib.util
 from setuptools import setup
 from setuptools import find_packages
+from setuptools.command.build_py import build_py
 
 # Get the long README description.
 with open(os.path.join(
@@ -22,6 +24,19 @@ def configure_chemsolve_version():
       return ".".join(str(item) for item in __version__[:3]) + f"-{end_tag}"
    return ".".join(str(item) for item in __version__)
 
+class BuildPyWithPeriodicTable(build_py):
+   """Compiles the periodic table data before building the package."""
+   def run(self):
+      # Load the compiler directly from its file, since importing it from
+      # the package would also import the package's dependencies (e.g.
+      # NumPy), which aren't installed in isolated build environments.
+      spec = importlib.util.spec_from_file_location('_table_compiler', os.path.join(
+         os.path.dirname(os.path.abspath(__file__)), 'chemsolve', 'utils', '_table_compiler.py'))
+      compiler = importlib.util.module_from_spec(spec)
+      spec.loader.exec_module(compiler)
+      compiler.compile_periodic_table()
+      super().run()
+
 setup(
    name = 'chemsolve',
    version = configure_chemsolve_version(),
@@ -38,5 +53,9 @@ setup(
       "License :: OSI Approved :: MIT License",
       "Operating System :: OS Independent"
    ],
-   include_package_data = True
+   include_package_data = True,
+   entry_points = {
+      'console_scripts': ['chemsolve-batch = chemsolve.batch:main']
+   },
+   cmdclass = {'build_py': BuildPyWithPeriodicTable}
 )
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import random
+import unittest
+
+from chemsolve import Compound, Reaction
+from chemsolve.utils.balance import balance_stoichiometry, integer_nullspace
+from chemsolve.utils.errors import InvalidReactionError
+
+REACTIONS = [
+   (['CH4', 'O2'], ['CO2', 'H2O']),
+   (['C8H18', 'O2'], ['CO2', 'H2O']),
+   (['HSiCl3', 'H2O'], ['H10Si10O15', 'HCl']),
+   (['KOH', 'H3PO4'], ['K3PO4', 'H2O']),
+   (['CuSCN', 'KIO3', 'HCl'], ['CuSO4', 'KCl', 'HCN', 'ICl', 'H2O']),
+   (['K4Fe(CN)6', 'KMnO4', 'H2SO4'], ['KHSO4', 'Fe2(SO4)3', 'MnSO4', 'HNO3', 'CO2', 'H2O']),
+   (['Ca3(PO4)2', 'SiO2', 'C'], ['CaSiO3', 'P4', 'CO']),
+   (['C6H12O6', 'O2'], ['CO2', 'H2O']),
+   (['Al', 'O2'], ['Al2O3']),
+   (['NH3', 'O2'], ['NO', 'H2O']),
+   (['FeS2', 'O2'], ['Fe2O3', 'SO2']),
+   (['Cu', 'HNO3'], ['Cu(NO3)2', 'NO', 'H2O']),
+   (['MnO4-1', 'Fe+2', 'H+'], ['Mn+2', 'Fe+3', 'H2O']),
+   (['Cr2O7-2', 'H+', 'I-'], ['Cr+3', 'I2', 'H2O']),
+]
+
+POOL = ['H2', 'O2', 'C', 'H2O', 'H2O2', 'CO', 'CO2', 'CH4', 'C2H6', 'C2H4', 'C2H2', 'C3H8',
+        'CH3OH', 'C2H5OH', 'HCOOH', 'CH3COOH', 'C6H12O6', 'C8H18', 'C3H6O', 'C12H22O11']
+
+def chempy_balance(reactants, products):
+   """Balances a reaction with chempy, or returns None if chempy cannot balance it."""
+   from chempy import balance_stoichiometry as chempy_balance_stoichiometry
+   try:
+      balanced = chempy_balance_stoichiometry(set(reactants), set(products), underdetermined = False)
+   except Exception:
+      return None
+   if any(coefficient <= 0 for side in balanced for coefficient in side.values()):
+      return None
+   return tuple({species: int(coefficient) for species, coefficient in side.items()}
+                for side in balanced)
+
+class BalanceTest(unittest.TestCase):
+   """Tests for balancing reactions."""
+   def test_known_reactions(self):
+      """Ensure that known reactions are balanced as they are by chempy."""
+      for reactants, products in REACTIONS:
+         balanced = balance_stoichiometry(reactants, products)
+         self.assertEqual(tuple(dict(side) for side in balanced), chempy_balance(reactants, products))
+         self.assertEqual(list(balanced[0]), reactants)
+         self.assertTrue(all(type(coefficient) is int for side in balanced for coefficient in side.values()))
+
+   def test_random_reactions(self):
+      """Ensure that random reactions are balanced (or rejected) as they are by chempy."""
+      rng = random.Random(0)
+      balanced_count = 0
+      for _ in range(40):
+         # Try every split of the species into reactants and products.
+         species = rng.sample(POOL, 4)
+         for mask in range(1, 8):
+            reactants = [formula for indx, formula in enumerate(species) if mask >> indx & 1]
+            products = [formula for indx, formula in enumerate(species) if not mask >> indx & 1]
+            expected = chempy_balance(reactants, products)
+            if expected is None:
+               with self.assertRaises(InvalidReactionError):
+                  balance_stoichiometry(reactants, products)
+            else:
+               balanced_count += 1
+               self.assertEqual(tuple(dict(side) for side in balance_stoichiometry(reactants, products)),
+                                expected)
+      self.assertGreater(balanced_count, 10)
+
+   def test_invalid_reactions(self):
+      """Test the errors for reactions which cannot be balanced."""
+      for reactants, products in [(['Fe', 'O2'], ['FeO', 'Fe2O3']), (['H2O'], ['H2O2']),
+                                  (['H2', 'O2', 'N2'], ['H2O']), (['H2', 'O2'], ['H2O', 'O2']),
+                                  (['H2O'], ['H2', 'O2', 'H2O2']), (['H2O', 'H2'], ['O2']),
+                                  (['H2', 'OH'], ['HO', 'H2O']), (['CH3CH3', 'O2'], ['C2H6', 'CO2'])]:
+         with self.assertRaises(InvalidReactionError):
+            balance_stoichiometry(reactants, products)
+      self.assertEqual(integer_nullspace([[1, 2], [2, 4]]), [[-2, 1]])
+      self.assertEqual(integer_nullspace([], columns = 2), [[1, 0], [0, 1]])
+
+   def test_reaction(self):
+      """Test balancing the reactions of the `Reaction` class."""
+      reaction = Reaction(reactants = [Compound('KOH', grams = 36.7), Compound('H3PO4', grams = 112.7)],
+                          products = [Compound('K3PO4'), Compound('H2O')], lim_calc = True)
+      self.assertEqual(reaction.balanced, ({'H3PO4': 1, 'KOH': 3}, {'H2O': 3, 'K3PO4': 1}))
+      self.assertEqual(reaction.coefficient_sum, 8)
+      self.assertEqual(repr(reaction.limiting_reactant), 'KOH')
+      with self.assertRaises(InvalidReactionError):
+         Reaction(reactants = [Compound('Fe'), Compound('O2')],
+                  products = [Compound('FeO'), Compound('Fe2O3')])
+
+if __name__ == '__main__':
+   unittest.main()
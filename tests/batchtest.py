@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import os
+import json
+import unittest
+import tempfile
+import concurrent.futures
+from unittest import mock
+
+from chemsolve import Compound
+from chemsolve.batch import process_chunk, main
+
+class BatchTest(unittest.TestCase):
+   """Tests for the streaming batch command."""
+   def test_chunk_matches_compounds(self):
+      """Ensure that a chunk is computed in the same way as compounds."""
+      rows = [{'formula': 'H2O', 'grams': '18.0'}, {'formula': 'C6H12O6', 'moles': 2},
+              {'formula': 'NaCl', 'molecules': 1e23}, {'formula': 'Pb(NO3)2'}]
+      output = process_chunk(rows)
+      for row, result in zip(rows, output):
+         kwargs = {key: float(value) for key, value in row.items() if key != 'formula'}
+         compound = Compound(row['formula'], **kwargs)
+         self.assertIsNone(result['error'])
+         self.assertEqual(result['mass'], compound.mass)
+         self.assertEqual(result['composition'], compound.compound_elements)
+         if kwargs:
+            # The quantities may only differ in their last digit.
+            for column in ['mole_amount', 'gram_amount', 'molecules']:
+               self.assertAlmostEqual(result[column], getattr(compound, column),
+                                      delta = max(1e-4, abs(getattr(compound, column)) * 1e-15))
+      self.assertIsNone(output[3]['mole_amount'])
+
+   def test_invalid_rows(self):
+      """Ensure that invalid rows are reported without stopping the chunk."""
+      output = process_chunk([{'formula': 'Xx'}, {'formula': 'H2O', 'grams': 'a'},
+                              {'formula': 'H2O', 'grams': 1, 'moles': 1}, {},
+                              {'formula': 'CO2', 'grams': 44.0}])
+      self.assertEqual([row['error'] is None for row in output], [False] * 4 + [True])
+      self.assertIsNone(output[0]['mass'])
+      self.assertEqual(output[4]['mole_amount'], 0.9998)
+
+   def test_command(self):
+      """Test the command on CSV and JSONL files, using a process pool."""
+      formulas = ['H2O', 'CO2', 'C6H12O6', 'NaCl', 'Xx', 'CuSO4·5H2O'] * 5
+      with tempfile.TemporaryDirectory() as directory:
+         source = os.path.join(directory, 'input.csv')
+         with open(source, 'w', encoding = 'utf-8') as f:
+            f.write('formula,grams\n' + ''.join(f'{formula},1.5\n' for formula in formulas))
+         for options in [[], ['--chunk-size', '4', '--processes', '2']]:
+            target = os.path.join(directory, 'output.jsonl')
+            self.assertEqual(main([source, '-o', target, *options]), 0)
+            with open(target, encoding = 'utf-8') as f:
+               rows = [json.loads(line) for line in f]
+            self.assertEqual([row['formula'] for row in rows], formulas)
+            self.assertEqual(rows[1]['gram_amount'], 1.5)
+            self.assertIsNotNone(rows[4]['error'])
+
+         # Convert the JSONL output back into CSV.
+         target = os.path.join(directory, 'output.csv')
+         main([os.path.join(directory, 'output.jsonl'), '-o', target])
+         with open(target, encoding = 'utf-8') as f:
+            lines = f.read().splitlines()
+         self.assertEqual(lines[0], 'formula,mass,mole_amount,gram_amount,molecules,composition,error')
+         self.assertEqual(len(lines), len(formulas) + 1)
+
+   def test_command_error_with_processes(self):
+      """Ensure that an error while streaming with a process pool is raised unchanged."""
+      shutdown = concurrent.futures.ProcessPoolExecutor.shutdown
+      def python38_shutdown(executor, wait = True):
+         # The signature of `shutdown` before Python 3.9 (without `cancel_futures`).
+         return shutdown(executor, wait)
+      with tempfile.TemporaryDirectory() as directory:
+         source = os.path.join(directory, 'input.jsonl')
+         with open(source, 'w', encoding = 'utf-8') as f:
+            f.write('{"formula": "H2O", "grams": 1}\n' * 20 + 'invalid\n')
+         with mock.patch.object(concurrent.futures.ProcessPoolExecutor, 'shutdown', python38_shutdown):
+            for processes in ['2', '3']:
+               with self.assertRaises(json.JSONDecodeError):
+                  main([source, '-o', os.path.join(directory, 'output.jsonl'),
+                        '--chunk-size', '2', '--processes', processes])
+
+if __name__ == '__main__':
+   unittest.main()
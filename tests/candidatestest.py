@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import unittest
+
+import numpy as np
+
+from chemsolve import Compound
+from chemsolve.utils.candidates import candidate_formulas, rdbe
+from chemsolve.utils.composition import _mass_vector
+
+class CandidateTest(unittest.TestCase):
+   """Tests for enumerating the candidate formulas of a molar mass."""
+   def test_matches_exhaustive_search(self):
+      """Ensure that the pruned search finds every formula within the tolerance."""
+      masses = _mass_vector()[[5, 0, 6, 7]]
+      counts = np.stack(np.meshgrid(np.arange(22), np.arange(252), np.arange(19),
+                                    np.arange(17), indexing = 'ij'), axis = -1).reshape(-1, 4)
+      counts = counts[counts.any(axis = 1) & (np.abs(counts @ masses - 250.3) <= 0.05)]
+      expected = {''.join(f"{symbol}{count if count != 1 else ''}" for symbol, count
+                          in zip('CHNO', row) if count) for row in counts.tolist()}
+      candidates = candidate_formulas(250.3, tolerance = 0.05, elements = 'CHNO')
+      self.assertEqual({candidate.formula for candidate in candidates}, expected)
+      self.assertEqual(len(candidates), len(expected))
+      errors = [abs(candidate.error) for candidate in candidates]
+      self.assertEqual(errors, sorted(errors))
+
+   def test_element_bounds(self):
+      """Test the minimum and maximum counts of the elements."""
+      candidates = candidate_formulas(180.16, elements = {'C': (6, 6), 'H': 12, 'O': None})
+      self.assertEqual([candidate.formula for candidate in candidates], ['C6H12O6'])
+      self.assertEqual(candidate_formulas(18.015, tolerance = 0.01, elements = ['H', 'O'])[0].formula, 'H2O')
+      with self.assertRaises(ValueError):
+         candidate_formulas(100.0, elements = {'C': (5, 2)})
+
+   def test_rdbe_filter(self):
+      """Test filtering the candidates by their double bond equivalents."""
+      np.testing.assert_array_equal(rdbe([[6, 6], [2, 6], [1, 3]], ['C', 'H']), [4, 0, 0.5])
+      candidates = candidate_formulas(180.16, elements = 'CHO', rdbe_range = (0, 10))
+      self.assertTrue(all(0 <= candidate.rdbe <= 10 and float(candidate.rdbe).is_integer()
+                          for candidate in candidates))
+      self.assertIn('C6H12O6', [candidate.formula for candidate in candidates])
+      with self.assertRaises(ValueError):
+         candidate_formulas(100.0, elements = 'CHU', rdbe_range = (0, 10))
+
+   def test_compound_from_molar_mass(self):
+      """Test creating compounds from a molar mass."""
+      self.assertEqual(repr(Compound.from_molar_mass(180.156, tolerance = 0.01, elements = 'CHO')),
+                       'C6H12O6')
+      self.assertGreater(len(Compound.from_molar_mass(500.4, tolerance = 0.01, all_matches = True)), 1)
+      with self.assertRaises(ValueError):
+         Compound.from_molar_mass(0.5)
+
+if __name__ == '__main__':
+   unittest.main()
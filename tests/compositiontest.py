@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import unittest
+
+import numpy as np
+
+from chemsolve import Compound
+from chemsolve.utils.composition import composition_matrix, molar_masses
+from chemsolve.utils.errors import InvalidCompoundError
+
+class CompositionTest(unittest.TestCase):
+   """Tests for batch computations over formula compositions."""
+   def test_composition_matrix(self):
+      """Test the sparse composition matrix of a batch of formulas."""
+      matrix, errors = composition_matrix(['H2O', 'Pb(NO3)2', 'H2O'])
+      self.assertEqual(errors, {})
+      self.assertEqual(matrix.shape, (3, 118))
+      dense = matrix.toarray()
+      self.assertEqual(dense[0, [0, 7]].tolist(), [2, 1])
+      self.assertEqual(dense[1, [6, 7, 81]].tolist(), [2, 6, 1])
+      self.assertEqual(dense.sum(axis = 1).tolist(), [3, 9, 3])
+      np.testing.assert_array_equal(dense[0], dense[2])
+
+   def test_batch_masses_match_compounds(self):
+      """Ensure that the batch masses are the same as the compound masses."""
+      formulas = ['H2O', 'CO2', 'C6H12O6', 'Pb(NO3)2', 'CuSO4·5H2O', 'K4[Fe(CN)6]']
+      masses, errors = molar_masses(formulas)
+      self.assertEqual(errors, {})
+      np.testing.assert_allclose(masses, [Compound(formula).mass for formula in formulas])
+      np.testing.assert_allclose(Compound.molar_masses(np.array(formulas))[0], masses)
+
+   def test_invalid_rows(self):
+      """Ensure that invalid formulas are reported per row."""
+      masses, errors = molar_masses(['H2O', 'Xx2', None, '(CO2', 'NaCl'])
+      self.assertEqual(sorted(errors), [1, 2, 3])
+      for error in errors.values():
+         self.assertIsInstance(error, InvalidCompoundError)
+      self.assertEqual(np.isnan(masses).tolist(), [False, True, True, True, False])
+      self.assertAlmostEqual(masses[4], 58.44277, places = 4)
+
+   def test_empty_batch(self):
+      """Test that an empty batch returns no masses."""
+      masses, errors = molar_masses([])
+      self.assertEqual((len(masses), errors), (0, {}))
+
+if __name__ == '__main__':
+   unittest.main()
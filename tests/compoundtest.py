@@ -3,8 +3,11 @@
 import unittest
 import logging
 
+import numpy as np
+
 from chemsolve import Element
-from chemsolve import Compound, Water
+from chemsolve import Compound, CompoundTable, Water
+from chemsolve.utils.errors import InvalidCompoundError
 
 class CompoundTest(unittest.TestCase):
    """Various assorted tests for the compound class."""
@@ -19,6 +22,39 @@ class CompoundTest(unittest.TestCase):
       # Deprecated attribute.
       self.assertEqual(str(lead_nitrate.print_compound), 'Pb(NO3)2')
 
+   def test_lazy_attributes(self):
+      """Test that the derived attributes are only created when accessed."""
+      glucose = Compound("C6H12O6")
+      self.assertFalse(hasattr(glucose, '__dict__'))
+      self.assertFalse(hasattr(glucose, '_elements'))
+      self.assertFalse(hasattr(glucose, '_substance'))
+      self.assertEqual(glucose.compound_elements, {'C': 6, 'H': 12, 'O': 6})
+      self.assertIs(glucose.compound_elements, glucose.compound_elements)
+      self.assertEqual(glucose.compound_elements_list, ['C', 'H', 'O'])
+      self.assertEqual(str(glucose.print_compound), 'C6H12O6')
+      self.assertIs(glucose.print_compound, glucose.print_compound)
+      self.assertNotIn('__getattribute__', vars(Compound))
+      # The quantities and public attributes still work with slots.
+      water = Water(grams = 18.0)
+      self.assertEqual((water.store_comp, water.geometry), ('H2O', 'bent'))
+      self.assertIsNone(glucose.mole_amount)
+      self.assertIs(water._species, Compound('H2O')._species)
+
+   def test_mass_fractions(self):
+      """Test the precomputed mass fractions and composition report."""
+      glucose = Compound("C6H12O6")
+      self.assertAlmostEqual(sum(glucose.mass_fractions.values()), 1.0)
+      self.assertEqual(glucose.percent_in_compound('C'), 0.4)
+      self.assertEqual(glucose.percent_in_compound(Element('O')), 0.5329)
+      self.assertEqual(glucose.percent_in_compound('h'), glucose.percent_in_compound('H'))
+      self.assertIsNone(glucose.percent_in_compound('Fe'))
+      report = glucose.composition_report()
+      self.assertEqual(list(report), ['C', 'H', 'O'])
+      self.assertEqual(report['H']['count'], 12)
+      self.assertAlmostEqual(sum(item['mass'] for item in report.values()), glucose.mass)
+      for element, item in report.items():
+         self.assertEqual(item['percent'], glucose.percent_in_compound(element))
+
    def test_mole_gram_initialization(self):
       """Ensure that the mole/gram calculations on initialization are correct."""
       # Construct the compound.
@@ -67,6 +103,16 @@ class CompoundTest(unittest.TestCase):
       self.assertEqual(str(compound.empirical), 'C₅NH₅')
       self.assertAlmostEqual(compound.mass, 240, places = -1)
 
+   def test_equality_and_hashing(self):
+      """Test comparing and hashing compounds by their canonical keys."""
+      ethane = Compound('C2H6')
+      self.assertEqual(ethane, Compound('CH3CH3', grams = 3.0))
+      self.assertEqual(hash(ethane), hash(Compound('H6C2')))
+      self.assertNotEqual(ethane, Compound('C2H4'))
+      self.assertNotEqual(ethane, 'C2H6')
+      self.assertEqual(len({ethane, Compound('CH3CH3'), Water(), Compound('H2O')}), 2)
+      self.assertEqual({ethane: 1}[Compound('H6C2')], 1)
+
    def test_special_compounds(self):
       """Test the special pre-built compounds."""
       # Construct the water compound.
@@ -74,5 +120,69 @@ class CompoundTest(unittest.TestCase):
       self.assertEqual(repr(water), 'H2O')
       self.assertAlmostEqual(water.mass, 18.01, places = 1)
 
+class CompoundTableTest(unittest.TestCase):
+   """Tests for the columnar table of compounds."""
+   def setUp(self):
+      self.formulas = ['H2O', 'C6H12O6', 'NaCl', 'CO2', 'Pb(NO3)2']
+      self.table = CompoundTable(self.formulas, grams = [2.0, 1.5, 3.0, 4.0, 5.0])
+
+   def test_columns_match_compounds(self):
+      """Ensure that the columns are the same as those of each compound."""
+      for indx, formula in enumerate(self.formulas):
+         compound = Compound(formula, grams = self.table['gram_amount'][indx])
+         self.assertEqual(self.table['mass'][indx], compound.mass)
+         self.assertEqual(self.table['mole_amount'][indx], compound.mole_amount)
+         self.assertEqual(self.table['molecules'][indx], compound.molecules)
+         for element, count in compound.compound_elements.items():
+            self.assertEqual(self.table[element][indx], count)
+      self.assertEqual(self.table.composition.shape, (5, len(self.table.elements)))
+      np.testing.assert_allclose(self.table.mass_fractions.sum(axis = 1), 1.0)
+      self.assertAlmostEqual(self.table['percent_O'][0], 15.9994 / 18.01528)
+      np.testing.assert_array_equal(self.table['Fe'], 0)
+
+   def test_quantity_rounding(self):
+      """Ensure that the quantities are rounded as those of compounds."""
+      rng = np.random.default_rng(0)
+      formulas = [f"C{c}H{h}O{o}" for c, h, o in rng.integers(1, 30, size = (300, 3)).tolist()]
+      for quantity, values in [('grams', rng.uniform(0, 1000, size = 300)),
+                               ('moles', rng.uniform(0, 100, size = 300)),
+                               ('molecules', rng.uniform(0, 1e26, size = 300))]:
+         table = CompoundTable(formulas, **{quantity: values})
+         for indx, (formula, value) in enumerate(zip(formulas, values.tolist())):
+            compound = Compound(formula, **{quantity: value})
+            converted = table[indx]
+            with self.subTest(quantity = quantity, formula = formula):
+               self.assertEqual(table['mass'][indx], compound.mass)
+               # The columns may differ in their last digit, but not the compounds.
+               for column in ['mole_amount', 'gram_amount', 'molecules']:
+                  self.assertEqual(getattr(converted, column), getattr(compound, column))
+                  self.assertAlmostEqual(table[column][indx], getattr(compound, column),
+                                         delta = max(1e-4, abs(getattr(compound, column)) * 1e-15))
+
+   def test_filtering_and_sorting(self):
+      """Test filtering and sorting the table by its columns."""
+      self.assertEqual(self.table.with_elements('C', 'O').formulas.tolist(), ['C6H12O6', 'CO2'])
+      self.assertEqual(self.table.without_elements('O', 'Fe').formulas.tolist(), ['NaCl'])
+      self.assertEqual(len(self.table.with_elements('O', Element('Fe'))), 0)
+      self.assertEqual(self.table[self.table['mass'] > 50].formulas.tolist(),
+                       ['C6H12O6', 'NaCl', 'Pb(NO3)2'])
+      self.assertEqual(self.table.sort('mass', descending = True).formulas.tolist(),
+                       ['Pb(NO3)2', 'C6H12O6', 'NaCl', 'CO2', 'H2O'])
+      self.assertEqual(self.table.sort(['O', 'formula']).formulas.tolist(),
+                       ['NaCl', 'H2O', 'CO2', 'C6H12O6', 'Pb(NO3)2'])
+      with self.assertRaises(KeyError):
+         self.table.sort('density')
+
+   def test_conversion_to_and_from_compounds(self):
+      """Test converting the table to and from compounds."""
+      compounds = self.table.to_compounds()
+      self.assertEqual([repr(compound) for compound in compounds], self.formulas)
+      self.assertEqual(compounds[0].gram_amount, 2.0)
+      table = CompoundTable.from_compounds([Compound('H2O', moles = 2.0), Compound('NaCl')])
+      self.assertEqual(table['mole_amount'][0], 2.0)
+      self.assertTrue(np.isnan(table['mole_amount'][1]))
+      with self.assertRaises(InvalidCompoundError):
+         CompoundTable(['H2O', 'Xx2'])
+
 if __name__ == '__main__':
    unittest.main()
@@ -2,7 +2,10 @@
 # -*- coding = utf-8 -*-
 import unittest
 
-from chemsolve import Element
+import numpy as np
+
+from chemsolve import Element, ElementArray
+from chemsolve import InvalidElementError
 
 class ElementTest(unittest.TestCase):
    """Various assorted tests for the element class."""
@@ -16,6 +19,28 @@ class ElementTest(unittest.TestCase):
       self.assertEqual(oxygen.element_name, 'Oxygen')
       self.assertEqual(oxygen.element_symbol, 'O')
 
+   def test_element_initialization_keys(self):
+      """Test that the element can be initialized from its symbol, name, or number."""
+      for key in ['Ca', 'ca', 'CA', 'Calcium', 'calcium', 20]:
+         calcium = Element(key)
+         self.assertEqual(calcium.element_symbol, 'Ca')
+         self.assertEqual(calcium.number, 20)
+      # Invalid keys should still raise an error.
+      for key in ['Xy', 'calciu', 0, 119, 20.0, None]:
+         with self.assertRaises(InvalidElementError):
+            Element(key)
+
+   def test_shared_element_data(self):
+      """Ensure that elements share their properties, but not their quantities."""
+      first, second = Element('Fe', moles = 1.0), Element('iron', grams = 2.0)
+      self.assertIs(first._data, second._data)
+      self.assertNotEqual(first.mole_amount, second.mole_amount)
+      self.assertEqual(first.full_electron_configuration,
+                       '1s2 2s2 2p6 3s2 3p6 4s2 3d6')
+      # The shared properties cannot be modified.
+      with self.assertRaises(AttributeError):
+         first.mass = 1.0
+
    def test_mole_gram_initialization(self):
       """Ensure that the mole/gram calculations on initialization are correct."""
       # Construct the element.
@@ -29,10 +54,64 @@ class ElementTest(unittest.TestCase):
       self.assertAlmostEqual(boron.mole_amount, 2.7752, places = 2)
       self.assertEqual(boron.gram_amount, 30.0)
 
+   def test_molar_mass(self):
+      """Test the initialization of elements from their molar masses."""
+      # Construct an element from its molar mass.
+      self.assertEqual(repr(Element.from_molar_mass(10.8)), 'B')
+      self.assertEqual([repr(e) for e in Element.from_molar_mass(
+         294.21, tolerance = 0.01, all_matches = True)], ['Ts', 'Og'])
+      with self.assertRaises(ValueError):
+         Element.from_molar_mass(50.0)
+      # Construct multiple elements at once.
+      elements = Element.from_molar_masses([1.01, 50.0, 15.99, 63.5])
+      self.assertEqual([repr(e) for e in elements], ['H', 'None', 'O', 'Cu'])
+
+   def test_element_array(self):
+      """Test that element arrays calculate the same quantities as elements."""
+      # Construct the element array and the equivalent elements.
+      symbols, grams = ['B', 'Ca', 'B', 'Fe'], [30.0, 2.0, 1.5, 0.7]
+      array = ElementArray(symbols, grams = grams)
+      elements = [Element(s, grams = g) for s, g in zip(symbols, grams)]
+      # Ensure that the calculated values are the same.
+      for element, converted in zip(elements, array.to_elements()):
+         self.assertEqual(repr(element), repr(converted))
+         self.assertEqual(element.mole_amount, converted.mole_amount)
+         self.assertEqual(element.molecules, converted.molecules)
+      # Check slicing and masking.
+      self.assertEqual(len(array[1:]), 3)
+      boron = array[array.symbols == 'B']
+      self.assertEqual(boron.gram_amount.tolist(), [30.0, 1.5])
+      with self.assertRaises(ValueError):
+         ElementArray(symbols, grams = grams, moles = grams)
+
+   def test_element_array_rounding(self):
+      """Ensure that element arrays round their quantities as elements do."""
+      rng = np.random.default_rng(0)
+      numbers = rng.integers(1, 119, size = 500)
+      for quantity, values in [('grams', rng.uniform(0, 1000, size = 500)),
+                               ('moles', rng.uniform(0, 100, size = 500)),
+                               ('molecules', rng.uniform(0, 1e26, size = 500))]:
+         array = ElementArray(numbers, **{quantity: values})
+         for indx, (number, value) in enumerate(zip(numbers.tolist(), values.tolist())):
+            element = Element(number, **{quantity: value})
+            converted = array[indx]
+            with self.subTest(quantity = quantity, element = repr(element)):
+               # The columns may differ in their last digit, but not the elements.
+               for column in ['mole_amount', 'gram_amount', 'molecules']:
+                  self.assertEqual(getattr(converted, column), getattr(element, column))
+                  self.assertAlmostEqual(getattr(array, column)[indx], getattr(element, column),
+                                         delta = max(1e-4, abs(getattr(element, column)) * 1e-15))
+
    def test_electron_configuration(self):
       """Test the initialization of an Element from its electron configuration."""
       # Construct the element.
       magnesium = Element.from_electron_configuration('[Ne]3s2')
       # Ensure that it is correct.
       self.assertEqual(str(magnesium), "Magnesium")
+      # Equivalent configurations should give the same element.
+      for config in ['1s2 2s2 2p6 3s2', '1s22s22p63s2', '3s2  2p6 1s2 2s2', '3s2 [Ne]']:
+         self.assertEqual(str(Element.from_electron_configuration(config)), "Magnesium")
+      self.assertEqual(repr(Element.from_electron_configuration('[Ar]4s2 3d6')), 'Fe')
+      with self.assertRaises(ValueError):
+         Element.from_electron_configuration('[Ne]3s3')
 
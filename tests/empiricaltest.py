@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import unittest
+
+import numpy as np
+
+from chemsolve import Element, Compound
+from chemsolve.utils.from_formula import solve_empirical, empirical_formulas, molecular_formulas
+from chemsolve.utils.from_formula import determine_empirical_coef
+
+class EmpiricalTest(unittest.TestCase):
+   """Tests for the empirical formula solver."""
+   def test_solve_empirical(self):
+      """Test finding the integer subscripts of mole ratios."""
+      subscripts, errors = solve_empirical([[4.757, 6.111, 0.6797, 1.699],
+                                            [1.0, 1.333, 0.0, np.nan]])
+      self.assertEqual(errors, {})
+      self.assertEqual(subscripts.tolist(), [[14, 18, 2, 5], [3, 4, 0, 0]])
+
+   def test_bounded_search(self):
+      """Ensure that noisy samples fail within the maximum subscript."""
+      subscripts, errors = solve_empirical([[1.0, 2.333], [1.0, 1.0], [0.0, 0.0]],
+                                           max_subscript = 2)
+      self.assertEqual(sorted(errors), [0, 2])
+      self.assertEqual(subscripts.tolist(), [[0, 0], [1, 1], [0, 0]])
+      # A tighter tolerance needs a larger multiplier.
+      self.assertEqual(solve_empirical([[1.0, 1.4142]], tolerance = 0.1)[0].tolist(), [[5, 7]])
+      self.assertEqual(solve_empirical([[1.0, 1.4142]], tolerance = 0.01)[0].tolist(), [[70, 99]])
+
+   def test_empirical_formulas(self):
+      """Test determining the empirical formulas of many samples at once."""
+      formulas, errors = empirical_formulas(
+         [[0.5714, 0.0616, 0.0952, 0.2718], [0.7595, 0.0633, 0.1772, 0.0]],
+         ['C', 'H', 'N', 'O'])
+      self.assertEqual((formulas, errors), (['C14H18N2O5', 'C5H5N'], {}))
+      formulas, errors = empirical_formulas([[2.0, 3.0], [1.0, 0.0]], ['Fe', 'O'], basis = 'moles')
+      self.assertEqual(formulas, ['Fe2O3', 'Fe'])
+      formulas, _ = empirical_formulas([[55.845 * 2, 15.999 * 3]], [Element('Fe'), 'oxygen'],
+                                       basis = 'grams')
+      self.assertEqual(formulas, ['Fe2O3'])
+      with self.assertRaises(ValueError):
+         empirical_formulas([[1.0]], ['C', 'H'])
+
+   def test_molecular_formulas(self):
+      """Test determining the molecular formulas of many samples at once."""
+      amounts = [[0.7595, 0.1772, 0.0633]] * 4
+      empirical, molecular, errors = molecular_formulas(
+         amounts, ['C', 'N', 'H'], molar_masses = [240, np.nan, 100, 79.1])
+      self.assertEqual(empirical, ['C5NH5'] * 4)
+      self.assertEqual(molecular, ['C15N3H15', None, None, 'C5NH5'])
+      self.assertEqual(list(errors), [2])
+      self.assertEqual(molecular_formulas(amounts[:1], ['C', 'N', 'H'])[1], [None])
+      # The batch formulas are the same as the individual compounds.
+      compound = Compound.from_formula(Element('C', percent = 0.7595), Element('N', percent = 0.1772),
+                                       Element('H', percent = 0.0633), mass = 240, molecular = True)
+      self.assertEqual(Compound.from_formulas(amounts[:1], ['C', 'N', 'H'], [240])[1],
+                       [repr(compound)])
+      # Elements following a group of equal coefficients are kept.
+      compound = Compound.from_formula(*[Element(symbol, moles = moles) for symbol, moles
+                                         in zip(['C', 'H', 'N', 'O'], [4, 3, 3, 5])])
+      self.assertEqual(compound.mass, Compound('C4H3N3O5').mass)
+
+   def test_element_coefficients(self):
+      """Test the coefficients from elements with percents or grams."""
+      elements = [Element('C', percent = 0.7595), Element('N', percent = 0.1772),
+                  Element('H', percent = 0.0633)]
+      self.assertEqual(determine_empirical_coef(elements), [5, 1, 5])
+      elements = [Element('C', grams = 12.011), Element('O', grams = 31.998)]
+      self.assertEqual(determine_empirical_coef(elements), [1, 2])
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import unittest
+import threading
+from unittest import mock
+
+from chemsolve import Compound
+from chemsolve.utils import formula
+from chemsolve.utils.formula import parse_formula, formula_mass, render_formula
+from chemsolve.utils.formula import SpeciesCache, species_cache
+from chemsolve.utils.formula import hill_order, canonical_key, canonical_keys
+from chemsolve.utils.errors import InvalidCompoundError
+
+class FormulaTest(unittest.TestCase):
+   """Tests for the chemical formula parser."""
+   def test_simple_formulas(self):
+      """Test parsing formulas without any groups."""
+      self.assertEqual(parse_formula('H2O').elements, {'H': 2, 'O': 1})
+      self.assertEqual(parse_formula('C6H12O6').elements, {'C': 6, 'H': 12, 'O': 6})
+      self.assertEqual(parse_formula('H2O2').elements, {'H': 2, 'O': 2})
+      self.assertEqual(parse_formula('C14H18N2O5').elements,
+                       {'C': 14, 'H': 18, 'N': 2, 'O': 5})
+
+   def test_nested_groups(self):
+      """Test parsing formulas with (nested) groups."""
+      self.assertEqual(parse_formula('Pb(NO3)2').elements, {'Pb': 1, 'N': 2, 'O': 6})
+      self.assertEqual(parse_formula('(CH3)3COH').elements, {'C': 4, 'H': 10, 'O': 1})
+      self.assertEqual(parse_formula('K4[Fe(CN)6]').elements,
+                       {'K': 4, 'Fe': 1, 'C': 6, 'N': 6})
+      self.assertEqual(parse_formula('Ca3(PO4)2').elements, {'Ca': 3, 'P': 2, 'O': 8})
+
+   def test_hydrates(self):
+      """Test parsing hydrates and other adducts."""
+      for formula in ['CuSO4·5H2O', 'CuSO4*5H2O', 'CuSO4.5H2O']:
+         with self.subTest(formula = formula):
+            self.assertEqual(parse_formula(formula).elements,
+                             {'Cu': 1, 'S': 1, 'O': 9, 'H': 10})
+
+   def test_charges_and_states(self):
+      """Test parsing the charge and state of a formula."""
+      for formula, charge in [('SO4^2-', -2), ('SO4-2', -2), ('Fe^{3+}', 3),
+                              ('Na+', 1), ('NO3^-', -1), ('Fe3^+', 1), ('H2O', 0)]:
+         with self.subTest(formula = formula):
+            self.assertEqual(parse_formula(formula).charge, charge)
+      parsed = parse_formula('SO4^2-(aq)')
+      self.assertEqual((parsed.formula, parsed.elements, parsed.charge, parsed.state),
+                       ('SO4', {'S': 1, 'O': 4}, -2, 'aq'))
+      self.assertEqual(parse_formula('NaCl(s)').state, 's')
+
+   def test_ambiguous_charges(self):
+      """Ensure that a sign directly after a count is rejected rather than guessed."""
+      for formula in ['Fe3+', 'Cu2+', 'SO42-', 'NO3-', '(NH4)2+', 'NO3-(aq)']:
+         with self.subTest(formula = formula):
+            with self.assertRaisesRegex(InvalidCompoundError, 'ambiguous charge'):
+               parse_formula(formula)
+      for formula, parsed in [('Fe^3+', ('Fe', 3)), ('Cu+2', ('Cu', 2)), ('SO4^2-', ('SO4', -2)),
+                              ('NO3-1', ('NO3', -1)), ('Fe3^+', ('Fe3', 1))]:
+         with self.subTest(formula = formula):
+            self.assertEqual((parse_formula(formula).formula, parse_formula(formula).charge), parsed)
+
+   def test_invalid_formulas(self):
+      """Ensure that invalid formulas raise an error."""
+      for formula in ['', 'h2o', 'Xx2', 'H2O)', '(H2O', '()', 'H0', 'H2O·', 'H2$']:
+         with self.subTest(formula = formula):
+            with self.assertRaises(InvalidCompoundError):
+               parse_formula(formula)
+      with self.assertRaises(InvalidCompoundError):
+         Compound('Xx2')
+
+   def test_mass_and_rendering(self):
+      """Test the mass and unicode rendering of parsed formulas."""
+      self.assertAlmostEqual(formula_mass(parse_formula('Pb(NO3)2').elements), 331.2098, places = 3)
+      self.assertAlmostEqual(formula_mass(parse_formula('CuSO4·5H2O').elements), 249.685, places = 2)
+      self.assertEqual(render_formula(parse_formula('CuSO4·5H2O')), 'CuSO₄·5H₂O')
+      self.assertEqual(render_formula(parse_formula('SO4^2-(aq)')), 'SO₄²⁻(aq)')
+
+   def test_canonical_keys(self):
+      """Test the canonical Hill order keys of formulas."""
+      self.assertEqual(hill_order(['O', 'H', 'C', 'Br']), ['C', 'H', 'Br', 'O'])
+      self.assertEqual(hill_order(['O', 'H', 'Na']), ['H', 'Na', 'O'])
+      for formula in ['C2H6', 'H6C2', 'CH3CH3']:
+         with self.subTest(formula = formula):
+            self.assertEqual(canonical_key(formula), 'C2H6')
+      self.assertEqual(canonical_key('CuSO4·5H2O'), 'CuH10O9S')
+      self.assertEqual(canonical_key('SO4^2-(aq)'), 'O4S^2-(aq)')
+      self.assertNotEqual(canonical_key('Fe^{3+}'), canonical_key('Fe+2'))
+      keys, errors = canonical_keys(['C2H6', 'H6C2', 'CH3CH3', 'H2O', 'Xx', None])
+      self.assertEqual(keys, ['C2H6', 'C2H6', 'C2H6', 'H2O', None, None])
+      self.assertEqual(sorted(errors), [4, 5])
+
+   def test_compound_from_parsed_formula(self):
+      """Test that compounds are built from the parsed formula."""
+      hydrate = Compound('CuSO4·5H2O')
+      self.assertEqual(hydrate.compound_elements, {'Cu': 1, 'S': 1, 'O': 9, 'H': 10})
+      self.assertEqual(repr(hydrate), 'CuSO4·5H2O')
+      self.assertIn('Cu', hydrate)
+      self.assertEqual(Compound('Ca3(PO4)2').moles_in_compound('O'), 8)
+
+class SpeciesCacheTest(unittest.TestCase):
+   """Tests for the cache of parsed species."""
+   def setUp(self):
+      species_cache.clear()
+
+   def test_compound_construction_hits_cache(self):
+      """Ensure that constructing a compound again does not parse its formula."""
+      Compound('H2O')
+      with mock.patch.object(formula, 'parse_formula',
+                             side_effect = AssertionError("The formula was parsed.")):
+         water = Compound('H2O', grams = 18.0)
+      self.assertAlmostEqual(water.mass, 18.01528, places = 4)
+      self.assertEqual(water.compound_elements, {'H': 2, 'O': 1})
+      self.assertEqual(species_cache.cache_info()[:2], (1, 1))
+
+   def test_species_are_immutable(self):
+      """Ensure that the cached species cannot be modified through compounds."""
+      water = Compound('H2O')
+      water.compound_elements['H'] = 4
+      species = species_cache.get('H2O')
+      self.assertEqual(dict(species.elements), {'H': 2, 'O': 1})
+      with self.assertRaises(TypeError):
+         species.elements['H'] = 4
+
+   def test_eviction_and_resizing(self):
+      """Test that the least recently used species are evicted."""
+      cache = SpeciesCache(maxsize = 2)
+      cache.get('H2O'); cache.get('CO2'); cache.get('H2O'); cache.get('NaCl')
+      self.assertIn('H2O', cache)
+      self.assertNotIn('CO2', cache)
+      self.assertEqual(cache.cache_info(), (1, 3, 2, 2))
+      cache.maxsize = 1
+      self.assertEqual(len(cache), 1)
+      self.assertIn('NaCl', cache)
+      cache.clear()
+      self.assertEqual(cache.cache_info(), (0, 0, 1, 0))
+      with self.assertRaises(ValueError):
+         cache.maxsize = -1
+
+   def test_invalid_formulas_are_not_cached(self):
+      """Ensure that invalid formulas raise errors and are not cached."""
+      with self.assertRaises(InvalidCompoundError):
+         species_cache.get('Xx2')
+      with self.assertRaises(InvalidCompoundError):
+         species_cache.get(['H2O'])
+      self.assertEqual(len(species_cache), 0)
+
+   def test_thread_safety(self):
+      """Test that the cache can be shared between threads."""
+      cache = SpeciesCache(maxsize = 8)
+      formulas = ['H2O', 'CO2', 'NaCl', 'C6H12O6', 'Pb(NO3)2'] * 200
+      def worker():
+         for compound in formulas:
+            self.assertEqual(cache.get(compound).formula, compound)
+      threads = [threading.Thread(target = worker) for _ in range(8)]
+      for thread in threads:
+         thread.start()
+      for thread in threads:
+         thread.join()
+      info = cache.cache_info()
+      self.assertEqual(info.hits + info.misses, len(formulas) * 8)
+      self.assertEqual(info.currsize, 5)
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import sys
+import unittest
+import subprocess
+
+# The maximum cumulative time for `import chemsolve`, in seconds. This is
+# deliberately generous, since importing any of the heavy dependencies
+# would take several times longer than this on its own.
+IMPORT_TIME_BUDGET = 0.15
+
+# Third-party dependencies which should not be imported with the package.
+HEAVY_DEPENDENCIES = ['pandas', 'numpy', 'sympy', 'chempy', 'periodictable', 'pyparsing']
+
+def run_python(code, *options):
+   """Runs code in a fresh interpreter and returns its output and errors."""
+   process = subprocess.run([sys.executable, *options, '-c', code],
+                            capture_output = True, text = True, check = True)
+   return process.stdout, process.stderr
+
+class ImportTest(unittest.TestCase):
+   """Tests for the cost of importing the package."""
+   def test_no_heavy_dependencies(self):
+      """Ensure that importing the package does not import heavy dependencies."""
+      output, _ = run_python(
+         f"import sys, chemsolve; print([m for m in {HEAVY_DEPENDENCIES!r} "
+         f"if m in sys.modules])")
+      self.assertEqual(output.strip(), '[]')
+
+   def test_import_time_budget(self):
+      """Ensure that a cold import of the package is within its time budget."""
+      _, errors = run_python("import chemsolve", "-X", "importtime")
+      # The last line of the import times is the package's cumulative time.
+      cumulative = [line for line in errors.splitlines()
+                    if line.rstrip().endswith('| chemsolve')][0]
+      import_time = int(cumulative.split('|')[1]) / 1e6
+      self.assertLess(import_time, IMPORT_TIME_BUDGET)
+
+   def test_lazy_attributes(self):
+      """Test that the lazily imported names are still available."""
+      output, _ = run_python(
+         "import chemsolve; from chemsolve import Element, Compound, Reaction, molarity; "
+         "print(chemsolve.Element('O').number, 'Compound' in dir(chemsolve))")
+      self.assertEqual(output.strip(), '8 True')
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import unittest
+import itertools
+
+import numpy as np
+
+from chemsolve import Compound
+from chemsolve.utils.isotopes import monoisotopic_mass, monoisotopic_masses
+from chemsolve.utils.isotopes import isotope_pattern, isotope_patterns, _isotopes
+from chemsolve.utils.errors import InvalidCompoundError
+
+class IsotopeTest(unittest.TestCase):
+   """Tests for monoisotopic masses and isotopic distributions."""
+   def test_monoisotopic_mass(self):
+      """Test the monoisotopic masses of single and batches of formulas."""
+      self.assertAlmostEqual(monoisotopic_mass('H2O'), 18.010565, places = 5)
+      self.assertAlmostEqual(Compound('C6H12O6').monoisotopic_mass, 180.063388, places = 5)
+      masses, errors = monoisotopic_masses(['H2O', 'C6H12O6', 'TcO4', 'Xx'])
+      np.testing.assert_allclose(masses[:2], [monoisotopic_mass('H2O'), monoisotopic_mass('C6H12O6')])
+      self.assertEqual(sorted(errors), [2, 3])
+      with self.assertRaises(InvalidCompoundError):
+         monoisotopic_mass('TcO4')
+
+   def test_pattern_matches_enumeration(self):
+      """Ensure that the distribution is the same as enumerating every isotope."""
+      isotopes = _isotopes()
+      atoms = ['C', 'H', 'H', 'Cl', 'Cl']
+      peaks = {}
+      for combination in itertools.product(*[range(len(isotopes[atom].masses)) for atom in atoms]):
+         mass = sum(isotopes[atom].masses[indx] for atom, indx in zip(atoms, combination))
+         abundance = np.prod([isotopes[atom].abundances[indx] for atom, indx in zip(atoms, combination)])
+         peaks[round(mass, 6)] = peaks.get(round(mass, 6), 0) + abundance
+      pattern = isotope_pattern('CH2Cl2', resolution = 1e-6, cutoff = 0)
+      np.testing.assert_allclose(pattern.masses, sorted(peaks))
+      np.testing.assert_allclose(pattern.abundances, [peaks[mass] for mass in sorted(peaks)])
+      self.assertAlmostEqual(pattern.abundances.sum(), 1.0)
+
+   def test_pattern_resolution_and_cutoff(self):
+      """Test merging peaks by resolution and discarding improbable peaks."""
+      fine = isotope_pattern('C6H12O6', resolution = 0.001, cutoff = 0)
+      unit = isotope_pattern('C6H12O6', resolution = 0.5, cutoff = 0)
+      self.assertGreater(len(fine.masses), len(unit.masses))
+      self.assertTrue(np.all(np.diff(unit.masses) > 0.5))
+      self.assertAlmostEqual(unit.abundances.sum(), 1.0)
+      self.assertAlmostEqual(unit.masses[0], monoisotopic_mass('C6H12O6'))
+      self.assertTrue(np.all(isotope_pattern('C6H12O6', cutoff = 1e-3).abundances >= 1e-3))
+
+   def test_large_formula(self):
+      """Test the distribution of a large formula (its timing is in `benchmarks/`)."""
+      pattern = isotope_pattern('C200H300N50O60S2', resolution = 0.5, cutoff = 1e-5)
+      self.assertAlmostEqual(pattern.abundances.sum(), 1.0, places = 2)
+      self.assertAlmostEqual(pattern.masses[0], monoisotopic_mass('C200H300N50O60S2'))
+
+   def test_batch_patterns(self):
+      """Test computing the distributions of a batch of formulas."""
+      patterns, errors = Compound.isotope_patterns(['H2O', 'CO2', 'H2O', 'Tc', ['x']])
+      self.assertEqual(sorted(errors), [3, 4])
+      np.testing.assert_allclose(patterns[1].abundances, isotope_pattern('CO2').abundances)
+      np.testing.assert_array_equal(patterns[0].masses, patterns[2].masses)
+      # Each row has an independent copy of its distribution.
+      patterns[0].abundances[:] = 0
+      np.testing.assert_array_equal(patterns[2].abundances, isotope_pattern('H2O').abundances)
+
+   def test_batch_errors(self):
+      """Test the per-row errors of a batch, and its resolution and cutoff."""
+      formulas = ['Tc', 'C6H12O6', 'Xx', 'Tc', ['x'], 'C6H12O6']
+      patterns, errors = isotope_patterns(formulas, resolution = 0.5, cutoff = 1e-3)
+      # Every invalid row (including repeated ones) has its own error.
+      self.assertEqual(sorted(errors), [0, 2, 3, 4])
+      self.assertTrue(all(isinstance(error, InvalidCompoundError) for error in errors.values()))
+      self.assertEqual([pattern is None for pattern in patterns], [True, False, True, True, True, False])
+      expected = isotope_pattern('C6H12O6', resolution = 0.5, cutoff = 1e-3)
+      for pattern in [patterns[1], patterns[5]]:
+         np.testing.assert_array_equal(pattern.masses, expected.masses)
+         np.testing.assert_array_equal(pattern.abundances, expected.abundances)
+      self.assertLess(len(expected.masses), len(isotope_pattern('C6H12O6').masses))
+      self.assertEqual(isotope_patterns([]), ([], {}))
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import unittest
+
+import numpy as np
+
+from chemsolve import Element
+from chemsolve.utils.orbitals import (
+   occupancy_matrix, valence_electrons,
+   unpaired_electrons, highest_occupied_subshell
+)
+
+class OrbitalTest(unittest.TestCase):
+   """Various assorted tests for the orbital occupancy queries."""
+   def test_occupancy_matrix(self):
+      """Test that the occupancy matrix contains every electron of every element."""
+      matrix, subshells = occupancy_matrix()
+      self.assertEqual(matrix.shape, (118, len(subshells)))
+      self.assertEqual(subshells[:6], ('1s', '2s', '2p', '3s', '3p', '4s'))
+      np.testing.assert_array_equal(matrix.sum(axis = 1), np.arange(1, 119))
+      # The matrix is shared, so it should not be modifiable.
+      with self.assertRaises(ValueError):
+         matrix[0, 0] = 0
+
+   def test_vectorized_queries(self):
+      """Test the valence, unpaired, and highest subshell queries."""
+      elements = ['O', 'iron', 30, Element('Cr')]
+      np.testing.assert_array_equal(valence_electrons(elements), [6, 8, 2, 6])
+      np.testing.assert_array_equal(unpaired_electrons(elements), [2, 4, 0, 6])
+      np.testing.assert_array_equal(
+         highest_occupied_subshell(elements), ['2p', '3d', '3d', '3d'])
+      # Arrays of atomic numbers can also be used directly.
+      np.testing.assert_array_equal(
+         valence_electrons(np.array([1, 2, 11, 17])), [1, 2, 1, 7])
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import os
+import sys
+import unittest
+import tempfile
+import subprocess
+
+import pandas as pd
+
+from chemsolve import Element
+from chemsolve.utils import tabledata
+from chemsolve.utils import _periodic_data
+from chemsolve.utils import _table_compiler
+from chemsolve.utils import periodictable
+from chemsolve.utils.periodictable import PeriodicTable, get_periodic_table
+
+class PeriodicTableTest(unittest.TestCase):
+   """Various assorted tests for the periodic table."""
+   def test_periodic_table(self):
+      """Test that the periodic table data is only parsed once."""
+      # Get the table twice.
+      table = get_periodic_table()
+      self.assertIsNot(table, get_periodic_table())
+      self.assertEqual(periodictable._read_periodic_table.cache_info().currsize, 1)
+      pd.testing.assert_frame_equal(table, get_periodic_table())
+      # Check that the table contains every element.
+      self.assertEqual(len(table), 118)
+      self.assertEqual(table.get_properties('O')['Name'], 'Oxygen')
+
+   def test_tables_are_independent(self):
+      """Ensure that modifying a table never affects any other table, or elements."""
+      def assign_column(table): table['Symbol'] = None
+      def assign_columns(table): table.columns = range(table.shape[1])
+      def assign_index(table): table.index = range(1, 119)
+      def assign_loc(table): table.loc[0, 'Symbol'] = 'X'
+      def assign_iloc(table): table.iloc[0, 0] = 0
+      def assign_at(table): table.at[0, 'AtomicMass'] = 0.0
+      def fill(table): table.fillna({'Electronegativity': 0.0}, inplace = True)
+      def drop(table): table.drop(0, inplace = True)
+      def rename(table): table.rename(columns = {'Symbol': 'S'}, inplace = True)
+      def insert(table): table.insert(0, 'X', 0)
+      def delete(table): del table['Name']
+      expected = get_periodic_table()
+      for mutate in [assign_column, assign_columns, assign_index, assign_loc, assign_iloc,
+                     assign_at, fill, drop, rename, insert, delete]:
+         with self.subTest(mutation = mutate.__name__):
+            table = get_periodic_table()
+            mutate(table)
+            for other in [get_periodic_table(), PeriodicTable()]:
+               pd.testing.assert_frame_equal(other, expected)
+            self.assertEqual(Element('H').mass, 1.008)
+            self.assertEqual(tabledata.lookup_element('H').properties['Symbol'], 'H')
+
+   def test_compiled_table(self):
+      """Test that the compiled periodic table is up to date with the CSV file."""
+      self.assertEqual(_periodic_data.CSV_DIGEST, tabledata._csv_digest())
+      # The compiled data should be identical to the data parsed by pandas.
+      pd.testing.assert_frame_equal(
+         pd.DataFrame(_periodic_data.TABLE_DATA),
+         pd.read_csv(tabledata.pt_path), check_exact = True)
+
+   def test_compiler_without_dependencies(self):
+      """Ensure that the table compiles (as in the package build) without NumPy or pandas."""
+      with tempfile.TemporaryDirectory() as directory:
+         out_path = os.path.join(directory, '_periodic_data.py')
+         script = ("import sys, importlib.util; sys.modules['numpy'] = sys.modules['pandas'] = None; "
+                   "spec = importlib.util.spec_from_file_location('_table_compiler', sys.argv[1]); "
+                   "compiler = importlib.util.module_from_spec(spec); spec.loader.exec_module(compiler); "
+                   "compiler.compile_periodic_table(out_path = sys.argv[2])")
+         subprocess.run([sys.executable, '-c', script, _table_compiler.__file__, out_path], check = True)
+         with open(out_path, encoding = 'utf-8') as f, \
+               open(_table_compiler.compiled_path, encoding = 'utf-8') as g:
+            self.assertEqual(f.read(), g.read())
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import sys
+import pickle
+import unittest
+import subprocess
+
+from chemsolve import Element, Compound, Reaction, Water
+from chemsolve.utils.formula import get_species
+
+class PickleTest(unittest.TestCase):
+   """Tests for pickling compounds, elements, and reactions."""
+   def roundtrip(self, obj):
+      return pickle.loads(pickle.dumps(obj, protocol = pickle.HIGHEST_PROTOCOL))
+
+   def test_compounds(self):
+      """Test that compounds pickle as their formulas and quantities."""
+      compound = self.roundtrip(Compound('Pb(NO3)2', grams = 3.0))
+      self.assertEqual((repr(compound), compound.gram_amount, compound.mole_amount),
+                       ('Pb(NO3)2', 3.0, Compound('Pb(NO3)2', grams = 3.0).mole_amount))
+      self.assertIs(compound._species, get_species('Pb(NO3)2'))
+      self.assertFalse(hasattr(compound, '_substance'))
+      self.assertIsNone(self.roundtrip(Compound('H2O')).mole_amount)
+      self.assertEqual(self.roundtrip(Water(moles = 2.0)).geometry, 'bent')
+      self.assertLess(len(pickle.dumps(Compound('C6H12O6', moles = 1.0))), 120)
+      self.assertEqual(self.roundtrip(get_species('SO4^2-(aq)')).key, 'O4S^2-(aq)')
+
+   def test_elements(self):
+      """Test that elements pickle as their atomic number and quantities."""
+      element = self.roundtrip(Element('Fe', grams = 55.845))
+      self.assertEqual((element.element_symbol, element.gram_amount), ('Fe', 55.845))
+      self.assertIs(element._data, Element('Fe')._data)
+
+   def test_reactions(self):
+      """Test that reactions are unpickled without being rebalanced."""
+      reaction = Reaction(reactants = [Compound('CH4', grams = 16.0), Compound('O2', grams = 10.0)],
+                          products = [Compound('CO2'), Compound('H2O')], lim_calc = True)
+      code = ("import sys, pickle; reaction = pickle.loads(sys.stdin.buffer.read()); "
+              "print(reaction.balanced_reaction, repr(reaction.limiting_reactant), "
+              "[m for m in ['chempy', 'sympy'] if m in sys.modules])")
+      process = subprocess.run([sys.executable, '-c', code], input = pickle.dumps(reaction),
+                               capture_output = True, check = True)
+      self.assertEqual(process.stdout.decode().strip(), f"{reaction.balanced_reaction} O2 []".strip())
+      self.assertEqual(self.roundtrip(reaction).coefficient_sum, reaction.coefficient_sum)
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding = utf-8 -*-
+import unittest
+
+from chemsolve import Element
+from chemsolve.ranking import rank_elements, rank_electronegativity, rank_atomic_radius
+
+class RankingTest(unittest.TestCase):
+   """Various assorted tests for the element rankings."""
+   def test_rank_provided_elements(self):
+      """Test that the provided elements are ranked correctly."""
+      ranked = rank_electronegativity(Element("Ca"), "K", "Br", "O")
+      self.assertEqual([repr(element) for element in ranked], ['K', 'Ca', 'Br', 'O'])
+      ranked = rank_atomic_radius("Ca", "K", "Br", "O")
+      self.assertEqual([repr(element) for element in ranked], ['O', 'Br', 'Ca', 'K'])
+
+   def test_rank_elements(self):
+      """Test the column-based ranking of the periodic table."""
+      # Get the densest elements.
+      symbols, values = rank_elements(
+         by = 'Density', descending = True, top = 3, return_values = True)
+      self.assertEqual(symbols.tolist(), ['Os', 'Ir', 'Pt'])
+      self.assertEqual(values.tolist(), sorted(values.tolist(), reverse = True))
+      # Check the missing value policies.
+      elements = ['F', 'He', 'Ne', 'O']
+      self.assertEqual(rank_elements(elements, by = 'electronegativity').tolist(),
+                       ['O', 'F', 'He', 'Ne'])
+      self.assertEqual(rank_elements(elements, by = 'electronegativity',
+                                     missing = 'drop').tolist(), ['O', 'F'])
+      with self.assertRaises(ValueError):
+         rank_elements(elements, by = 'electronegativity', missing = 'raise')
+      with self.assertRaises(ValueError):
+         rank_elements(elements, by = 'Symbol')
+
+if __name__ == '__main__':
+   unittest.main()
@@ -1,5 +1,11 @@
 from chemsolve import Compound, Reaction
 
+# A formula listed twice on one side is still separated from the next compound.
+reaction = Reaction(reactants = [Compound("H2"), Compound("O2"), Compound("H2")], products = [Compound("H2O")])
+assert reaction.original_reaction == "H₂ + O₂ + H₂ --> H₂O ", reaction.original_reaction
+reaction = Reaction(Compound("H2"), Compound("O2"), Compound("H2"), "-->", Compound("H2O"), Compound("H2O"))
+assert reaction.original_reaction == "H₂ + O₂ + H₂ --> H₂O + H₂O ", reaction.original_reaction
+
 r1 = Compound("HSiCl3")
 r2 = Compound("H2O")
 p1 = Compound("H10Si10O15")